@@ -1,11 +1,21 @@
-from flask import Flask, render_template, request, redirect, url_for
+import time
+
+# Início do carregamento do módulo, usado para medir o cold start do modo production
+_import_started = time.perf_counter()
+
+from flask import Flask, request, redirect, url_for
+
+from render_cache import RenderCache
 
 app = Flask(__name__)
 
+# As páginas não mudam entre requisições: o HTML é renderizado uma vez por template e contexto
+page_cache = RenderCache(app)
+
 @app.route('/')
 def index():
     """Página inicial com link para o formulário."""
-    return render_template('index.html')
+    return page_cache.response('index.html')
 
 @app.route('/formulario', methods=['GET', 'POST'])
 def formulario():
@@ -16,20 +26,46 @@ def formulario():
 
         # Validação simples: verifica se os campos não estão vazios
         if not nome:
-            return render_template('formulario.html', erro='O campo nome é obrigatório.')
+            return page_cache.response('formulario.html', erro='O campo nome é obrigatório.')
         if not email:
-            return render_template('formulario.html', erro='O campo email é obrigatório.')
+            return page_cache.response('formulario.html', erro='O campo email é obrigatório.')
         
         # Se tudo estiver OK, redireciona para a página de sucesso
         return redirect(url_for('sucesso'))
 
-    return render_template('formulario.html', erro=None)
+    return page_cache.response('formulario.html', erro=None)
 
 @app.route('/sucesso')
 def sucesso():
     """Página exibida após o envio bem-sucedido do formulário."""
-    return render_template('sucesso.html')
+    return page_cache.response('sucesso.html')
+
+def run_production(server_config):
+    """Servidor WSGI sem debug, com pool de threads, processos e backlog configuráveis."""
+    from wsgi_server import PooledWSGIServer, precompile_templates, serve_forever
+
+    templates = precompile_templates(app)
+    server = PooledWSGIServer(
+        server_config.HOST,
+        server_config.PORT,
+        app,
+        threads=server_config.THREADS,
+        backlog=server_config.BACKLOG,
+    )
+    cold_start_ms = (time.perf_counter() - _import_started) * 1000
+    print(
+        f"Aplicação pronta em http://{server_config.HOST}:{server.port} em {cold_start_ms:.0f} ms "
+        f"(production: {server_config.WORKERS} processo(s), {server_config.THREADS} threads, "
+        f"backlog {server_config.BACKLOG}, {templates} templates compilados)",
+        flush=True,
+    )
+    serve_forever(server, server_config.WORKERS)
 
 if __name__ == '__main__':
-    # Roda a aplicação em modo de debug
-    app.run(debug=True, port=5001)
\ No newline at end of file
+    from config.server import server_config
+
+    if server_config.MODE == 'production':
+        run_production(server_config)
+    else:
+        # Modo de desenvolvimento: servidor de debug do Flask (instâncias criadas pelos testes desativam o debug)
+        app.run(debug=server_config.DEBUG, host=server_config.HOST, port=server_config.PORT)
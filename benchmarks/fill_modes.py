@@ -0,0 +1,65 @@
+"""
+Compara os modos de preenchimento de formulário ("fast" x "fidelity") com os textos
+longos da DataFactory (nome com 1000 caracteres e email com mais de 500).
+
+Uso:
+    python -m benchmarks.fill_modes --browser chrome --headless --trials 5
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from config.settings import config
+from pages.form_page import FormPage
+from utils.app_server import EmbeddedAppServer
+from utils.data_factory import DataFactory
+from utils.driver_factory import DriverFactory
+from utils.driver_resolver import DriverResolver
+
+MODES = ("fidelity", "fast")
+
+
+def measure_fill(form_page: FormPage, data: Dict[str, str], mode: str, trials: int) -> List[float]:
+    """Mede o tempo de fill_form (sem navegação) em cada tentativa"""
+    durations = []
+    for _ in range(trials):
+        form_page.navigate()
+        start = time.perf_counter()
+        form_page.fill_form(data, mode=mode)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos modos de preenchimento de formulário")
+    parser.add_argument("--browser", default=config.BROWSER)
+    parser.add_argument("--headless", action="store_true", default=config.HEADLESS)
+    parser.add_argument("--trials", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    long_strings = DataFactory.generate_long_strings()
+    data = {"name": long_strings["very_long_name"], "email": long_strings["very_long_email"]}
+
+    server = EmbeddedAppServer()
+    base_url = server.start()
+    factory = DriverFactory(DriverResolver(config.DRIVER_CACHE_DIR, config.OFFLINE_DRIVERS), config.TIMEOUT)
+    driver = factory.create(args.browser, args.headless)
+    try:
+        form_page = FormPage(driver, base_url=base_url)
+        medians = {}
+        for mode in MODES:
+            durations = measure_fill(form_page, data, mode, args.trials)
+            medians[mode] = statistics.median(durations)
+            print(f"{mode:>9}: mediana {medians[mode] * 1000:.1f} ms (mín {min(durations) * 1000:.1f} ms, "
+                  f"máx {max(durations) * 1000:.1f} ms, {args.trials} tentativas)")
+        print(f"fast é {medians['fidelity'] / medians['fast']:.1f}x mais rápido que fidelity")
+    finally:
+        driver.quit()
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
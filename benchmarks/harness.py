@@ -0,0 +1,239 @@
+"""
+Benchmarks do próprio framework de testes, executados contra o app.py local.
+
+Mede a abertura do navegador (Chrome/Firefox, headless/headed) e as operações dos
+Page Objects: navigate() de cada página, fill_form_and_submit, verify_page_elements,
+has_error_message negativo e a captura de screenshot. Cada cenário roda algumas
+tentativas de aquecimento (descartadas) e depois as tentativas medidas; o resultado
+traz mediana e percentis e pode ser comparado com um baseline em JSON.
+
+Uso:
+    python -m benchmarks.harness --browsers chrome --modes headless --save-baseline
+    python -m benchmarks.harness --browsers chrome,firefox --modes headless,headed --threshold 0.15
+    python -m benchmarks.harness --backend protocol     # Page Objects sem navegador
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.stats import percentile
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_OUTPUT = os.path.join("reports", "benchmarks.json")
+
+# Um cenário: nome, preparação (não medida) e a operação medida
+Scenario = Tuple[str, Optional[Callable[[], None]], Callable[[], None]]
+
+
+def run_trials(operation: Callable[[], None], trials: int, warmup: int = 1,
+               setup: Callable[[], None] = None) -> List[float]:
+    """Executa a operação warmup + trials vezes e retorna as durações medidas (s)"""
+    durations = []
+    for index in range(warmup + trials):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            durations.append(elapsed)
+    return durations
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Mediana, percentis, mínimo e máximo (s) das tentativas"""
+    ordered = sorted(durations)
+    return {
+        "trials": len(ordered),
+        "median": statistics.median(ordered),
+        "p90": percentile(ordered, 90),
+        "p95": percentile(ordered, 95),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[Tuple[str, float, float]]:
+    """
+    Cenários cuja mediana passou da mediana do baseline em mais de `threshold`
+    (fração, ex.: 0.2 = 20%). Retorna (cenário, mediana do baseline, mediana atual)
+    """
+    regressions = []
+    for name, summary in results.items():
+        reference = baseline.get(name)
+        if reference and summary["median"] > reference["median"] * (1 + threshold):
+            regressions.append((name, reference["median"], summary["median"]))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    try:
+        with open(path, encoding="utf-8") as baseline_file:
+            return json.load(baseline_file)["results"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def write_results(path: str, results: Dict[str, Dict[str, float]], trials: int, warmup: int) -> None:
+    """Grava os resultados (o mesmo formato serve como baseline)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "environment": {"python": platform.python_version(), "platform": platform.platform()},
+            "trials": trials,
+            "warmup": warmup,
+            "results": results,
+        }, results_file, indent=2)
+
+
+def page_object_scenarios(driver, base_url: str, screenshots: bool = True) -> List[Scenario]:
+    """Cenários dos Page Objects sobre um driver já aberto"""
+    from pages.form_page import FormPage
+    from pages.home_page import HomePage
+    from pages.success_page import SuccessPage
+    from utils.artifacts import capture
+    from utils.data_factory import DataFactory
+
+    home_page = HomePage(driver, base_url=base_url)
+    form_page = FormPage(driver, base_url=base_url)
+    success_page = SuccessPage(driver, base_url=base_url)
+    user = DataFactory.generate_valid_user_data()
+
+    scenarios: List[Scenario] = [
+        ("HomePage.navigate", None, home_page.navigate),
+        ("FormPage.navigate", None, form_page.navigate),
+        ("SuccessPage.navigate", None, success_page.navigate),
+        ("HomePage.verify_page_elements", home_page.navigate, home_page.verify_page_elements),
+        ("FormPage.verify_page_elements", form_page.navigate, form_page.verify_page_elements),
+        ("FormPage.fill_form_and_submit", form_page.navigate,
+         lambda: form_page.fill_form_and_submit(user["name"], user["email"])),
+        ("FormPage.has_error_message (ausente)", form_page.navigate, form_page.has_error_message),
+    ]
+    if screenshots:
+        scenarios.append(("screenshot", form_page.navigate,
+                          lambda: capture(driver, "benchmark", page_source=False, console_logs=False)))
+    return scenarios
+
+
+def run_scenarios(prefix: str, scenarios: List[Scenario], trials: int, warmup: int,
+                  results: Dict[str, Dict[str, float]]) -> None:
+    for name, setup, operation in scenarios:
+        key = f"{prefix}/{name}"
+        results[key] = summarize(run_trials(operation, trials, warmup, setup))
+        print_summary(key, results[key])
+
+
+def print_summary(name: str, summary: Dict[str, float]) -> None:
+    print(f"{name:<55} mediana {summary['median'] * 1000:8.1f} ms  p90 {summary['p90'] * 1000:8.1f} ms  "
+          f"p95 {summary['p95'] * 1000:8.1f} ms  ({summary['trials']} tentativas)")
+
+
+def benchmark_browsers(browsers: List[str], modes: List[str], trials: int, warmup: int,
+                       base_url: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Abertura do navegador e cenários dos Page Objects para cada navegador e modo"""
+    from config.settings import config
+    from utils.driver_factory import DriverFactory
+    from utils.driver_resolver import DriverResolver
+
+    factory = DriverFactory(DriverResolver(config.DRIVER_CACHE_DIR, config.OFFLINE_DRIVERS), config.TIMEOUT)
+    for browser in browsers:
+        for mode in modes:
+            prefix = f"{browser}-{mode}"
+            headless = mode == "headless"
+            launched = []
+
+            def close_launched():
+                # O encerramento não faz parte da medição da abertura
+                while launched:
+                    launched.pop().quit()
+
+            try:
+                run_scenarios(prefix, [
+                    ("launch", close_launched, lambda: launched.append(factory.create(browser, headless))),
+                ], trials, warmup, results)
+            except Exception as e:
+                close_launched()
+                print(f"{prefix}: navegador indisponível ({e.__class__.__name__}: {e})")
+                continue
+            driver = launched.pop()
+            try:
+                run_scenarios(prefix, page_object_scenarios(driver, base_url), trials, warmup, results)
+            finally:
+                driver.quit()
+
+
+def benchmark_protocol(trials: int, warmup: int, results: Dict[str, Dict[str, float]]) -> None:
+    """Cenários dos Page Objects no backend protocol (app.py no processo, sem navegador)"""
+    from pages.base_page import DEFAULT_BASE_URL
+    from utils.protocol_driver import ProtocolDriver
+
+    driver = ProtocolDriver()
+    try:
+        # O host da URL é ignorado: as requisições vão direto para o app.py
+        run_scenarios("protocol", page_object_scenarios(driver, DEFAULT_BASE_URL, screenshots=False),
+                      trials, warmup, results)
+    finally:
+        driver.quit()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do framework de testes")
+    parser.add_argument("--backend", choices=("browser", "protocol"), default="browser")
+    parser.add_argument("--browsers", default="chrome", help="Navegadores separados por vírgula (chrome,firefox)")
+    parser.add_argument("--modes", default="headless", help="Modos separados por vírgula (headless,headed)")
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2, help="Tentativas descartadas antes das medidas")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Regressão: mediana acima do baseline em mais que esta fração (0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Grava os resultados como novo baseline")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict[str, float]] = {}
+    if args.backend == "protocol":
+        benchmark_protocol(args.trials, args.warmup, results)
+    else:
+        from utils.app_server import EmbeddedAppServer
+
+        server = EmbeddedAppServer()
+        base_url = server.start()
+        try:
+            benchmark_browsers(
+                [browser.strip() for browser in args.browsers.split(",") if browser.strip()],
+                [mode.strip() for mode in args.modes.split(",") if mode.strip()],
+                args.trials, args.warmup, base_url, results,
+            )
+        finally:
+            server.stop()
+
+    write_results(args.output, results, args.trials, args.warmup)
+    print(f"resultados em {args.output}")
+    if args.save_baseline:
+        write_results(args.baseline, results, args.trials, args.warmup)
+        print(f"baseline gravado em {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"sem baseline em {args.baseline} (use --save-baseline)")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(f"REGRESSÃO {name}: {before * 1000:.1f} ms -> {after * 1000:.1f} ms (+{after / before - 1:.0%})")
+    print(f"{len(regressions)} regressões acima de {args.threshold:.0%} em {len(results)} cenários")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Gerador de carga HTTP (asyncio) para o fluxo do formulário:
+GET /formulario -> POST /formulario -> redirecionamento -> GET /sucesso.
+
+Os payloads vêm da DataFactory (válidos e inválidos, na proporção de --invalid-ratio).
+As conexões são keep-alive e reaproveitadas por um pool. A carga pode ser definida
+por concorrência (usuários simultâneos em laço fechado) ou por taxa de fluxos por
+segundo (chegadas em laço aberto). O resultado, com vazão, latências p50/p95/p99 e
+taxa de erro por rota, é impresso em JSON. A latência de cada pedido inclui a espera
+por uma conexão livre do pool.
+
+Uso:
+    python -m benchmarks.load --concurrency 20 --duration 10
+    python -m benchmarks.load --rate 200 --duration 10 --app-server process
+    python -m benchmarks.load --url http://127.0.0.1:5001 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from benchmarks.stats import percentile
+from utils.data_factory import DataFactory
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class HttpConnection:
+    """Conexão HTTP/1.1 keep-alive mínima sobre asyncio streams"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reconnects = 0
+
+    async def request(self, method: str, path: str, body: bytes = b"",
+                      headers: Dict[str, str] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Envia o pedido e lê a resposta. Se uma conexão keep-alive reaproveitada já foi
+        encerrada pelo servidor (ociosa), ela é reaberta e o pedido é repetido uma vez
+        """
+        reused = self.writer is not None
+        try:
+            status = await self._send(method, path, body, headers)
+        except ConnectionError:
+            await self.close()
+            if not reused:
+                raise
+            self.reconnects += 1
+            status = await self._send(method, path, body, headers)
+
+        response_headers = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            content = await self._read_chunked()
+        elif "content-length" in response_headers:
+            content = await self.reader.readexactly(int(response_headers["content-length"]))
+        else:
+            content = await self.reader.read()
+            response_headers["connection"] = "close"
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, response_headers, content
+
+    async def _send(self, method: str, path: str, body: bytes, headers: Optional[Dict[str, str]]) -> int:
+        """Grava o pedido e retorna o status; ConnectionError se o servidor fechou antes de responder"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        if body or method == "POST":
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Conexão encerrada pelo servidor")
+        return int(status_line.split()[1])
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+
+class ConnectionPool:
+    """Pool de conexões keep-alive reaproveitadas entre os fluxos"""
+
+    def __init__(self, host: str, port: int, size: int):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.connections = [HttpConnection(host, port) for _ in range(size)]
+        for connection in self.connections:
+            self.queue.put_nowait(connection)
+
+    async def acquire(self) -> HttpConnection:
+        return await self.queue.get()
+
+    def release(self, connection: HttpConnection) -> None:
+        self.queue.put_nowait(connection)
+
+    async def close(self) -> None:
+        for connection in self.connections:
+            await connection.close()
+
+
+class RouteStats:
+    """Latências e erros acumulados de uma rota"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def record(self, seconds: float, ok: bool) -> None:
+        self.latencies.append(seconds)
+        if not ok:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        count = len(self.latencies)
+        ordered = sorted(self.latencies)
+        return {
+            "requests": count,
+            "throughput_rps": round(count / elapsed, 1) if elapsed else 0.0,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        }
+
+
+def build_payloads(count: int, invalid_ratio: float, seed: int = None) -> List[Dict[str, str]]:
+    """Payloads do formulário gerados pela DataFactory (válidos e inválidos)"""
+    rng = random.Random(seed)
+    # Usuários válidos em lote: reproduzíveis pela semente e com emails únicos
+    users = DataFactory.generate_users(count, seed=seed)
+    payloads = []
+    for index in range(count):
+        if rng.random() < invalid_ratio:
+            data = rng.choice(list(DataFactory.generate_invalid_user_data().values()))
+        else:
+            data = users[index]
+        payloads.append({"nome": data["name"], "email": data["email"]})
+    return payloads
+
+
+def expects_redirect(payload: Dict[str, str]) -> bool:
+    """O app.py só rejeita nome ou email vazios; o resto é redirecionado para /sucesso"""
+    return bool(payload["nome"]) and bool(payload["email"])
+
+
+class LoadTest:
+    """Executa o fluxo do formulário com concorrência ou taxa alvo e coleta as métricas"""
+
+    def __init__(self, base_url: str, concurrency: int, duration: float, rate: float = None,
+                 payloads: List[Dict[str, str]] = None):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rate = rate
+        self.payloads = payloads or build_payloads(1000, 0.2)
+        self.routes: Dict[str, RouteStats] = {}
+        self.flows = RouteStats()
+        self.reconnects = 0
+        self._next_payload = 0
+
+    async def _timed(self, pool: ConnectionPool, route: str, method: str, path: str, body: bytes = b"",
+                     headers: Dict[str, str] = None, expected: Tuple[int, ...] = (200,)):
+        # Inclui a espera por uma conexão livre: no laço aberto é o que o pedido que chega
+        # de fato experimenta (sem coordinated omission)
+        start = time.perf_counter()
+        connection = await pool.acquire()
+        try:
+            status, response_headers, _ = await connection.request(method, path, body, headers)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError, ValueError):
+            await connection.close()
+            self.routes.setdefault(route, RouteStats()).record(time.perf_counter() - start, False)
+            return None, {}
+        finally:
+            pool.release(connection)
+        ok = status in expected
+        self.routes.setdefault(route, RouteStats()).record(time.perf_counter() - start, ok)
+        return (status if ok else None), response_headers
+
+    async def run_flow(self, pool: ConnectionPool) -> None:
+        """GET /formulario -> POST /formulario -> (redirecionamento) GET /sucesso"""
+        payload = self.payloads[self._next_payload % len(self.payloads)]
+        self._next_payload += 1
+        start = time.perf_counter()
+
+        status, _ = await self._timed(pool, "GET /formulario", "GET", "/formulario")
+        ok = status is not None
+        if ok:
+            redirect = expects_redirect(payload)
+            status, headers = await self._timed(
+                pool, "POST /formulario", "POST", "/formulario",
+                body=urlencode(payload).encode(),
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                expected=REDIRECT_CODES if redirect else (200,),
+            )
+            ok = status is not None
+            if ok and redirect:
+                location = urlsplit(headers.get("location", "/sucesso")).path or "/sucesso"
+                status, _ = await self._timed(pool, f"GET {location}", "GET", location)
+                ok = status is not None
+        self.flows.record(time.perf_counter() - start, ok)
+
+    async def run(self) -> Dict[str, object]:
+        pool = ConnectionPool(self.host, self.port, self.concurrency)
+        deadline = time.perf_counter() + self.duration
+        start = time.perf_counter()
+        try:
+            if self.rate:
+                await self._open_loop(pool, deadline)
+            else:
+                await asyncio.gather(*(self._closed_loop(pool, deadline) for _ in range(self.concurrency)))
+        finally:
+            self.reconnects = sum(connection.reconnects for connection in pool.connections)
+            await pool.close()
+        return self.report(time.perf_counter() - start)
+
+    async def _closed_loop(self, pool: ConnectionPool, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            await self.run_flow(pool)
+
+    async def _open_loop(self, pool: ConnectionPool, deadline: float) -> None:
+        # Chegadas em intervalos fixos; o pool limita os fluxos simultâneos
+        interval = 1.0 / self.rate
+        next_start = time.perf_counter()
+        tasks = set()
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(self.run_flow(pool))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_start += interval
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def report(self, elapsed: float) -> Dict[str, object]:
+        return {
+            "target": f"http://{self.host}:{self.port}",
+            "mode": f"rate={self.rate}/s" if self.rate else f"concurrency={self.concurrency}",
+            "duration_s": round(elapsed, 2),
+            "reconnects": self.reconnects,
+            "flows": self.flows.summary(elapsed),
+            "routes": {route: stats.summary(elapsed) for route, stats in sorted(self.routes.items())},
+        }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Teste de carga do fluxo do formulário")
+    parser.add_argument("--url", help="URL da aplicação; sem ela a aplicação é iniciada localmente")
+    parser.add_argument("--app-server", default="embedded", choices=("embedded", "process"),
+                        help="Sem --url: embedded (thread deste processo) ou process (app.py em modo production)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Fluxos simultâneos (tamanho do pool)")
+    parser.add_argument("--rate", type=float, help="Fluxos iniciados por segundo (laço aberto)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duração em segundos")
+    parser.add_argument("--invalid-ratio", type=float, default=0.2, help="Fração de payloads inválidos")
+    parser.add_argument("--seed", type=int, help="Semente da escolha dos payloads")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        from utils.app_server import AppServerProcess, EmbeddedAppServer
+        server = EmbeddedAppServer() if args.app_server == "embedded" else AppServerProcess()
+        base_url = server.start()
+
+    try:
+        load_test = LoadTest(
+            base_url,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            rate=args.rate,
+            payloads=build_payloads(1000, args.invalid_ratio, args.seed),
+        )
+        result = asyncio.run(load_test.run())
+    finally:
+        if server:
+            server.stop()
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    print(output)
+    return 1 if result["flows"]["error_rate"] > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
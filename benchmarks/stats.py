@@ -0,0 +1,10 @@
+"""Estatísticas compartilhadas pelos benchmarks (harness e gerador de carga)"""
+from typing import List
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Percentil (nearest-rank) de uma lista já ordenada"""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
@@ -0,0 +1,20 @@
+import os
+from dataclasses import dataclass
+
+@dataclass
+class ServerConfig:
+    """Configurações de execução do app.py"""
+    # "development": servidor de debug do Flask; "production": servidor WSGI sem debug
+    MODE: str = os.getenv("APP_MODE", "development")
+    HOST: str = os.getenv("APP_HOST", "127.0.0.1")
+    PORT: int = int(os.getenv("PORT", "5001"))
+    DEBUG: bool = os.getenv("APP_DEBUG", "true").lower() == "true"
+
+    # Modo production: threads por processo, processos (fork, apenas Linux/macOS)
+    # e tamanho da fila de conexões pendentes do socket
+    THREADS: int = int(os.getenv("APP_THREADS", "8"))
+    WORKERS: int = int(os.getenv("APP_WORKERS", "1"))
+    BACKLOG: int = int(os.getenv("APP_BACKLOG", "1024"))
+
+# Instância global de configuração do servidor
+server_config = ServerConfig()
@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any
 
 @dataclass
@@ -9,21 +9,38 @@ class TestConfig:
     BROWSER: str = os.getenv("BROWSER", "chrome")
     HEADLESS: bool = os.getenv("HEADLESS", "false").lower() == "true"
     TIMEOUT: int = int(os.getenv("TIMEOUT", "10"))
+    # Intervalo máximo (s) entre verificações das esperas quando o navegador não emite eventos
+    POLL_INTERVAL: float = float(os.getenv("POLL_INTERVAL", "0.1"))
     SCREENSHOT_ON_FAILURE: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+    # Preenchimento de formulários: "fidelity" (digitação real) ou "fast" (injeção via script)
+    FILL_MODE: str = os.getenv("FILL_MODE", "fidelity")
+    # Mede o tempo de cada método dos Page Objects (relatório no fim da sessão)
+    PAGE_TIMING: bool = os.getenv("PAGE_TIMING", "false").lower() == "true"
+    
+    # Cache local dos binários de WebDriver (manifest por versão do navegador); aceita "~"
+    DRIVER_CACHE_DIR: str = os.path.expanduser(
+        os.getenv("DRIVER_CACHE_DIR", os.path.join("~", ".cache", "selenium-tests"))
+    )
+    OFFLINE_DRIVERS: bool = os.getenv("OFFLINE_DRIVERS", "false").lower() == "true"
+    
+    # Armazenamento de artefatos de falha (deduplicado por conteúdo) e sua retenção
+    ARTIFACT_STORE_DIR: str = os.getenv("ARTIFACT_STORE_DIR", "artifacts")
+    ARTIFACT_MAX_MB: float = float(os.getenv("ARTIFACT_MAX_MB", "500"))
+    ARTIFACT_MAX_AGE_DAYS: float = float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "14"))
     
     # Dados de teste válidos
-    VALID_USER_DATA: Dict[str, Any] = {
+    VALID_USER_DATA: Dict[str, Any] = field(default_factory=lambda: {
         "name": "João Silva",
         "email": "joao@teste.com",
         "phone": "(11) 99999-9999"
-    }
+    })
     
     # Dados de teste inválidos
-    INVALID_USER_DATA: Dict[str, Any] = {
+    INVALID_USER_DATA: Dict[str, Any] = field(default_factory=lambda: {
         "empty_name": {"name": "", "email": "teste@email.com"},
         "empty_email": {"name": "Nome Teste", "email": ""},
         "invalid_email": {"name": "Nome Teste", "email": "email_invalido"}
-    }
+    })
 
 # Instância global de configuração
 config = TestConfig()
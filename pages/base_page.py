@@ -1,16 +1,50 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from typing import Tuple
-import time
+from typing import TYPE_CHECKING, Dict, Iterable, Sequence, Tuple
+from pages import dom_scripts
+from pages.snapshot import ElementState, PageSnapshot
+from utils.artifacts import save_screenshot_async
+from utils.page_timing import instrument_class
+from utils.waits import WaitEngine
+
+if TYPE_CHECKING:
+    # expected_conditions e WebElement carregam o WebDriver remoto inteiro: são importados
+    # só na primeira espera, para que coleta e execuções sem navegador não paguem por eles
+    from selenium.webdriver.remote.webelement import WebElement
+
+DEFAULT_BASE_URL = "http://127.0.0.1:5001"
+
+def get_base_url() -> str:
+    """
+    Retorna a URL base atual da aplicação.
+    Lida em tempo de execução para que cada worker use o seu próprio servidor
+    """
+    try:
+        from config.settings import config
+        return config.BASE_URL
+    except ImportError:
+        return DEFAULT_BASE_URL
+
+def get_fill_mode() -> str:
+    """Modo de preenchimento padrão: "fidelity" (digitação real) ou "fast" (injeção via script)"""
+    try:
+        from config.settings import config
+        return config.FILL_MODE
+    except ImportError:
+        return "fidelity"
 
 class BasePage:
     """Classe base para todas as páginas (Page Object Model)"""
     
-    def __init__(self, driver):
+    def __init_subclass__(cls, **kwargs):
+        # Os métodos públicos de cada Page Object são medidos (utils.page_timing)
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+    
+    def __init__(self, driver, base_url: str = None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WaitEngine(driver, timeout=10)
+        self.base_url = (base_url or get_base_url()).rstrip("/")
     
     def navigate_to(self, url: str) -> None:
         """Navega para uma URL específica"""
@@ -24,15 +58,15 @@ class BasePage:
         """Retorna o título da página"""
         return self.driver.title
     
-    def wait_for_element(self, locator: Tuple[By, str], timeout: int = 10) -> WebElement:
+    def wait_for_element(self, locator: Tuple[By, str], timeout: int = 10) -> "WebElement":
         """Aguarda um elemento aparecer na página"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        from selenium.webdriver.support import expected_conditions as EC
+        return self.wait.until(EC.presence_of_element_located(locator), timeout)
     
-    def wait_for_element_clickable(self, locator: Tuple[By, str], timeout: int = 10) -> WebElement:
+    def wait_for_element_clickable(self, locator: Tuple[By, str], timeout: int = 10) -> "WebElement":
         """Aguarda um elemento ficar clicável"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        from selenium.webdriver.support import expected_conditions as EC
+        return self.wait.until(EC.element_to_be_clickable(locator), timeout)
     
     def click_element(self, locator: Tuple[By, str]) -> None:
         """Clica em um elemento após aguardar ele ficar clicável"""
@@ -45,30 +79,141 @@ class BasePage:
         element.clear()
         element.send_keys(text)
     
+    def fill_fields(self, values: Dict[Tuple[By, str], str], mode: str = None) -> None:
+        """
+        Preenche vários campos de uma vez.
+        mode="fast" define os valores com um único script e dispara os eventos input/change;
+        mode="fidelity" digita tecla por tecla em cada campo (como fill_field)
+        """
+        mode = mode or get_fill_mode()
+        if mode not in ("fast", "fidelity"):
+            raise ValueError(f"Modo de preenchimento '{mode}' inválido. Use 'fast' ou 'fidelity'")
+        
+        pending = list(values.items())
+        if mode == "fast" and hasattr(self.driver, "execute_script"):
+            entries = [[by, value, text] for (by, value), text in pending]
+            missing = self.driver.execute_script(dom_scripts.FILL_FIELDS, entries)
+            # Campos ainda não renderizados são preenchidos com espera, tecla por tecla
+            pending = [pending[index] for index in missing]
+        
+        for locator, text in pending:
+            self.fill_field(locator, text)
+    
     def get_element_text(self, locator: Tuple[By, str]) -> str:
         """Obtém o texto de um elemento"""
         element = self.wait_for_element(locator)
         return element.text
     
+    def count_elements(self, locator: Tuple[By, str]) -> int:
+        """
+        Conta os elementos que correspondem ao locator consultando o DOM uma única vez,
+        sem bloquear na espera implícita do driver
+        """
+        if hasattr(self.driver, "execute_script"):
+            return self.driver.execute_script(dom_scripts.COUNT_ELEMENTS, *locator)
+        return len(self.driver.find_elements(*locator))
+    
     def is_element_present(self, locator: Tuple[By, str]) -> bool:
-        """Verifica se um elemento está presente na página"""
+        """
+        Verifica se um elemento está presente na página (sem esperar).
+        Erros de sessão/driver não são tratados como ausência e são propagados
+        """
         try:
-            self.driver.find_element(*locator)
-            return True
-        except:
+            return self.count_elements(locator) > 0
+        except (NoSuchElementException, StaleElementReferenceException, JavascriptException):
             return False
     
+    def is_element_absent(self, locator: Tuple[By, str]) -> bool:
+        """Verifica se um elemento não está presente na página (sem esperar)"""
+        return not self.is_element_present(locator)
+    
+    def wait_until_present(self, locator: Tuple[By, str], timeout: int = 10) -> bool:
+        """Aguarda um elemento aparecer; retorna False se o timeout expirar"""
+        return self._wait_for_check(lambda _: self.is_element_present(locator), timeout)
+    
+    def wait_until_absent(self, locator: Tuple[By, str], timeout: int = 10) -> bool:
+        """Aguarda um elemento sumir da página; retorna False se o timeout expirar"""
+        return self._wait_for_check(lambda _: self.is_element_absent(locator), timeout)
+    
+    def _wait_for_check(self, check, timeout: int) -> bool:
+        return self.wait.check(check, timeout)
+    
+    def snapshot(self, locators: Iterable[Tuple[By, str]] = (), attributes: Sequence[str] = ()) -> PageSnapshot:
+        """
+        Obtém título, URL e presença/visibilidade/texto/atributos de vários locators
+        em uma única ida e volta ao navegador (sem espera implícita)
+        """
+        locators = [tuple(locator) for locator in locators]
+        if not hasattr(self.driver, "execute_script"):
+            return self._snapshot_with_find(locators, attributes)
+        
+        queries = [[by, value, list(attributes)] for by, value in locators]
+        result = self.driver.execute_script(dom_scripts.SNAPSHOT, queries)
+        return PageSnapshot(
+            title=result["title"],
+            url=result["url"],
+            elements={
+                locator: ElementState(**state)
+                for locator, state in zip(locators, result["elements"])
+            },
+        )
+    
+    def snapshot_when_present(self, locators: Iterable[Tuple[By, str]], attributes: Sequence[str] = (),
+                              timeout: int = 10) -> PageSnapshot:
+        """
+        Snapshot tirado assim que todos os locators estão presentes (ou quando o timeout
+        expira): espera como as verificações elemento a elemento, com uma ida e volta
+        por verificação em vez de uma por locator
+        """
+        locators = [tuple(locator) for locator in locators]
+        taken = []
+        
+        def all_present(_) -> bool:
+            try:
+                taken.append(self.snapshot(locators, attributes))
+            except JavascriptException:
+                # Script descartado pela navegação em andamento: verifica de novo
+                return False
+            return taken[-1].all_present()
+        
+        if self._wait_for_check(all_present, timeout) or taken:
+            return taken[-1]
+        return self.snapshot(locators, attributes)
+    
+    def _snapshot_with_find(self, locators, attributes) -> PageSnapshot:
+        """Snapshot para drivers sem suporte a JavaScript (um comando por locator)"""
+        elements = {}
+        for locator in locators:
+            found = self.driver.find_elements(*locator)
+            if not found:
+                elements[locator] = ElementState()
+                continue
+            element = found[0]
+            elements[locator] = ElementState(
+                present=True,
+                visible=element.is_displayed(),
+                text=element.text,
+                attributes={name: element.get_attribute(name) for name in attributes},
+                count=len(found),
+            )
+        return PageSnapshot(title=self.driver.title, url=self.driver.current_url, elements=elements)
+    
     def wait_for_url_change(self, expected_url: str, timeout: int = 10) -> bool:
         """Aguarda mudança para uma URL específica"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.url_to_be(expected_url))
+        from selenium.webdriver.support import expected_conditions as EC
+        return self.wait.until(EC.url_to_be(expected_url), timeout)
     
-    def take_screenshot(self, filename: str) -> None:
-        """Tira screenshot da página atual"""
-        self.driver.save_screenshot(f"screenshots/{filename}")
+    def take_screenshot(self, filename: str) -> str:
+        """
+        Tira screenshot da página atual; o arquivo screenshots/<filename> é gravado em
+        background (o diretório é criado se não existir)
+        """
+        return save_screenshot_async(self.driver, filename)
     
     def scroll_to_element(self, locator: Tuple[By, str]) -> None:
         """Rola a página até um elemento específico"""
         element = self.wait_for_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Pequena pausa para garantir que o scroll terminou
+        # Retorna assim que a rolagem termina (sem pausa fixa)
+        self.wait.scroll_into_view(element)
+
+instrument_class(BasePage)
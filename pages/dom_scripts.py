@@ -0,0 +1,106 @@
+# Scripts JavaScript executados no navegador pelos Page Objects.
+# Cada script faz o trabalho de vários comandos WebDriver em uma única ida e volta.
+
+# Define locate(by, value): resolve um locator do Selenium (By.*) no DOM atual,
+# sem passar pela espera implícita do driver
+LOCATE_FUNCTION = """
+function locate(by, value) {
+    switch (by) {
+        case "id":
+            var byId = document.getElementById(value);
+            return byId ? [byId] : [];
+        case "css selector":
+            return Array.prototype.slice.call(document.querySelectorAll(value));
+        case "tag name":
+            return Array.prototype.slice.call(document.getElementsByTagName(value));
+        case "class name":
+            return Array.prototype.slice.call(document.getElementsByClassName(value));
+        case "name":
+            return Array.prototype.slice.call(document.getElementsByName(value));
+        case "link text":
+        case "partial link text":
+            return Array.prototype.filter.call(document.getElementsByTagName("a"), function (link) {
+                var text = (link.innerText || link.textContent || "").trim();
+                return by === "link text" ? text === value : text.indexOf(value) !== -1;
+            });
+        case "xpath":
+            var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+    }
+    throw new Error("Estratégia de locator não suportada: " + by);
+}
+"""
+
+# Conta os elementos que correspondem ao locator (arguments: by, value)
+COUNT_ELEMENTS = LOCATE_FUNCTION + """
+return locate(arguments[0], arguments[1]).length;
+"""
+
+# Coleta, em uma única chamada, título, URL e o estado de cada locator
+# (arguments[0]: lista de [by, value, [atributos]])
+SNAPSHOT = LOCATE_FUNCTION + """
+function isVisible(element) {
+    if (!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)) {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+
+function readAttribute(element, name) {
+    var property = element[name];
+    if (property !== undefined && property !== null && typeof property !== "object" && typeof property !== "function") {
+        return String(property);
+    }
+    return element.getAttribute(name);
+}
+
+var elements = arguments[0].map(function (query) {
+    var found = locate(query[0], query[1]);
+    if (!found.length) {
+        return {present: false, visible: false, text: "", attributes: {}, count: 0};
+    }
+    var element = found[0];
+    var attributes = {};
+    query[2].forEach(function (name) {
+        attributes[name] = readAttribute(element, name);
+    });
+    return {
+        present: true,
+        visible: isVisible(element),
+        text: (element.innerText || "").trim(),
+        attributes: attributes,
+        count: found.length
+    };
+});
+
+return {title: document.title, url: window.location.href, elements: elements};
+"""
+
+# Preenche vários campos de uma vez, usando o setter nativo de "value" e disparando
+# os eventos input/change (arguments[0]: lista de [by, value, texto]).
+# Retorna os índices dos campos que não foram encontrados
+FILL_FIELDS = LOCATE_FUNCTION + """
+var missing = [];
+arguments[0].forEach(function (entry, index) {
+    var found = locate(entry[0], entry[1]);
+    if (!found.length) {
+        missing.push(index);
+        return;
+    }
+    var element = found[0];
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : element instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : HTMLInputElement.prototype;
+    var setter = Object.getOwnPropertyDescriptor(prototype, "value").set;
+    element.focus();
+    setter.call(element, entry[2]);
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+});
+return missing;
+"""
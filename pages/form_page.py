@@ -1,13 +1,7 @@
+from typing import Dict
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
-# Importar config de forma segura
-try:
-    from config.settings import config
-    BASE_URL = config.BASE_URL
-except ImportError:
-    BASE_URL = "http://127.0.0.1:5001"
-
 class FormPage(BasePage):
     """Page Object para a página do formulário"""
     
@@ -18,9 +12,15 @@ class FormPage(BasePage):
     ERROR_MESSAGE = (By.ID, "mensagem-erro")
     FORM_TITLE = (By.TAG_NAME, "h1")
     
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.url = BASE_URL + "/formulario"
+    # Elementos que precisam estar na página
+    REQUIRED_ELEMENTS = (NAME_INPUT, EMAIL_INPUT, SUBMIT_BUTTON)
+    
+    # Campos do formulário aceitos por fill_form
+    FIELDS = {"name": NAME_INPUT, "email": EMAIL_INPUT}
+    
+    def __init__(self, driver, base_url: str = None):
+        super().__init__(driver, base_url)
+        self.url = self.base_url + "/formulario"
     
     def navigate(self):
         """Navega para a página do formulário"""
@@ -38,14 +38,25 @@ class FormPage(BasePage):
         """Clica no botão de enviar"""
         self.click_element(self.SUBMIT_BUTTON)
     
-    def fill_form_and_submit(self, name: str, email: str):
+    def fill_form(self, data: Dict[str, str], mode: str = None):
+        """
+        Preenche vários campos em uma operação (chaves: "name", "email").
+        mode: "fast" (injeção via script) ou "fidelity" (digitação real); padrão em config.FILL_MODE
+        """
+        unknown = set(data) - set(self.FIELDS)
+        if unknown:
+            raise KeyError(f"Campos desconhecidos no formulário: {sorted(unknown)}")
+        self.fill_fields({self.FIELDS[name]: value for name, value in data.items()}, mode)
+    
+    def fill_form_and_submit(self, name: str, email: str, mode: str = None):
         """Preenche o formulário completo e envia"""
-        self.fill_name(name)
-        self.fill_email(email)
+        self.fill_form({"name": name, "email": email}, mode)
         self.click_submit()
     
     def get_error_message(self) -> str:
         """Obtém a mensagem de erro, se presente"""
+        if not self.has_error_message():
+            return ""
         try:
             return self.get_element_text(self.ERROR_MESSAGE)
         except:
@@ -57,7 +68,7 @@ class FormPage(BasePage):
     
     def is_on_form_page(self) -> bool:
         """Verifica se está na página do formulário"""
-        return "Formulário de Teste" in self.get_title()
+        return "Formulário de Teste" in self.snapshot().title
     
     def get_form_title_text(self) -> str:
         """Obtém o texto do título do formulário"""
@@ -65,13 +76,8 @@ class FormPage(BasePage):
     
     def verify_page_elements(self) -> bool:
         """Verifica se todos os elementos principais estão presentes"""
-        return (
-            self.is_element_present(self.NAME_INPUT) and
-            self.is_element_present(self.EMAIL_INPUT) and
-            self.is_element_present(self.SUBMIT_BUTTON)
-        )
+        return self.snapshot_when_present(self.REQUIRED_ELEMENTS).all_present()
     
     def clear_form(self):
         """Limpa todos os campos do formulário"""
-        self.fill_field(self.NAME_INPUT, "")
-        self.fill_field(self.EMAIL_INPUT, "")
+        self.fill_form({"name": "", "email": ""})
@@ -1,13 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
-# Importar config de forma segura
-try:
-    from config.settings import config
-    BASE_URL = config.BASE_URL
-except ImportError:
-    BASE_URL = "http://127.0.0.1:5001"
-
 class HomePage(BasePage):
     """Page Object para a página inicial"""
     
@@ -15,9 +8,12 @@ class HomePage(BasePage):
     FORM_LINK = (By.LINK_TEXT, "Ir para o formulário de cadastro")
     PAGE_TITLE = (By.TAG_NAME, "h1")
     
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.url = BASE_URL + "/"
+    # Elementos que precisam estar na página
+    REQUIRED_ELEMENTS = (FORM_LINK, PAGE_TITLE)
+    
+    def __init__(self, driver, base_url: str = None):
+        super().__init__(driver, base_url)
+        self.url = self.base_url + "/"
     
     def navigate(self):
         """Navega para a página inicial"""
@@ -33,11 +29,8 @@ class HomePage(BasePage):
     
     def is_on_home_page(self) -> bool:
         """Verifica se está na página inicial"""
-        return "Página Inicial" in self.get_title()
+        return "Página Inicial" in self.snapshot().title
     
     def verify_page_elements(self) -> bool:
         """Verifica se todos os elementos principais estão presentes"""
-        return (
-            self.is_element_present(self.FORM_LINK) and
-            self.is_element_present(self.PAGE_TITLE)
-        )
+        return self.snapshot_when_present(self.REQUIRED_ELEMENTS).all_present()
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+Locator = Tuple[str, str]
+
+
+@dataclass
+class ElementState:
+    """Estado de um locator no momento do snapshot"""
+    present: bool = False
+    visible: bool = False
+    text: str = ""
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+    count: int = 0
+
+
+@dataclass
+class PageSnapshot:
+    """Fotografia do DOM: título, URL e estado de um conjunto de locators"""
+    title: str
+    url: str
+    elements: Dict[Locator, ElementState] = field(default_factory=dict)
+
+    def element(self, locator: Locator) -> ElementState:
+        return self.elements.get(tuple(locator), ElementState())
+
+    def is_present(self, locator: Locator) -> bool:
+        return self.element(locator).present
+
+    def is_visible(self, locator: Locator) -> bool:
+        return self.element(locator).visible
+
+    def text(self, locator: Locator) -> str:
+        return self.element(locator).text
+
+    def attribute(self, locator: Locator, name: str) -> Optional[str]:
+        return self.element(locator).attributes.get(name)
+
+    def all_present(self, locators: Iterable[Locator] = None) -> bool:
+        """Verifica se todos os locators (por padrão, todos os do snapshot) estão presentes"""
+        locators = self.elements.keys() if locators is None else locators
+        return all(self.is_present(locator) for locator in locators)
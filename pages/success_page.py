@@ -1,13 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
-# Importar config de forma segura
-try:
-    from config.settings import config
-    BASE_URL = config.BASE_URL
-except ImportError:
-    BASE_URL = "http://127.0.0.1:5001"
-
 class SuccessPage(BasePage):
     """Page Object para a página de sucesso"""
     
@@ -16,9 +9,12 @@ class SuccessPage(BasePage):
     PAGE_TITLE = (By.TAG_NAME, "h1")
     BACK_LINK = (By.LINK_TEXT, "Voltar")
     
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.url = BASE_URL + "/sucesso"
+    # Elementos que precisam estar na página
+    REQUIRED_ELEMENTS = (SUCCESS_MESSAGE, PAGE_TITLE)
+    
+    def __init__(self, driver, base_url: str = None):
+        super().__init__(driver, base_url)
+        self.url = self.base_url + "/sucesso"
     
     def navigate(self):
         """Navega para a página de sucesso"""
@@ -39,7 +35,7 @@ class SuccessPage(BasePage):
     
     def is_on_success_page(self) -> bool:
         """Verifica se está na página de sucesso"""
-        return self.get_current_url() == self.url
+        return self.snapshot().url == self.url
     
     def has_success_message(self) -> bool:
         """Verifica se a mensagem de sucesso está presente"""
@@ -47,12 +43,9 @@ class SuccessPage(BasePage):
     
     def verify_success_elements(self) -> bool:
         """Verifica se todos os elementos de sucesso estão presentes"""
-        return (
-            self.is_element_present(self.SUCCESS_MESSAGE) and
-            self.is_element_present(self.PAGE_TITLE)
-        )
+        return self.snapshot_when_present(self.REQUIRED_ELEMENTS).all_present()
     
     def verify_success_message_content(self, expected_text: str = "Cadastro realizado com sucesso!") -> bool:
         """Verifica se a mensagem de sucesso contém o texto esperado"""
-        message = self.get_success_message()
+        message = self.snapshot_when_present([self.SUCCESS_MESSAGE]).text(self.SUCCESS_MESSAGE)
         return expected_text in message
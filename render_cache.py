@@ -0,0 +1,72 @@
+"""
+Cache das páginas renderizadas pelo app.py.
+
+O HTML de cada combinação (template, contexto) é renderizado uma única vez e
+servido com ETag forte; requisições condicionais (If-None-Match) recebem 304.
+Quando o Jinja está com auto_reload ativo (modo debug), a data de modificação do
+template é conferida a cada requisição e uma alteração invalida o cache.
+"""
+import hashlib
+import os
+import threading
+from typing import Dict, Hashable, Optional, Tuple
+
+from flask import render_template, request
+
+CACHE_CONTROL = "public, no-cache"
+
+
+class CachedPage:
+    """Bytes renderizados de uma página, com a ETag e a versão do template usada"""
+
+    __slots__ = ("body", "etag", "mtime")
+
+    def __init__(self, body: bytes, mtime: Optional[float]):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.mtime = mtime
+
+
+class RenderCache:
+    """Cache de páginas renderizadas indexado por template e contexto"""
+
+    def __init__(self, app):
+        self.app = app
+        self._pages: Dict[Tuple[str, Hashable], CachedPage] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def response(self, template: str, status: int = 200, **context):
+        """Resposta HTML com ETag e Cache-Control; 304 se o cliente já tem a versão atual"""
+        page = self.get(template, **context)
+        response = self.app.response_class(page.body, status=status, mimetype="text/html")
+        response.set_etag(page.etag)
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        # Só GET/HEAD com status 200 viram 304
+        return response.make_conditional(request)
+
+    def get(self, template: str, **context) -> CachedPage:
+        key = (template, tuple(sorted(context.items())))
+        mtime = self._template_mtime(template) if self.app.jinja_env.auto_reload else None
+        page = self._pages.get(key)
+        if page is not None and page.mtime == mtime:
+            self.hits += 1
+            return page
+
+        self.misses += 1
+        page = CachedPage(render_template(template, **context).encode("utf-8"), mtime)
+        with self._lock:
+            self._pages[key] = page
+        return page
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def _template_mtime(self, template: str) -> Optional[float]:
+        path = os.path.join(self.app.root_path, self.app.template_folder, template)
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
@@ -40,40 +40,14 @@ Write-Host ""
 Write-Host "📁 Criando diretórios..." -ForegroundColor Blue
 New-Item -ItemType Directory -Force -Path "reports", "screenshots", "logs" | Out-Null
 
-# Iniciar aplicação Flask em background
-Write-Host ""
-Write-Host "🌐 Iniciando aplicação Flask..." -ForegroundColor Blue
-$flaskProcess = Start-Process python -ArgumentList "app.py" -PassThru
-
-# Aguardar aplicação iniciar
-Start-Sleep -Seconds 10
-
-# Verificar se aplicação está respondendo
-Write-Host ""
-Write-Host "🔍 Verificando se aplicação está rodando..." -ForegroundColor Blue
-try {
-    $response = Invoke-WebRequest -Uri "http://127.0.0.1:5001/" -TimeoutSec 5
-    if ($response.StatusCode -eq 200) {
-        Write-Host "✅ Aplicação Flask está respondendo" -ForegroundColor Green
-    } else {
-        throw "Status code: $($response.StatusCode)"
-    }
-} catch {
-    Write-Host "❌ Aplicação Flask não está respondendo: $_" -ForegroundColor Red
-    Stop-Process -Id $flaskProcess.Id -Force -ErrorAction SilentlyContinue
-    exit 1
-}
-
 # Executar testes
 Write-Host ""
-Write-Host "🧪 Executando testes..." -ForegroundColor Blue
-$testResult = & pytest -v --browser=chrome --headless --html=reports/local-test-report.html --self-contained-html
+Write-Host "🧪 Executando testes (a aplicação Flask é iniciada pelo próprio pytest)..." -ForegroundColor Blue
+$testResult = & pytest -v --browser=chrome --headless
 $testExitCode = $LASTEXITCODE
 
-# Parar aplicação Flask
-Write-Host ""
-Write-Host "🛑 Parando aplicação Flask..." -ForegroundColor Blue
-Stop-Process -Id $flaskProcess.Id -Force -ErrorAction SilentlyContinue
+# Relatório HTML a partir dos resultados gravados durante a execução
+& python -m utils.result_sink merge reports/results -o reports/local-test-report.html
 
 # Mostrar resultados
 Write-Host ""
@@ -38,38 +38,16 @@ echo ""
 echo "📁 Criando diretórios..."
 mkdir -p reports screenshots logs
 
-# Iniciar aplicação Flask em background
-echo ""
-echo "🌐 Iniciando aplicação Flask..."
-python app.py &
-FLASK_PID=$!
-
-# Aguardar aplicação iniciar
-sleep 10
-
-# Verificar se aplicação está respondendo
-echo ""
-echo "🔍 Verificando se aplicação está rodando..."
-if curl -f http://127.0.0.1:5001/ > /dev/null 2>&1; then
-    echo "✅ Aplicação Flask está respondendo"
-else
-    echo "❌ Aplicação Flask não está respondendo"
-    kill $FLASK_PID 2>/dev/null
-    exit 1
-fi
-
 # Executar testes
 echo ""
-echo "🧪 Executando testes..."
-pytest -v --browser=chrome --headless --html=reports/local-test-report.html --self-contained-html
+echo "🧪 Executando testes (a aplicação Flask é iniciada pelo próprio pytest)..."
+pytest -v --browser=chrome --headless
 
 # Capturar código de saída dos testes
 TEST_EXIT_CODE=$?
 
-# Parar aplicação Flask
-echo ""
-echo "🛑 Parando aplicação Flask..."
-kill $FLASK_PID 2>/dev/null
+# Relatório HTML a partir dos resultados gravados durante a execução
+python -m utils.result_sink merge reports/results -o reports/local-test-report.html
 
 # Mostrar resultados
 echo ""
@@ -1,12 +1,14 @@
 import pytest
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+from utils.waits import wait_until
 
-# URL base da nossa aplicação Flask
-BASE_URL = "http://127.0.0.1:5001"
+# URL base da nossa aplicação Flask (pode ser sobrescrita por worker via variável de ambiente)
+BASE_URL = os.getenv("BASE_URL", "http://127.0.0.1:5001")
 
 @pytest.fixture
 def driver():
@@ -49,7 +51,8 @@ def test_preenchimento_e_envio_sucesso(driver):
     
     driver.find_element(By.ID, "botao-enviar").click()
     
-    time.sleep(1) 
+    # Aguarda o redirecionamento (resolve assim que a navegação acontece)
+    wait_until(driver, EC.url_to_be(BASE_URL + "/sucesso"))
     
     assert driver.current_url == BASE_URL + "/sucesso"
     
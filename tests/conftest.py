@@ -1,13 +1,25 @@
 import os
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 import datetime
+import json
+import math
+from utils.app_server import AppServerProcess, EmbeddedAppServer
+from utils.artifact_store import ArtifactStore, new_run_id
+from utils.artifacts import ArtifactWriter, capture
+from utils.browser_pool import BrowserPool
+from utils.data_factory import DataFactory
+from utils.datasets import loaded_datasets, open_dataset
+from utils.driver_factory import DriverFactory
+from utils.driver_hooks import CommandCounter, ImplicitWaitMonitor, get_listener
+from utils.driver_resolver import DriverResolver
+from utils.test_durations import DurationHistory, split_into_shards
+from utils.helpers import BrowserHelpers
+from utils.marker_reports import MarkerReportPlugin
+from utils.page_timing import page_timer
+from utils.protocol_driver import ProtocolDriver
+from utils.result_sink import DEFAULT_RESULTS_DIR, ResultSink, results_path
+from utils.row_runner import DEFAULT_CHECKPOINT_DIR, FormFlow, RowRunner, checkpoint_path
+from utils.warm_pool import WarmBrowserPool
 
 # Importar config de forma segura
 try:
@@ -18,12 +30,48 @@ except ImportError:
         BASE_URL = "http://127.0.0.1:5001"
         HEADLESS = False
         TIMEOUT = 10
+        POLL_INTERVAL = 0.1
         SCREENSHOT_ON_FAILURE = True
+        DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "selenium-tests")
+        OFFLINE_DRIVERS = False
+        ARTIFACT_STORE_DIR = "artifacts"
+        ARTIFACT_MAX_MB = 500
+        ARTIFACT_MAX_AGE_DAYS = 14
+        FILL_MODE = "fidelity"
+        PAGE_TIMING = False
         VALID_USER_DATA = {"name": "Test User", "email": "test@example.com"}
         INVALID_USER_DATA = {"empty_name": {"name": "", "email": "test@email.com"}}
     
     config = FallbackConfig()
 
+# Resolve o caminho dos drivers uma única vez por execução
+driver_resolver = DriverResolver(config.DRIVER_CACHE_DIR, offline=config.OFFLINE_DRIVERS)
+driver_factory = DriverFactory(driver_resolver, implicit_wait=config.TIMEOUT)
+
+# Histórico de durações (carregado em pytest_configure) e durações medidas nesta execução
+duration_history = None
+measured_durations = {}
+shard_predictions = []
+
+# Modo, URL e tempo de inicialização do servidor da aplicação (fixture app_server)
+app_server_startup = None
+
+# Gravação em background dos artefatos de falha (criada em pytest_configure)
+failure_artifacts = None
+artifact_run_id = None
+
+# Resultados de cada fase gravados em JSONL à medida que os testes rodam
+result_sink = None
+
+# Testes que passaram mais que o limite configurado bloqueados em esperas implícitas
+implicit_wait_offenders = []
+
+# Comandos WebDriver de cada teste (até o fim da fase call) e o seu orçamento
+command_counts = {}
+
+# Navegadores abertos em segundo plano antes dos testes (criado em pytest_collection_finish)
+warm_browsers = None
+
 def pytest_addoption(parser):
     """Adiciona opções de linha de comando customizadas"""
     parser.addoption(
@@ -38,6 +86,406 @@ def pytest_addoption(parser):
         default=False,
         help="Executar os testes em modo headless"
     )
+    parser.addoption(
+        "--driver-scope",
+        action="store",
+        default="function",
+        choices=("function", "session"),
+        help="function: um navegador novo por teste; session: reutiliza navegadores de um pool por worker"
+    )
+    parser.addoption(
+        "--recycle-after",
+        action="store",
+        type=int,
+        default=50,
+        help="Número de testes após o qual um navegador do pool é recriado (--driver-scope=session)"
+    )
+    parser.addoption(
+        "--warm-browsers",
+        action="store",
+        type=int,
+        default=2,
+        help="Máximo de navegadores abertos em segundo plano antes de serem pedidos; "
+             "a quantidade acompanha o ritmo dos testes (0 desliga)"
+    )
+    parser.addoption(
+        "--offline-drivers",
+        action="store_true",
+        default=False,
+        help="Nunca acessa a rede para obter drivers: usa o manifest local ou o PATH"
+    )
+    parser.addoption(
+        "--app-server",
+        action="store",
+        default=None,
+        choices=("external", "embedded", "process"),
+        help="external: usa a aplicação em BASE_URL; embedded: app.py em uma thread do pytest; "
+             "process: sobe um app.py próprio. Padrão: external se BASE_URL estiver definida, senão embedded"
+    )
+    parser.addoption(
+        "--shard-count",
+        action="store",
+        type=int,
+        default=1,
+        help="Número total de fatias (shards) em que os testes são divididos"
+    )
+    parser.addoption(
+        "--shard-index",
+        action="store",
+        type=int,
+        default=0,
+        help="Índice (a partir de 0) da fatia de testes executada por este processo"
+    )
+    parser.addoption(
+        "--shard-strategy",
+        action="store",
+        default="duration",
+        choices=("duration", "round-robin"),
+        help="duration: balanceia os shards pelo histórico de durações (maior primeiro); round-robin: alterna os testes"
+    )
+    parser.addoption(
+        "--test-order",
+        action="store",
+        default="slow-first",
+        choices=("slow-first", "file"),
+        help="slow-first: executa primeiro os testes mais lentos segundo o histórico; file: ordem dos arquivos"
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default=".test_durations.json",
+        help="Arquivo com o histórico de duração dos testes"
+    )
+    parser.addoption(
+        "--shard-report",
+        action="store",
+        default=None,
+        help="Grava em JSON o makespan previsto e real deste shard"
+    )
+    parser.addoption(
+        "--marker-reports",
+        action="store",
+        default="",
+        help="Grupos separados por vírgula (ex.: smoke,critical,regression) com relatório próprio, além do full"
+    )
+    parser.addoption(
+        "--marker-reports-dir",
+        action="store",
+        default="reports",
+        help="Diretório dos relatórios por marcador"
+    )
+    parser.addoption(
+        "--results-dir",
+        action="store",
+        default=DEFAULT_RESULTS_DIR,
+        help="Diretório dos resultados em JSONL (um arquivo por worker); vazio desativa"
+    )
+    parser.addoption(
+        "--implicit-wait-threshold",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Fração do tempo do teste bloqueada em esperas implícitas a partir da qual o teste é reportado"
+    )
+    parser.addoption(
+        "--max-commands",
+        action="store",
+        type=int,
+        default=None,
+        help="Orçamento de comandos WebDriver para testes sem @pytest.mark.max_commands"
+    )
+    parser.addoption(
+        "--command-report",
+        action="store",
+        default=os.path.join("reports", "command-budgets.json"),
+        help="Arquivo JSON com os comandos WebDriver de cada teste e o seu orçamento"
+    )
+    parser.addoption(
+        "--rows-dataset",
+        action="store",
+        default=None,
+        help="Dataset (.tds) com as linhas dos testes orientados a dados (fixture user_rows)"
+    )
+    parser.addoption(
+        "--resume-rows",
+        action="store_true",
+        default=False,
+        help="Testes orientados a dados recomeçam da linha que falhou na execução anterior"
+    )
+    parser.addoption(
+        "--fill-mode",
+        action="store",
+        default=None,
+        choices=("fast", "fidelity"),
+        help="Preenchimento de formulários: fast (injeção via script) ou fidelity (digitação real)"
+    )
+    parser.addoption(
+        "--page-timing",
+        action="store_true",
+        default=False,
+        help="Mede o tempo de cada método dos Page Objects (também com PAGE_TIMING=true)"
+    )
+    parser.addoption(
+        "--page-timing-file",
+        action="store",
+        default=os.path.join("reports", "page-timings.json"),
+        help="Arquivo JSON com os histogramas por operação e por teste"
+    )
+    parser.addoption(
+        "--page-timing-top",
+        action="store",
+        type=int,
+        default=10,
+        help="Quantidade de operações mais lentas exibidas no resumo"
+    )
+    parser.addoption(
+        "--artifacts",
+        action="store",
+        default="store",
+        choices=("store", "files"),
+        help="Artefatos de falha: store (deduplicados em ARTIFACT_STORE_DIR) ou files (screenshots/)"
+    )
+    parser.addoption(
+        "--backend",
+        action="store",
+        default="browser",
+        choices=("browser", "protocol"),
+        help="Backend do driver: browser (WebDriver real) ou protocol (app.py no processo, sem navegador)"
+    )
+
+def pytest_configure(config):
+    """Aplica as opções de resolução de drivers e carrega o histórico de durações"""
+    global duration_history, failure_artifacts, artifact_run_id, result_sink
+    if config.getoption("--offline-drivers"):
+        driver_resolver.offline = True
+    if driver_resolver.offline:
+        # Impede que o Selenium Manager tente baixar drivers no fallback
+        os.environ.setdefault("SE_OFFLINE", "true")
+    
+    worker_id = os.getenv("TEST_WORKER_ID") or os.getenv("PYTEST_XDIST_WORKER")
+    duration_history = DurationHistory(config.getoption("--durations-file"), worker_id=worker_id).load()
+    
+    page_timer.enabled = _page_timing_enabled(config.getoption("--page-timing"))
+    
+    artifact_run_id = new_run_id()
+    failure_artifacts = _create_failure_writer(config.getoption("--artifacts"))
+    
+    results_dir = config.getoption("--results-dir")
+    if results_dir:
+        result_sink = ResultSink(results_path(results_dir, worker_id), artifact_run_id, worker_id)
+    
+    groups = [group.strip() for group in config.getoption("--marker-reports").split(",") if group.strip()]
+    if groups:
+        # Um grupo só é completo se todos os seus testes rodarem: falhas de outros grupos não param a execução
+        config.option.maxfail = 0
+        config.pluginmanager.register(
+            MarkerReportPlugin(groups, config.getoption("--marker-reports-dir")), "marker_reports"
+        )
+
+def _page_timing_enabled(option: bool) -> bool:
+    """Medição dos Page Objects: --page-timing ou PAGE_TIMING=true"""
+    return option or config.PAGE_TIMING
+
+def _create_failure_writer(mode: str) -> ArtifactWriter:
+    """Writer dos artefatos de falha: no ArtifactStore (deduplicado) ou em screenshots/"""
+    store = None
+    if mode == "store":
+        store = ArtifactStore(
+            config.ARTIFACT_STORE_DIR,
+            max_bytes=int(config.ARTIFACT_MAX_MB * 1024 * 1024),
+            max_age_days=config.ARTIFACT_MAX_AGE_DAYS,
+        )
+    return ArtifactWriter(store=store)
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Mantém apenas os testes da fatia deste worker (--shard-index/--shard-count)
+    e ordena os mais lentos primeiro, segundo o histórico de durações
+    """
+    estimates = [(item.nodeid, duration_history.estimate(item.nodeid)) for item in items]
+    shard_count = config.getoption("--shard-count")
+    shard_index = config.getoption("--shard-index")
+    
+    if shard_count > 1:
+        if not 0 <= shard_index < shard_count:
+            raise pytest.UsageError(f"--shard-index deve estar entre 0 e {shard_count - 1}")
+        
+        if config.getoption("--shard-strategy") == "duration":
+            shards = split_into_shards(estimates, shard_count)
+        else:
+            shards = [[nodeid for nodeid, _ in estimates[i::shard_count]] for i in range(shard_count)]
+        
+        estimate_by_id = dict(estimates)
+        shard_predictions[:] = [sum(estimate_by_id[nodeid] for nodeid in shard) for shard in shards]
+        
+        in_shard = set(shards[shard_index])
+        selected = [item for item in items if item.nodeid in in_shard]
+        deselected = [item for item in items if item.nodeid not in in_shard]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    else:
+        shard_predictions[:] = [sum(seconds for _, seconds in estimates)]
+    
+    # Sem histórico todos os testes têm a mesma estimativa e a ordem dos arquivos é mantida
+    if config.getoption("--test-order") == "slow-first" and duration_history.durations:
+        items.sort(key=lambda item: -duration_history.estimate(item.nodeid))
+
+def pytest_collection_finish(session):
+    """Começa a abrir navegadores em segundo plano se algum teste selecionado vai usar um"""
+    global warm_browsers
+    max_warm = session.config.getoption("--warm-browsers")
+    if max_warm <= 0 or session.config.option.collectonly:
+        return
+    launches = _expected_launches(session)
+    if not launches:
+        return
+    browser_type = session.config.getoption("--browser")
+    headless = _headless_mode(session.config)
+    warm_browsers = WarmBrowserPool(
+        factory=lambda: driver_factory.create(browser_type, headless),
+        max_warm=max_warm,
+        remaining=launches,
+    )
+    warm_browsers.start()
+
+def _expected_launches(session) -> int:
+    """
+    Navegadores que os testes selecionados devem abrir: um por teste com
+    --driver-scope=function; com session, os do pool (um a cada --recycle-after
+    testes) mais um por teste @pytest.mark.fresh_browser
+    """
+    browser_items = [item for item in session.items if _uses_browser(item)]
+    if session.config.getoption("--driver-scope") != "session":
+        return len(browser_items)
+    fresh = sum(1 for item in browser_items if item.get_closest_marker("fresh_browser") is not None)
+    pooled = len(browser_items) - fresh
+    max_uses = max(session.config.getoption("--recycle-after"), 1)
+    return fresh + math.ceil(pooled / max_uses)
+
+def _uses_browser(item) -> bool:
+    """O teste pede o driver e não roda no backend protocol"""
+    return "driver" in getattr(item, "fixturenames", ()) and _selected_backend(item) != "protocol"
+
+def pytest_runtest_setup(item):
+    """Associa as medições dos Page Objects ao teste em execução"""
+    page_timer.current_test = item.nodeid
+
+def pytest_runtest_logreport(report):
+    """Acumula a duração de cada fase do teste (setup, call e teardown)"""
+    if report.skipped:
+        measured_durations[report.nodeid] = None
+    elif measured_durations.get(report.nodeid, 0.0) is not None:
+        measured_durations[report.nodeid] = measured_durations.get(report.nodeid, 0.0) + report.duration
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Atualiza o histórico de durações e grava o relatório do shard"""
+    measured = {nodeid: seconds for nodeid, seconds in measured_durations.items() if seconds is not None}
+    for nodeid, seconds in measured.items():
+        duration_history.record(nodeid, seconds)
+    duration_history.save()
+    
+    if warm_browsers is not None:
+        warm_browsers.close()
+    
+    # Artefatos de falha ainda na fila precisam estar em disco antes dos relatórios
+    failure_artifacts.close()
+    if failure_artifacts.store is not None:
+        failure_artifacts.store.evict()
+    if result_sink is not None:
+        result_sink.write_datasets(loaded_datasets)
+        result_sink.close()
+    if page_timer.enabled and page_timer.operations:
+        page_timer.export(session.config.getoption("--page-timing-file"))
+    if command_counts:
+        _write_command_report(session.config.getoption("--command-report"))
+    
+    report_path = session.config.getoption("--shard-report")
+    if report_path:
+        _write_shard_report(session.config, report_path, sum(measured.values()))
+
+def _write_shard_report(config, report_path: str, actual: float) -> None:
+    """Grava o makespan previsto e real deste shard para o executor paralelo"""
+    shard_index = config.getoption("--shard-index") if config.getoption("--shard-count") > 1 else 0
+    predictions = shard_predictions or [0.0]
+    directory = os.path.dirname(report_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump({
+            "shard_index": shard_index,
+            "shard_count": len(predictions),
+            "predicted": predictions[shard_index],
+            "predicted_all": predictions,
+            "actual": actual,
+        }, report_file, indent=2)
+
+def _write_command_report(report_path: str) -> None:
+    """Grava os comandos WebDriver de cada teste, por tipo, com o orçamento"""
+    directory = os.path.dirname(report_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump(command_counts, report_file, indent=2)
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Mostra a inicialização do servidor, os navegadores pré-aquecidos, os drivers, os orçamentos de comandos, as operações mais lentas e os shards"""
+    if loaded_datasets:
+        terminalreporter.write_sep("-", "datasets")
+        for path, content_hash in loaded_datasets.items():
+            terminalreporter.write_line(f"{path}: sha256 {content_hash}")
+    
+    if app_server_startup:
+        mode, url, seconds = app_server_startup
+        terminalreporter.write_sep("-", "servidor da aplicação")
+        terminalreporter.write_line(f"{mode} em {url}: pronto em {seconds * 1000:.0f} ms")
+    
+    if warm_browsers is not None and (warm_browsers.stats.launches or warm_browsers.stats.failed):
+        terminalreporter.write_sep("-", "navegadores pré-aquecidos")
+        for line in warm_browsers.stats.describe():
+            terminalreporter.write_line(line)
+    
+    lines = driver_resolver.summary_lines()
+    if lines:
+        terminalreporter.write_sep("-", "resolução de WebDriver")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    if implicit_wait_offenders:
+        terminalreporter.write_sep("-", "tempo bloqueado em esperas implícitas")
+        for nodeid, blocked, duration, finds in sorted(implicit_wait_offenders, key=lambda entry: -entry[1]):
+            terminalreporter.write_line(
+                f"{nodeid}: {blocked:.1f}s de {duration:.1f}s ({blocked / duration:.0%}) em {finds} buscas"
+            )
+    
+    budgeted = {nodeid: entry for nodeid, entry in command_counts.items() if entry["budget"] is not None}
+    if budgeted:
+        terminalreporter.write_sep("-", "comandos WebDriver por teste (orçamento)")
+        for nodeid, entry in sorted(budgeted.items(), key=lambda item: -item[1]["commands"] / max(item[1]["budget"], 1)):
+            status = " EXCEDIDO" if entry["commands"] > entry["budget"] else ""
+            terminalreporter.write_line(f"{nodeid}: {entry['commands']}/{entry['budget']}{status}")
+        terminalreporter.write_line(f"todos os testes, por tipo de comando: {config.getoption('--command-report')}")
+    
+    if page_timer.enabled and page_timer.operations:
+        terminalreporter.write_sep("-", "operações mais lentas dos Page Objects")
+        for operation, histogram in page_timer.top(config.getoption("--page-timing-top")):
+            terminalreporter.write_line(
+                f"{operation}: {histogram.total:.2f}s em {histogram.count} chamadas "
+                f"(média {histogram.mean * 1000:.0f} ms, p95 {histogram.percentile(0.95) * 1000:.0f} ms, "
+                f"máx {histogram.max * 1000:.0f} ms)"
+            )
+        terminalreporter.write_line(f"histogramas por operação e por teste: {config.getoption('--page-timing-file')}")
+    
+    if config.getoption("--shard-count") > 1 and shard_predictions:
+        shard_index = config.getoption("--shard-index")
+        actual = sum(seconds for seconds in measured_durations.values() if seconds is not None)
+        terminalreporter.write_sep("-", "makespan por shard")
+        for index, predicted in enumerate(shard_predictions):
+            line = f"shard {index}: previsto {predicted:.1f}s"
+            if index == shard_index:
+                line += f", real {actual:.1f}s (este worker)"
+            terminalreporter.write_line(line)
 
 @pytest.fixture(scope="session")
 def browser_type(request):
@@ -47,99 +495,276 @@ def browser_type(request):
 @pytest.fixture(scope="session")
 def headless_mode(request):
     """Fixture para definir se deve executar em modo headless"""
-    return request.config.getoption("--headless") or config.HEADLESS
+    return _headless_mode(request.config)
 
-@pytest.fixture(scope="function")
-def driver(browser_type, headless_mode):
+def _headless_mode(pytest_config) -> bool:
+    """--headless ou HEADLESS=true"""
+    return pytest_config.getoption("--headless") or config.HEADLESS
+
+@pytest.fixture(scope="session")
+def app_server(request):
     """
-    Fixture principal para criar e gerenciar o WebDriver
-    Executada antes de cada teste
+    URL da aplicação usada pelos testes.
+    Com --app-server=embedded (padrão sem BASE_URL no ambiente) o app.py roda em uma
+    thread do próprio pytest; com --app-server=process em um processo separado. Nos
+    dois casos a porta é efêmera e a URL é publicada em config.BASE_URL (lida pelos
+    Page Objects)
     """
-    driver_instance = None
+    global app_server_startup
+    mode = request.config.getoption("--app-server") or ("external" if "BASE_URL" in os.environ else "embedded")
+    if mode == "external":
+        yield config.BASE_URL
+        return
     
+    server = EmbeddedAppServer() if mode == "embedded" else AppServerProcess()
+    previous_url, previous_env = config.BASE_URL, os.environ.get("BASE_URL")
+    start = datetime.datetime.now()
+    config.BASE_URL = server.start()
+    app_server_startup = (mode, config.BASE_URL, (datetime.datetime.now() - start).total_seconds())
+    os.environ["BASE_URL"] = config.BASE_URL
     try:
-        if browser_type.lower() == "chrome":
-            driver_instance = _create_chrome_driver(headless_mode)
-        elif browser_type.lower() == "firefox":
-            driver_instance = _create_firefox_driver(headless_mode)
-        else:
-            raise ValueError(f"Browser '{browser_type}' não suportado. Use 'chrome' ou 'firefox'")
-        
-        # Configurações gerais
-        driver_instance.implicitly_wait(config.TIMEOUT)
-        driver_instance.maximize_window()
-        
-        yield driver_instance
-        
+        yield config.BASE_URL
     finally:
-        if driver_instance:
-            driver_instance.quit()
+        server.stop()
+        config.BASE_URL = previous_url
+        if previous_env is None:
+            os.environ.pop("BASE_URL", None)
+        else:
+            os.environ["BASE_URL"] = previous_env
+
+@pytest.fixture(scope="session")
+def browser_pool(request, browser_type, headless_mode):
+    """Pool de navegadores reutilizáveis, compartilhado por todos os testes do worker"""
+    pool = BrowserPool(
+        factory=lambda: _create_driver(browser_type, headless_mode),
+        max_uses=request.config.getoption("--recycle-after"),
+        reset=_reset_driver,
+    )
+    yield pool
+    pool.close()
 
-def _create_chrome_driver(headless: bool = False):
-    """Cria uma instância do Chrome WebDriver"""
-    options = ChromeOptions()
+@pytest.fixture(scope="function")
+def driver(request, browser_type, headless_mode):
+    """
+    Fixture principal para criar e gerenciar o WebDriver
+    Executada antes de cada teste
+    
+    Com --driver-scope=session o navegador vem de um pool e é apenas limpo entre
+    os testes. Testes marcados com @pytest.mark.fresh_browser sempre recebem um
+    navegador novo.
     
-    if headless:
-        options.add_argument("--headless")
+    Os navegadores novos vêm já abertos de WarmBrowserPool, que os abre em segundo
+    plano desde o fim da coleta (--warm-browsers=0 abre no momento do pedido).
     
-    # Opções essenciais para CI/CD
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--allow-running-insecure-content")
-    options.add_argument("--ignore-certificate-errors")
+    Com --backend=protocol (ou @pytest.mark.backend("protocol")) o teste recebe um
+    ProtocolDriver, que executa o app.py no próprio processo sem navegador.
+    """
+    if _selected_backend(request.node) == "protocol":
+        driver_instance = ProtocolDriver()
+        try:
+            yield driver_instance
+        finally:
+            _capture_failure(request.node, driver_instance)
+            driver_instance.quit()
+        return
+    
+    request.getfixturevalue("app_server")
+    use_pool = (
+        request.config.getoption("--driver-scope") == "session"
+        and request.node.get_closest_marker("fresh_browser") is None
+    )
     
+    if use_pool:
+        pool = request.getfixturevalue("browser_pool")
+        driver_instance = pool.acquire()
+        release = lambda: pool.release(driver_instance, discard=_test_failed(request.node))
+    else:
+        driver_instance = _create_driver(browser_type, headless_mode)
+        release = driver_instance.quit
+    
+    _start_test_tracking(driver_instance)
     try:
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
-    except Exception as e:
-        print(f"Erro ao criar Chrome driver: {e}")
-        # Fallback: tentar usar Chrome do sistema
+        yield driver_instance
+    finally:
         try:
-            return webdriver.Chrome(options=options)
-        except Exception as e2:
-            print(f"Erro no fallback Chrome: {e2}")
-            raise
+            _finish_test_tracking(request.node, driver_instance)
+            _capture_failure(request.node, driver_instance)
+        finally:
+            release()
 
-def _create_firefox_driver(headless: bool = False):
-    """Cria uma instância do Firefox WebDriver"""
-    options = FirefoxOptions()
-    
-    if headless:
-        options.add_argument("--headless")
+def _selected_backend(item) -> str:
+    """Backend do driver para o teste: marcador backend > --backend"""
+    marker = item.get_closest_marker("backend")
+    return marker.args[0] if marker else item.config.getoption("--backend")
+
+def _start_test_tracking(driver_instance) -> None:
+    """Zera as medições por teste feitas sobre os comandos do driver"""
+    for listener_type in (ImplicitWaitMonitor, CommandCounter):
+        listener = get_listener(driver_instance, listener_type)
+        if listener:
+            listener.reset()
+
+def _finish_test_tracking(item, driver_instance) -> None:
+    """Registra os testes que passaram boa parte do tempo bloqueados em esperas implícitas"""
+    monitor = get_listener(driver_instance, ImplicitWaitMonitor)
+    rep_call = getattr(item, "rep_call", None)
+    if not monitor or not rep_call or rep_call.duration <= 0:
+        return
+    share = monitor.blocked_seconds / rep_call.duration
+    if share >= item.config.getoption("--implicit-wait-threshold"):
+        implicit_wait_offenders.append((item.nodeid, monitor.blocked_seconds, rep_call.duration, monitor.blocked_finds))
+
+def _create_driver(browser_type: str, headless: bool):
+    """Cria e configura um WebDriver do tipo solicitado (pré-aquecido com --warm-browsers)"""
+    if warm_browsers is not None:
+        return warm_browsers.acquire()
+    return driver_factory.create(browser_type, headless)
+
+def _reset_driver(driver_instance) -> bool:
+    """Limpa o estado do navegador entre testes (usado pelo pool)"""
+    if not BrowserHelpers.reset_browser_state(driver_instance):
+        return False
+    try:
+        # O teste pode ter alterado a espera implícita
+        driver_instance.implicitly_wait(config.TIMEOUT)
+        return True
+    except Exception:
+        return False
+
+def _test_failed(item) -> bool:
+    """Indica se o teste falhou (ou foi interrompido) antes de devolver o navegador"""
+    rep_setup = getattr(item, "rep_setup", None)
+    rep_call = getattr(item, "rep_call", None)
+    if rep_setup is None or rep_setup.failed:
+        return True
+    if rep_call is None:
+        return not rep_setup.skipped
+    return rep_call.failed
+
+@pytest.fixture(autouse=True)
+def fill_mode(request):
+    """
+    Define o modo de preenchimento dos formulários para o teste:
+    @pytest.mark.fill_mode("fast") > --fill-mode > FILL_MODE do ambiente
+    """
+    marker = request.node.get_closest_marker("fill_mode")
+    mode = marker.args[0] if marker else request.config.getoption("--fill-mode")
+    previous = config.FILL_MODE
+    config.FILL_MODE = mode or previous
+    yield config.FILL_MODE
+    config.FILL_MODE = previous
+
+@pytest.fixture
+def user_rows(request):
+    """Linhas de usuários: o dataset de --rows-dataset (lido via mmap) ou 3 usuários gerados"""
+    path = request.config.getoption("--rows-dataset")
+    if not path:
+        yield DataFactory.generate_users(3)
+        return
+    dataset = open_dataset(path)
+    try:
+        yield dataset
+    finally:
+        dataset.close()
+
+@pytest.fixture
+def row_runner(request, driver):
+    """
+    Executor orientado a dados: cada linha passa pelo fluxo formulário -> sucesso no
+    mesmo navegador e vira um sub-resultado nos resultados em JSONL.
+    Com --resume-rows recomeça da linha que falhou na execução anterior
+    """
+    nodeid = request.node.nodeid
     
-    options.add_argument("--width=1920")
-    options.add_argument("--height=1080")
+    def on_result(result):
+        if result_sink is not None:
+            result_sink.write_row(nodeid, result)
     
-    service = FirefoxService(GeckoDriverManager().install())
-    return webdriver.Firefox(service=service, options=options)
+    return RowRunner(
+        FormFlow(driver),
+        checkpoint=checkpoint_path(DEFAULT_CHECKPOINT_DIR, nodeid),
+        # Após uma linha com falha o navegador é limpo; o backend protocol não guarda estado
+        reset=None if isinstance(driver, ProtocolDriver) else lambda: _reset_driver(driver),
+        on_result=on_result,
+        resume=request.config.getoption("--resume-rows"),
+    )
 
 @pytest.fixture(scope="function")
 def screenshot_on_failure(request, driver):
     """Fixture para tirar screenshot em caso de falha"""
     yield
+    _capture_failure(request.node, driver)
+
+def _capture_failure(item, driver_instance) -> None:
+    """
+    Captura screenshot, HTML, URL e logs do console de um teste que falhou.
+    Só a leitura no navegador acontece aqui; a gravação é feita em background
+    """
+    rep_call = getattr(item, "rep_call", None)
+    if not rep_call or not rep_call.failed or not config.SCREENSHOT_ON_FAILURE:
+        return
+    if getattr(item, "failure_artifacts", None) is not None:
+        return
     
-    if request.node.rep_call.failed and config.SCREENSHOT_ON_FAILURE:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        test_name = request.node.name
-        screenshot_name = f"{test_name}_{timestamp}.png"
-        screenshot_path = os.path.join("screenshots", screenshot_name)
-        
-        try:
-            driver.save_screenshot(screenshot_path)
-            print(f"Screenshot salvo: {screenshot_path}")
-        except Exception as e:
-            print(f"Erro ao salvar screenshot: {e}")
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    try:
+        captured = capture(driver_instance, f"{item.name}_{timestamp}")
+        captured.test, captured.run_id = item.nodeid, artifact_run_id
+        item.failure_artifacts = failure_artifacts.submit(captured, lambda paths: _artifacts_written(item, paths))
+    except Exception as e:
+        item.failure_artifacts = {}
+        print(f"Erro ao capturar artefatos da falha: {e}")
+        return
+    if failure_artifacts.store is not None:
+        # O dicionário é preenchido pela thread de gravação: não é lido aqui
+        print(f"Artefatos da falha em {failure_artifacts.store.root} "
+              f"(python -m utils.artifact_store query --test {item.name} --run {artifact_run_id})")
+        return
+    for kind, path in item.failure_artifacts.items():
+        print(f"Artefato ({kind}) salvo: {path}")
+
+def _artifacts_written(item, paths: dict) -> None:
+    """Chamado pela thread de gravação com os caminhos finais dos artefatos"""
+    if result_sink is not None:
+        result_sink.write_artifacts(item.nodeid, paths)
+    marker_reports = item.config.pluginmanager.get_plugin("marker_reports")
+    if marker_reports is not None and failure_artifacts.store is not None:
+        marker_reports.record_artifacts(item.nodeid, paths)
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook para capturar informações do resultado do teste"""
     outcome = yield
     rep = outcome.get_result()
+    if rep.when == "call":
+        _check_command_budget(item, rep)
     setattr(item, "rep_" + rep.when, rep)
+    # Os artefatos de falha são capturados no teardown do driver; os relatórios linkam os arquivos.
+    # No ArtifactStore os caminhos só existem após a gravação e chegam por _artifacts_written
+    artifacts = getattr(item, "failure_artifacts", None)
+    if rep.when == "teardown" and artifacts is not None and failure_artifacts.store is None:
+        rep.user_properties.append(("artifacts", artifacts))
+    # Cada fase vai para o JSONL assim que termina (sobrevive a uma execução interrompida)
+    if result_sink is not None:
+        result_sink.write_phase(item, rep)
+
+def _check_command_budget(item, rep) -> None:
+    """
+    Registra os comandos WebDriver do teste (setup e call) e reprova o teste que
+    passou do orçamento: @pytest.mark.max_commands(n) > --max-commands
+    """
+    counter = get_listener(getattr(item, "funcargs", {}).get("driver"), CommandCounter)
+    if counter is None:
+        return
+    marker = item.get_closest_marker("max_commands")
+    budget = marker.args[0] if marker else item.config.getoption("--max-commands")
+    command_counts[item.nodeid] = {"commands": counter.total, "budget": budget, "by_command": dict(counter.counts)}
+    if budget is not None and counter.total > budget and rep.passed:
+        rep.outcome = "failed"
+        rep.longrepr = (
+            f"{counter.total} comandos WebDriver para um orçamento de {budget} (max_commands):\n"
+            f"{counter.breakdown()}"
+        )
 
 # Fixtures de dados para testes
 @pytest.fixture
@@ -153,6 +778,6 @@ def invalid_user_data():
     return config.INVALID_USER_DATA.copy()
 
 @pytest.fixture
-def base_url():
+def base_url(app_server):
     """URL base da aplicação"""
-    return config.BASE_URL
+    return app_server
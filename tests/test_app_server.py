@@ -0,0 +1,68 @@
+import socket
+import urllib.request
+import pytest
+from utils.app_server import EmbeddedAppServer
+
+
+@pytest.mark.unit
+class TestEmbeddedAppServer:
+    """Testes do servidor da aplicação embutido no processo do pytest"""
+
+    def test_serves_app_on_free_port(self):
+        """Testa se o servidor responde na porta escolhida e libera a porta ao parar"""
+        server = EmbeddedAppServer()
+        url = server.start()
+        try:
+            assert server.port != 0
+            with urllib.request.urlopen(url + "/formulario", timeout=2) as response:
+                assert response.status == 200
+            assert server.startup_seconds < 5
+        finally:
+            server.stop()
+
+        with pytest.raises(OSError):
+            socket.create_connection(("127.0.0.1", server.port), timeout=0.5)
+
+    def test_independent_instances_do_not_collide(self):
+        """Testa se duas instâncias simultâneas recebem portas diferentes"""
+        first, second = EmbeddedAppServer(), EmbeddedAppServer()
+        try:
+            assert first.start() != second.start()
+        finally:
+            first.stop()
+            second.stop()
+
+
+@pytest.mark.unit
+class TestProductionServer:
+    """Testes do servidor WSGI do modo production"""
+
+    def test_templates_are_compiled_at_startup(self):
+        """Testa se todos os templates ficam compilados em cache antes da primeira requisição"""
+        from app import app
+        from wsgi_server import precompile_templates
+
+        assert precompile_templates(app) == len(app.jinja_env.list_templates())
+        assert app.jinja_env.auto_reload is False
+        assert len(app.jinja_env.cache) >= 3
+
+    def test_pooled_server_handles_concurrent_requests(self):
+        """Testa se o servidor com pool de threads atende requisições simultâneas"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from app import app
+        from wsgi_server import PooledWSGIServer
+
+        server = PooledWSGIServer("127.0.0.1", 0, app, threads=4, backlog=64)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.port}/formulario"
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                statuses = list(executor.map(lambda _: urllib.request.urlopen(url, timeout=5).status, range(16)))
+            assert statuses == [200] * 16
+            assert server.request_queue_size == 64
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=5)
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import time
+import pytest
+from utils.artifact_store import ArtifactStore
+
+
+@pytest.mark.unit
+class TestArtifactStore:
+    """Testes do armazenamento de artefatos endereçado por conteúdo"""
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        """Testa se falhas repetidas com o mesmo screenshot compartilham o blob"""
+        store = ArtifactStore(str(tmp_path))
+        first = store.add("run-1", "tests/test_forms.py::test_a", "screenshot", b"png", "png")
+        second = store.add("run-2", "tests/test_forms.py::test_a", "screenshot", b"png", "png")
+
+        assert first == second and os.path.exists(first)
+        assert store.stats() == {"blobs": 1, "bytes": 3, "references": 2}
+
+    def test_query_by_test_and_run(self, tmp_path):
+        """Testa a consulta do índice por nome do teste e execução"""
+        store = ArtifactStore(str(tmp_path))
+        store.add("run-1", "tests/test_forms.py::test_a", "screenshot", b"a", "png")
+        store.add("run-1", "tests/test_forms.py::test_b", "metadata", b"{}", "json")
+        store.add("run-2", "tests/test_forms.py::test_a", "screenshot", b"a2", "png")
+
+        assert len(store.query(test="test_a")) == 2
+        assert [row["run_id"] for row in store.query(test="test_a", run_id="run-1")] == ["run-1"]
+        assert {run["run_id"] for run in store.runs()} == {"run-1", "run-2"}
+
+    def test_eviction_by_age_and_lru_size(self, tmp_path):
+        """Testa a retenção: primeiro os antigos, depois os menos referenciados até caber no limite"""
+        store = ArtifactStore(str(tmp_path))
+        old = store.add("run-1", "t::old", "screenshot", b"o" * 10, "png")
+        lru = store.add("run-1", "t::lru", "screenshot", b"l" * 10, "png")
+        recent = store.add("run-1", "t::recent", "screenshot", b"r" * 10, "png")
+        now = time.time()
+        with store._connect() as connection:
+            for path, age in ((old, 30 * 86400), (lru, 3600), (recent, 60)):
+                digest = os.path.basename(path).split(".")[0]
+                connection.execute("UPDATE blobs SET last_referenced_at = ? WHERE hash = ?", (now - age, digest))
+
+        assert store.evict(max_bytes=15, max_age_days=14, now=now) == 2
+        assert not os.path.exists(old) and not os.path.exists(lru)
+        assert os.path.exists(recent)
+        assert [row["test"] for row in store.query()] == ["t::recent"]
+
+    def test_connections_are_closed(self, tmp_path, monkeypatch):
+        """Testa se cada operação fecha a conexão com o índice (sem depender do coletor de lixo)"""
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking_connect(*args, **kwargs):
+            connection = connect(*args, **kwargs)
+            opened.append(connection)
+            return connection
+
+        monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+        store = ArtifactStore(str(tmp_path))
+        store.add("run-1", "t::a", "screenshot", b"a", "png")
+        store.query(test="t::a")
+        store.runs()
+        store.stats()
+        store.evict(max_bytes=0)
+
+        assert len(opened) == 7
+        for connection in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
@@ -0,0 +1,81 @@
+import base64
+import gzip
+import json
+import os
+import threading
+import pytest
+from utils.artifacts import ArtifactWriter, capture
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\nfake"
+
+
+class FakeDriver:
+    """Driver falso com screenshot, HTML, URL e logs do console"""
+
+    current_url = "http://127.0.0.1:5001/formulario"
+    page_source = "<html><body>erro</body></html>"
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(PNG_BYTES).decode()
+
+    def get_log(self, kind):
+        return [{"level": "SEVERE", "message": "falha no console"}]
+
+
+class BlockingWriter(ArtifactWriter):
+    """Writer cuja gravação só termina quando o teste libera"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+
+    def _write(self, item, paths):
+        self.release.wait(5)
+        super()._write(item, paths)
+
+
+@pytest.mark.unit
+class TestArtifactPipeline:
+    """Testes do pipeline assíncrono de artefatos de falha"""
+
+    def test_capture_and_background_write(self, tmp_path):
+        """Testa se screenshot, HTML comprimido e metadados são gravados pela thread de fundo"""
+        output_dir = str(tmp_path / "screenshots")
+        writer = ArtifactWriter(output_dir)
+        paths = writer.submit(capture(FakeDriver(), "test_falhou_20240101"))
+        writer.close()
+
+        with open(paths["screenshot"], "rb") as png_file:
+            assert png_file.read() == PNG_BYTES
+        with gzip.open(paths["page_source"], "rt", encoding="utf-8") as html_file:
+            assert "erro" in html_file.read()
+        with open(paths["metadata"], encoding="utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+        assert metadata["url"] == FakeDriver.current_url
+        assert metadata["console_logs"][0]["message"] == "falha no console"
+
+    def test_submit_does_not_wait_for_disk(self, tmp_path):
+        """Testa se o envio retorna antes da gravação terminar"""
+        writer = BlockingWriter(str(tmp_path), max_pending=2)
+        paths = writer.submit(capture(FakeDriver(), "lento"))
+
+        assert not os.path.exists(paths["screenshot"])
+        writer.release.set()
+        writer.flush()
+        assert os.path.exists(paths["screenshot"])
+        writer.close()
+
+    def test_capture_errors_are_recorded(self, tmp_path):
+        """Testa se drivers sem screenshot (ex.: sem navegador) ainda geram HTML e metadados"""
+        class NoScreenshotDriver:
+            current_url = "http://127.0.0.1:5001/"
+            page_source = "<html></html>"
+
+        item = capture(NoScreenshotDriver(), "sem_screenshot")
+        writer = ArtifactWriter(str(tmp_path))
+        paths = writer.submit(item)
+        writer.close()
+
+        assert "screenshot" not in paths
+        assert "screenshot_base64" in item.errors
+        assert os.path.exists(paths["page_source"])
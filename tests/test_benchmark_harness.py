@@ -0,0 +1,34 @@
+import pytest
+from benchmarks.harness import benchmark_protocol, compare, load_baseline, run_trials, summarize, write_results
+
+
+@pytest.mark.unit
+class TestBenchmarkHarness:
+    """Testes dos benchmarks do framework (aquecimento, percentis e baseline)"""
+
+    def test_warmup_trials_are_discarded(self):
+        """Testa se as tentativas de aquecimento rodam mas não entram na medição"""
+        calls, setups = [], []
+        durations = run_trials(lambda: calls.append(1), trials=5, warmup=2, setup=lambda: setups.append(1))
+
+        assert len(durations) == 5
+        assert len(calls) == len(setups) == 7
+
+    def test_regression_against_baseline(self, tmp_path):
+        """Testa a comparação das medianas com o baseline e o limite configurável"""
+        path = str(tmp_path / "baseline.json")
+        write_results(path, {"a": summarize([0.10, 0.10, 0.10]), "b": summarize([0.10])}, trials=3, warmup=1)
+        baseline = load_baseline(path)
+        current = {"a": summarize([0.13, 0.13, 0.13]), "b": summarize([0.11]), "c": summarize([1.0])}
+
+        assert [name for name, _, _ in compare(current, baseline, threshold=0.2)] == ["a"]
+        assert compare(current, baseline, threshold=0.5) == []
+        assert load_baseline(str(tmp_path / "ausente.json")) == {}
+
+    def test_protocol_backend_scenarios(self):
+        """Testa os cenários dos Page Objects sem navegador"""
+        results = {}
+        benchmark_protocol(trials=2, warmup=1, results=results)
+
+        assert "protocol/FormPage.fill_form_and_submit" in results
+        assert all(summary["trials"] == 2 for summary in results.values())
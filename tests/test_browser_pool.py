@@ -0,0 +1,68 @@
+import pytest
+from utils.browser_pool import BrowserPool
+
+
+class FakeDriver:
+    """Driver falso que apenas registra se foi encerrado"""
+
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    """Testes do pool de navegadores reutilizáveis"""
+
+    def test_reuses_browser_after_clean_release(self):
+        """Testa se um navegador devolvido limpo é reutilizado"""
+        pool = BrowserPool(factory=FakeDriver, reset=lambda d: True)
+
+        first = pool.acquire()
+        pool.release(first)
+
+        assert pool.acquire() is first
+        assert pool.created == 1
+
+    def test_discards_browser_after_failure(self):
+        """Testa se o navegador é descartado quando o teste falha"""
+        pool = BrowserPool(factory=FakeDriver, reset=lambda d: True)
+
+        first = pool.acquire()
+        pool.release(first, discard=True)
+
+        assert first.closed
+        assert pool.acquire() is not first
+
+    def test_recycles_after_max_uses(self):
+        """Testa se o navegador é recriado após N usos"""
+        pool = BrowserPool(factory=FakeDriver, max_uses=2, reset=lambda d: True)
+
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+
+        assert first.closed
+        assert pool.recycled == 1
+
+    def test_discards_browser_when_reset_fails(self):
+        """Testa se o navegador é descartado quando a limpeza de estado falha"""
+        pool = BrowserPool(factory=FakeDriver, reset=lambda d: False)
+
+        first = pool.acquire()
+        pool.release(first)
+
+        assert first.closed
+
+    def test_close_quits_idle_browsers(self):
+        """Testa se o encerramento do pool fecha os navegadores ociosos"""
+        pool = BrowserPool(factory=FakeDriver, reset=lambda d: True)
+
+        first = pool.acquire()
+        pool.release(first)
+        pool.close()
+
+        assert first.closed
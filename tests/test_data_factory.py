@@ -0,0 +1,49 @@
+import pytest
+import utils.data_factory as data_factory
+from utils.data_factory import DataFactory, worker_index
+
+
+@pytest.mark.unit
+class TestGenerateUsers:
+    """Testes da geração de usuários em lote"""
+
+    def test_same_seed_reproduces_batch(self):
+        """Testa se a mesma semente gera os mesmos usuários"""
+        first = DataFactory.generate_users(500, seed=42, worker_id="gw0")
+        second = DataFactory.generate_users(500, seed=42, worker_id="gw0")
+
+        assert first.records() == second.records()
+        assert first.records() != DataFactory.generate_users(500, seed=43, worker_id="gw0").records()
+
+    def test_emails_unique_across_workers_and_batches(self):
+        """Testa a unicidade dos emails entre workers e entre faixas de números de série"""
+        emails = []
+        for worker_id in ("gw0", "gw1", "gw7"):
+            emails += DataFactory.generate_users(2000, seed=7, worker_id=worker_id).emails()
+        emails += DataFactory.generate_users(2000, seed=7, worker_id="gw0", start=2000).emails()
+
+        assert len(set(emails)) == len(emails) == 8000
+        assert all(email.endswith("@teste.com") for email in emails)
+
+    def test_columnar_access_matches_rows(self):
+        """Testa se as colunas e o acesso por linha trazem os mesmos dados"""
+        users = DataFactory.generate_users(50, seed=1)
+
+        assert len(users) == 50
+        assert [user["email"] for user in users] == users.emails()
+        assert users[3]["name"] == users.names()[3]
+
+    def test_same_output_without_numpy(self, monkeypatch):
+        """Testa se o caminho sem numpy gera exatamente os mesmos usuários"""
+        expected = DataFactory.generate_users(300, seed=5, worker_id=2).records()
+        monkeypatch.setattr(data_factory, "np", None)
+
+        assert DataFactory.generate_users(300, seed=5, worker_id=2).records() == expected
+
+    def test_worker_index_from_id_and_environment(self, monkeypatch):
+        """Testa o índice do worker a partir do id ou das variáveis de ambiente"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.setenv("TEST_WORKER_ID", "gw5")
+
+        assert worker_index("gw12") == 12
+        assert worker_index() == 5
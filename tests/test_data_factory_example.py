@@ -46,19 +46,30 @@ class TestDataFactory:
         assert form_page.is_on_form_page()
         assert form_page.has_error_message()
     
-    def test_multiple_random_users(self, driver):
-        """Testa múltiplos usuários com dados aleatórios"""
+    def test_multiple_random_users(self, row_runner, user_rows):
+        """
+        Testa múltiplos usuários em um único navegador: cada linha é um sub-resultado.
+        Com --rows-dataset as linhas vêm de um dataset (qualquer tamanho)
+        """
+        summary = row_runner.run(user_rows)
+        
+        assert summary.total > 0
+        assert summary.failed == 0, summary.describe()
+        print(f"{summary.passed} usuários cadastrados a partir da linha {summary.start}")
+    
+    @pytest.mark.fill_mode("fast")
+    def test_form_with_long_strings(self, driver):
+        """Testa envio com textos muito longos usando o preenchimento rápido"""
+        long_strings = DataFactory.generate_long_strings()
+        
         form_page = FormPage(driver)
         success_page = SuccessPage(driver)
         
-        for i in range(3):
-            user_data = DataFactory.generate_valid_user_data()
-            
-            form_page.navigate()
-            form_page.fill_form_and_submit(
-                user_data["name"], 
-                user_data["email"]
-            )
-            
-            assert success_page.is_on_success_page()
-            print(f"Usuário {i+1} cadastrado: {user_data['name']} - {user_data['email']}")
+        form_page.navigate()
+        form_page.fill_form({
+            "name": long_strings["very_long_name"],
+            "email": long_strings["very_long_email"],
+        })
+        form_page.click_submit()
+        
+        assert success_page.is_on_success_page()
@@ -0,0 +1,59 @@
+import pytest
+from utils.datasets import Dataset, DatasetError, build_users, loaded_datasets, open_dataset, write_dataset
+
+
+@pytest.mark.unit
+class TestDatasets:
+    """Testes do formato de dataset lido via mmap"""
+
+    def test_round_trip_with_unicode_and_empty_values(self, tmp_path):
+        """Testa se os registros gravados são lidos iguais, inclusive acentos e vazios"""
+        path = str(tmp_path / "dados.tds")
+        records = [{"name": "João Silva", "email": "joao@teste.com"}, {"name": "", "email": None}]
+        content_hash = write_dataset(path, records, metadata={"source": "teste"})
+
+        with Dataset(path) as dataset:
+            assert len(dataset) == 2
+            assert dataset[0] == records[0]
+            assert dataset[-1] == {"name": "", "email": ""}
+            assert dataset.sha256 == content_hash and dataset.verify()
+            assert dataset.metadata == {"source": "teste"}
+
+    def test_workers_read_disjoint_slices(self, tmp_path):
+        """Testa se as fatias dos workers cobrem o dataset sem sobreposição"""
+        path = str(tmp_path / "users.tds")
+        build_users(path, 1001, seed=3)
+
+        with Dataset(path) as dataset:
+            shards = [dataset.shard(index, 4) for index in range(4)]
+            emails = [row["email"] for shard in shards for row in dataset.rows(shard.start, shard.stop)]
+            assert len(emails) == len(set(emails)) == 1001
+            assert dataset.metadata["seed"] == 3
+
+    def test_hash_tracks_content_and_open_is_recorded(self, tmp_path):
+        """Testa se o hash muda com o conteúdo e se os datasets abertos são registrados"""
+        first = write_dataset(str(tmp_path / "a.tds"), [{"name": "a"}])
+        second = write_dataset(str(tmp_path / "b.tds"), [{"name": "b"}])
+        assert first != second
+        assert write_dataset(str(tmp_path / "c.tds"), [{"name": "a"}]) == first
+
+        open_dataset(str(tmp_path / "a.tds")).close()
+        assert loaded_datasets.pop(str(tmp_path / "a.tds")) == first
+
+    def test_rejects_other_files(self, tmp_path):
+        """Testa a recusa de arquivos que não são datasets"""
+        path = tmp_path / "outro.tds"
+        path.write_bytes(b"not a dataset at all")
+        with pytest.raises(DatasetError):
+            Dataset(str(path))
+
+    @pytest.mark.parametrize("content", [b"", b"TD", None], ids=["vazio", "curto", "truncado"])
+    def test_rejects_empty_and_truncated_files(self, tmp_path, content):
+        """Testa se arquivos vazios, menores que o cabeçalho ou truncados levantam DatasetError"""
+        path = tmp_path / "dados.tds"
+        if content is None:
+            write_dataset(str(path), [{"name": "João Silva", "email": "joao@email.com"}] * 10)
+            content = path.read_bytes()[:-5]
+        path.write_bytes(content)
+        with pytest.raises(DatasetError):
+            Dataset(str(path))
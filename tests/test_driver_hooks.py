@@ -0,0 +1,98 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from utils.driver_hooks import CommandCounter, ImplicitWaitMonitor, get_listener, install_command_hooks
+from utils.waits import WAIT_COMMAND, WaitEngine
+
+
+class FakeDriver:
+    """Driver falso cujo execute falha nas buscas de elementos ausentes"""
+
+    def execute(self, command, params=None):
+        if command == "findElement" and params["value"] == "ausente":
+            raise NoSuchElementException("ausente")
+        return {"value": None}
+
+    def execute_async_script(self, script, *args):
+        return self.execute("executeAsyncScript", {"script": script, "args": list(args)})
+
+
+@pytest.mark.unit
+class TestImplicitWaitMonitor:
+    """Testes da medição de tempo bloqueado em esperas implícitas"""
+
+    def test_failed_find_counts_as_blocked_with_implicit_wait(self):
+        """Testa se buscas que falham com espera implícita ativa são contabilizadas"""
+        driver = FakeDriver()
+        monitor = install_command_hooks(driver).add(ImplicitWaitMonitor())
+
+        driver.execute("setTimeouts", {"implicit": 10000})
+        with pytest.raises(NoSuchElementException):
+            driver.execute("findElement", {"using": "id", "value": "ausente"})
+        driver.execute("findElement", {"using": "id", "value": "presente"})
+
+        assert monitor.implicit_wait == 10
+        assert monitor.blocked_finds == 1
+
+    def test_failed_find_without_implicit_wait_is_not_blocked(self):
+        """Testa se buscas sem espera implícita não são contabilizadas"""
+        driver = FakeDriver()
+        monitor = install_command_hooks(driver).add(ImplicitWaitMonitor())
+
+        with pytest.raises(NoSuchElementException):
+            driver.execute("findElement", {"using": "id", "value": "ausente"})
+
+        assert monitor.blocked_finds == 0
+
+    def test_hooks_are_installed_once(self):
+        """Testa se reinstalar os ganchos reutiliza os existentes"""
+        driver = FakeDriver()
+        hooks = install_command_hooks(driver)
+        monitor = hooks.add(ImplicitWaitMonitor())
+
+        assert install_command_hooks(driver) is hooks
+        assert get_listener(driver, ImplicitWaitMonitor) is monitor
+
+
+@pytest.mark.unit
+class TestCommandCounter:
+    """Testes da contagem de comandos WebDriver usada nos orçamentos por teste"""
+
+    def test_counts_commands_by_type_including_failures(self):
+        """Testa a contagem por tipo, inclusive de comandos que falharam"""
+        driver = FakeDriver()
+        counter = install_command_hooks(driver).add(CommandCounter())
+
+        driver.execute("findElement", {"using": "id", "value": "presente"})
+        with pytest.raises(NoSuchElementException):
+            driver.execute("findElement", {"using": "id", "value": "ausente"})
+        driver.execute("executeScript", {"script": "", "args": []})
+
+        assert counter.total == 3
+        assert counter.breakdown() == "  findElement: 2\n  executeScript: 1"
+
+    def test_reset_between_tests(self):
+        """Testa se a contagem é zerada no início de cada teste"""
+        driver = FakeDriver()
+        counter = install_command_hooks(driver).add(CommandCounter())
+        driver.execute("getTitle")
+        counter.reset()
+
+        assert counter.total == 0 and counter.counts == {}
+
+    def test_wait_counts_as_one_command_regardless_of_polls(self):
+        """Testa se uma espera conta um comando, não importa quantas verificações a página exigiu"""
+        driver = FakeDriver()
+        counter = install_command_hooks(driver).add(CommandCounter())
+        engine = WaitEngine(driver, timeout=5, poll_interval=0.01)
+
+        for polls in (1, 5):
+            calls = []
+
+            def ready(d):
+                calls.append(d.execute("findElement", {"using": "id", "value": "presente"}))
+                return len(calls) >= polls
+
+            engine.until(ready)
+        driver.execute("getTitle")
+
+        assert counter.counts == {WAIT_COMMAND: 2, "getTitle": 1}
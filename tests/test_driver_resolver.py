@@ -0,0 +1,66 @@
+import json
+import os
+import stat
+import pytest
+from utils.driver_resolver import DriverResolver
+
+
+def _fake_binary(directory, name="chromedriver"):
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestDriverResolver:
+    """Testes da resolução de drivers com manifest local"""
+
+    @pytest.fixture(autouse=True)
+    def browser_version(self, monkeypatch):
+        monkeypatch.setattr(DriverResolver, "detect_browser_version", staticmethod(lambda browser: "126.0.6478"))
+
+    def test_manifest_hit_does_not_download(self, tmp_path, monkeypatch):
+        """Testa se um binário em cache é usado sem acessar a rede"""
+        binary = _fake_binary(tmp_path)
+        (tmp_path / "drivers.json").write_text(json.dumps({"chrome:126.0.6478": {"path": binary}}))
+
+        def fail_download(browser):
+            raise AssertionError("não deveria baixar o driver")
+        monkeypatch.setattr(DriverResolver, "_download", staticmethod(fail_download))
+
+        resolver = DriverResolver(str(tmp_path))
+        assert resolver.resolve("chrome") == binary
+        assert resolver.timings["chrome"][1] == "manifest"
+
+    def test_download_is_recorded_and_memoized(self, tmp_path, monkeypatch):
+        """Testa se o download é feito uma única vez e registrado no manifest"""
+        binary = _fake_binary(tmp_path)
+        calls = []
+        monkeypatch.setattr(DriverResolver, "_download", staticmethod(lambda browser: calls.append(browser) or binary))
+
+        resolver = DriverResolver(str(tmp_path / "cache"))
+        resolver.resolve("chrome")
+        resolver.resolve("chrome")
+
+        assert calls == ["chrome"]
+        manifest = json.loads((tmp_path / "cache" / "drivers.json").read_text())
+        assert manifest["chrome:126.0.6478"]["path"] == binary
+
+    def test_offline_falls_back_to_path(self, tmp_path, monkeypatch):
+        """Testa se o modo offline usa o driver do PATH em vez de baixar"""
+        binary = _fake_binary(tmp_path, "geckodriver")
+        monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ.get("PATH", ""))
+
+        resolver = DriverResolver(str(tmp_path / "cache"), offline=True)
+
+        assert resolver.resolve("firefox") == binary
+        assert resolver.timings["firefox"][1] == "PATH"
+
+    def test_cache_dir_expands_home(self, tmp_path, monkeypatch):
+        """Testa se o "~" em DRIVER_CACHE_DIR é expandido para a pasta do usuário"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        resolver = DriverResolver("~/.cache/selenium-tests", offline=True)
+
+        assert resolver.cache_dir == str(tmp_path / ".cache" / "selenium-tests")
+        assert resolver.manifest_path == str(tmp_path / ".cache" / "selenium-tests" / "drivers.json")
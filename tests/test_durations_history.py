@@ -0,0 +1,39 @@
+import pytest
+from utils.test_durations import DurationHistory, split_into_shards
+
+
+@pytest.mark.unit
+class TestDurationSharding:
+    """Testes do histórico de durações e da divisão balanceada em shards"""
+
+    def test_longest_first_balances_shards(self):
+        """Testa se a estratégia maior-primeiro equilibra a carga entre os shards"""
+        estimates = [("a", 1.0), ("b", 8.0), ("c", 3.0), ("d", 4.0), ("e", 2.0)]
+
+        shards = split_into_shards(estimates, 2)
+        loads = [sum(dict(estimates)[nodeid] for nodeid in shard) for shard in shards]
+
+        assert sorted(loads) == [9.0, 9.0]
+        assert sorted(nodeid for shard in shards for nodeid in shard) == ["a", "b", "c", "d", "e"]
+
+    def test_unknown_tests_use_median_estimate(self, tmp_path):
+        """Testa se testes sem histórico recebem a mediana das durações conhecidas"""
+        history = DurationHistory(str(tmp_path / "durations.json"))
+        history.record("a", 1.0)
+        history.record("b", 3.0)
+        history.record("c", 10.0)
+
+        assert history.estimate("novo") == 3.0
+
+    def test_worker_parts_are_merged_on_load(self, tmp_path):
+        """Testa se as durações gravadas pelos workers são lidas na próxima execução"""
+        path = str(tmp_path / "durations.json")
+        worker = DurationHistory(path, worker_id="gw0")
+        worker.record("a", 2.0)
+        worker.save()
+
+        history = DurationHistory(path).load()
+        assert history.get("a") == 2.0
+
+        history.consolidate()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["durations.json"]
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from benchmarks.load import ConnectionPool, HttpConnection, LoadTest, build_payloads, expects_redirect
+from benchmarks.stats import percentile
+from utils.app_server import EmbeddedAppServer
+
+
+async def start_server(delay=0.0):
+    """Servidor que responde um pedido por conexão e a fecha sem avisar (keep-alive expirado)"""
+    async def handle(reader, writer):
+        while (await reader.readline()).strip():
+            pass
+        await asyncio.sleep(delay)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.unit
+class TestLoadHarness:
+    """Testes do gerador de carga do fluxo do formulário"""
+
+    def test_percentile_nearest_rank(self):
+        """Testa o cálculo de percentis pelo método nearest-rank"""
+        ordered = [i / 1000 for i in range(1, 101)]
+        assert percentile(ordered, 50) == 0.05
+        assert percentile(ordered, 99) == 0.099
+        assert percentile([], 95) == 0.0
+
+    def test_payloads_follow_app_validation(self):
+        """Testa se os payloads inválidos vazios não esperam redirecionamento"""
+        payloads = build_payloads(200, invalid_ratio=1.0, seed=7)
+        assert any(not expects_redirect(payload) for payload in payloads)
+        assert all(expects_redirect(payload) for payload in build_payloads(20, invalid_ratio=0.0))
+
+    def test_short_run_reports_routes_without_errors(self):
+        """Testa uma execução curta contra a aplicação embutida"""
+        server = EmbeddedAppServer()
+        try:
+            load_test = LoadTest(server.start(), concurrency=4, duration=0.3,
+                                 payloads=build_payloads(50, 0.3, seed=1))
+            result = asyncio.run(load_test.run())
+        finally:
+            server.stop()
+
+        assert result["flows"]["requests"] > 0
+        assert result["flows"]["error_rate"] == 0.0
+        assert {"GET /formulario", "POST /formulario", "GET /sucesso"} <= set(result["routes"])
+
+    def test_closed_keep_alive_connection_is_reopened_once(self):
+        """Testa se a conexão ociosa fechada pelo servidor é reaberta em vez de virar erro"""
+        async def scenario():
+            server, port = await start_server()
+            connection = HttpConnection("127.0.0.1", port)
+            statuses = [(await connection.request("GET", "/"))[0] for _ in range(3)]
+            await connection.close()
+            server.close()
+            return statuses, connection.reconnects
+
+        statuses, reconnects = asyncio.run(scenario())
+
+        assert statuses == [200, 200, 200]
+        assert reconnects == 2
+
+    def test_latency_includes_wait_for_pool_connection(self):
+        """Testa se o tempo esperando uma conexão livre entra na latência (sem coordinated omission)"""
+        async def scenario():
+            server, port = await start_server(delay=0.1)
+            load_test = LoadTest(f"http://127.0.0.1:{port}", concurrency=1, duration=0)
+            pool = ConnectionPool("127.0.0.1", port, size=1)
+            await asyncio.gather(*(load_test._timed(pool, "GET /", "GET", "/") for _ in range(3)))
+            await pool.close()
+            server.close()
+            return load_test.routes["GET /"]
+
+        stats = asyncio.run(scenario())
+
+        assert stats.errors == 0
+        assert max(stats.latencies) >= 0.3
@@ -0,0 +1,81 @@
+import json
+import subprocess
+import sys
+import pytest
+from types import SimpleNamespace
+from utils.marker_reports import EXIT_INTERRUPTED, EXIT_OK, MarkerReportPlugin
+
+SAMPLE_TESTS = """\
+import pytest
+
+def test_outside_group():
+    assert False
+
+@pytest.mark.smoke
+def test_in_group():
+    pass
+"""
+
+
+def make_report(nodeid, when, outcome="passed"):
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, duration=0.1, user_properties=[],
+        failed=outcome == "failed", skipped=outcome == "skipped", longreprtext="",
+    )
+
+
+def make_session(**markers):
+    return SimpleNamespace(items=[
+        SimpleNamespace(nodeid=nodeid, iter_markers=lambda names=names: [SimpleNamespace(name=name) for name in names])
+        for nodeid, names in markers.items()
+    ])
+
+
+def read_exit_code(output_dir, group):
+    with open(output_dir / f"{group}-results.json", encoding="utf-8") as results_file:
+        return json.load(results_file)["exit_code"]
+
+
+@pytest.mark.unit
+class TestMarkerReports:
+    """Testes dos relatórios por marcador de uma única execução"""
+
+    def test_group_that_did_not_run_completely_is_incomplete(self, tmp_path):
+        """Testa se um grupo com testes que não rodaram não é dado como aprovado"""
+        plugin = MarkerReportPlugin(["smoke"], str(tmp_path))
+        plugin.pytest_collection_finish(make_session(outside=[], first=["smoke"], second=["smoke"]))
+        for when in ("setup", "call", "teardown"):
+            plugin.pytest_runtest_logreport(make_report("first", when))
+
+        plugin.pytest_sessionfinish(session=None, exitstatus=0)
+
+        assert read_exit_code(tmp_path, "smoke") == EXIT_INTERRUPTED
+
+    def test_artifacts_written_in_background_are_linked(self, tmp_path):
+        """Testa se os caminhos entregues pela thread de gravação entram no relatório do grupo"""
+        plugin = MarkerReportPlugin(["smoke"], str(tmp_path))
+        plugin.pytest_collection_finish(make_session(first=["smoke"]))
+        plugin.pytest_runtest_logreport(make_report("first", "call", "failed"))
+        artifacts = {"screenshot": str(tmp_path / "blobs" / "ab.png")}
+
+        plugin.record_artifacts("first", artifacts)
+        artifacts["page_source"] = "depois"
+        plugin.pytest_sessionfinish(session=None, exitstatus=1)
+
+        with open(tmp_path / "smoke-results.json", encoding="utf-8") as results_file:
+            test = json.load(results_file)["tests"][0]
+        assert test["artifacts"] == {"screenshot": "blobs/ab.png"}
+
+    def test_failure_outside_group_does_not_stop_the_group(self, tmp_path):
+        """Testa se, mesmo com --maxfail=1, uma falha fora do grupo deixa o grupo com código 0"""
+        (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+        output_dir = tmp_path / "reports"
+        subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "tests.conftest", "-p", "no:cacheprovider",
+             str(tmp_path / "test_sample.py"), "--maxfail=1", "--results-dir=",
+             "--marker-reports=smoke", f"--marker-reports-dir={output_dir}"],
+            capture_output=True, text=True,
+        )
+
+        assert read_exit_code(output_dir, "smoke") == EXIT_OK
+        assert read_exit_code(output_dir, "full") == 1
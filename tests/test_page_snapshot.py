@@ -0,0 +1,84 @@
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, JavascriptException
+from pages.form_page import FormPage
+
+
+class ScriptDriver:
+    """Driver falso que responde ao script de snapshot e conta as chamadas"""
+
+    def __init__(self, present):
+        self.present = present
+        self.calls = 0
+
+    def execute_script(self, script, queries):
+        self.calls += 1
+        return {
+            "title": "Formulário de Teste",
+            "url": "http://127.0.0.1:5001/formulario",
+            "elements": [
+                {"present": value in self.present, "visible": value in self.present,
+                 "text": "", "attributes": {}, "count": int(value in self.present)}
+                for _, value, _ in queries
+            ],
+        }
+
+
+def raising(error):
+    """execute_script falso que sempre levanta o erro informado"""
+    def execute_script(script, *args):
+        raise error
+    return execute_script
+
+
+@pytest.mark.unit
+class TestPageSnapshot:
+    """Testes do snapshot de vários locators em uma única chamada"""
+
+    def test_verify_page_elements_uses_single_round_trip(self):
+        """Testa se a verificação dos elementos faz uma única chamada ao navegador"""
+        driver = ScriptDriver(present={"nome", "email", "botao-enviar"})
+        form_page = FormPage(driver, base_url="http://127.0.0.1:5001")
+
+        assert form_page.verify_page_elements()
+        assert driver.calls == 1
+
+    def test_verification_waits_for_elements_rendered_after_redirect(self):
+        """Testa se a verificação espera os elementos que aparecem um pouco depois (como antes do snapshot)"""
+        driver = ScriptDriver(present={"nome", "email"})
+        form_page = FormPage(driver, base_url="http://127.0.0.1:5001")
+        form_page.wait.poll_interval = 0.01
+        snapshot = driver.execute_script
+
+        def render_later(script, queries):
+            if driver.calls == 2:
+                driver.present.add("botao-enviar")
+            return snapshot(script, queries)
+
+        driver.execute_script = render_later
+
+        assert form_page.verify_page_elements()
+        assert driver.calls == 3
+
+    def test_missing_element_fails_verification(self):
+        """Testa se a ausência de um elemento obrigatório é detectada"""
+        driver = ScriptDriver(present={"nome", "email"})
+        form_page = FormPage(driver, base_url="http://127.0.0.1:5001")
+
+        snapshot = form_page.snapshot(FormPage.REQUIRED_ELEMENTS)
+
+        assert not snapshot.all_present()
+        assert not snapshot.is_present(FormPage.SUBMIT_BUTTON)
+        assert snapshot.is_present(FormPage.NAME_INPUT)
+        assert form_page.is_on_form_page()
+
+    def test_presence_check_propagates_driver_errors(self):
+        """Testa se só erros de busca/script contam como ausência; sessão encerrada é propagada"""
+        driver = ScriptDriver(present=set())
+        form_page = FormPage(driver, base_url="http://127.0.0.1:5001")
+
+        driver.execute_script = raising(JavascriptException("document unloaded"))
+        assert not form_page.is_element_present(FormPage.ERROR_MESSAGE)
+
+        driver.execute_script = raising(InvalidSessionIdException("sessão encerrada"))
+        with pytest.raises(InvalidSessionIdException):
+            form_page.is_element_present(FormPage.ERROR_MESSAGE)
@@ -0,0 +1,65 @@
+import json
+import pytest
+from pages.form_page import FormPage
+from utils.page_timing import Histogram, page_timer
+
+
+class NavigationDriver:
+    """Driver falso que apenas registra as URLs abertas"""
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+@pytest.fixture
+def timer():
+    """Liga a medição apenas durante o teste"""
+    previous = page_timer.enabled, page_timer.current_test
+    page_timer.reset()
+    page_timer.enabled, page_timer.current_test = True, "tests/test_x.py::test_a"
+    yield page_timer
+    page_timer.enabled, page_timer.current_test = previous
+    page_timer.reset()
+
+
+@pytest.mark.unit
+class TestPageTiming:
+    """Testes da medição de tempo dos métodos dos Page Objects"""
+
+    def test_methods_are_timed_per_operation_and_test(self, timer):
+        """Testa se os métodos da subclasse e da BasePage entram nos histogramas"""
+        form_page = FormPage(NavigationDriver(), base_url="http://127.0.0.1:5001")
+        form_page.navigate()
+        form_page.navigate()
+
+        assert timer.operations["FormPage.navigate"].count == 2
+        assert timer.operations["BasePage.navigate_to"].count == 2
+        assert timer.tests["tests/test_x.py::test_a"]["FormPage.navigate"].count == 2
+        assert timer.top(1)[0][1].count == 2
+
+    def test_disabled_timer_records_nothing(self, timer):
+        """Testa se a medição pode ser desligada em tempo de execução"""
+        timer.enabled = False
+        FormPage(NavigationDriver(), base_url="http://127.0.0.1:5001").navigate()
+
+        assert timer.operations == {}
+
+    def test_histogram_percentiles_and_export(self, timer, tmp_path):
+        """Testa os percentis pelos baldes logarítmicos e a exportação em JSON"""
+        histogram = Histogram()
+        for seconds in [0.001] * 90 + [0.5] * 10:
+            histogram.add(seconds)
+
+        assert histogram.percentile(0.5) == 0.001
+        assert 0.5 <= histogram.percentile(0.95) <= 0.512
+        assert histogram.to_dict()["buckets"] == {"<=1ms": 90, "<=512ms": 10}
+
+        timer.record("BasePage.fill_field", 0.02)
+        path = tmp_path / "page-timings.json"
+        timer.export(str(path))
+        exported = json.loads(path.read_text(encoding="utf-8"))
+        assert exported["operations"]["BasePage.fill_field"]["count"] == 1
+        assert "tests/test_x.py::test_a" in exported["tests"]
@@ -0,0 +1,93 @@
+import pytest
+from flask import Flask, request
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.home_page import HomePage
+from pages.success_page import SuccessPage
+from utils.protocol_driver import ProtocolDriver
+
+BASE_URL = "http://127.0.0.1:5001"
+
+
+def make_search_app() -> Flask:
+    """Aplicação com um formulário GET que devolve os parâmetros recebidos"""
+    search_app = Flask(__name__)
+
+    @search_app.route("/busca")
+    def search():
+        received = "".join(f'<li id="{key}">{value}</li>' for key, value in request.args.items())
+        return (
+            '<html><body><form action="/busca" method="get">'
+            '<input type="text" id="q" name="q"><input type="text" id="filtro" name="filtro">'
+            '<button type="submit">Buscar</button></form>'
+            f"<ul>{received}</ul></body></html>"
+        )
+
+    return search_app
+
+
+@pytest.mark.unit
+class TestProtocolDriver:
+    """Testes do driver sem navegador sobre a aplicação Flask"""
+
+    def test_valid_submission_follows_redirect(self):
+        """Testa se o envio válido segue o redirecionamento para /sucesso"""
+        driver = ProtocolDriver()
+        form_page = FormPage(driver, base_url=BASE_URL)
+        form_page.navigate()
+        form_page.fill_form_and_submit("João Silva", "joao@email.com")
+
+        success_page = SuccessPage(driver, base_url=BASE_URL)
+        assert driver.current_url == f"{BASE_URL}/sucesso"
+        assert success_page.is_on_success_page()
+
+    def test_server_validation_error_is_rendered(self):
+        """Testa se a mensagem de erro do servidor é lida do HTML"""
+        driver = ProtocolDriver()
+        form_page = FormPage(driver, base_url=BASE_URL)
+        form_page.navigate()
+        form_page.fill_form_and_submit("", "joao@email.com")
+
+        assert form_page.has_error_message()
+        assert "nome é obrigatório" in form_page.get_error_message()
+
+    def test_invalid_email_blocks_submission(self):
+        """Testa se o e-mail inválido é barrado como na validação nativa do navegador"""
+        driver = ProtocolDriver()
+        form_page = FormPage(driver, base_url=BASE_URL)
+        form_page.navigate()
+        form_page.fill_form_and_submit("João Silva", "email_sem_arroba")
+
+        assert driver.current_url == f"{BASE_URL}/formulario"
+        assert not form_page.has_error_message()
+
+    def test_link_navigation(self):
+        """Testa se o clique em link navega para o destino"""
+        driver = ProtocolDriver()
+        home_page = HomePage(driver, base_url=BASE_URL)
+        home_page.navigate()
+        driver.find_element(By.TAG_NAME, "a").click()
+
+        assert driver.current_url == f"{BASE_URL}/formulario"
+
+    def test_css_selector_and_missing_element(self):
+        """Testa seletores CSS simples e a exceção de elemento ausente"""
+        driver = ProtocolDriver()
+        driver.get(f"{BASE_URL}/formulario")
+
+        assert len(driver.find_elements(By.CSS_SELECTOR, "form input[name=nome], #email")) == 2
+        with pytest.raises(NoSuchElementException):
+            driver.find_element(By.ID, "mensagem-erro")
+
+    def test_get_form_encodes_special_characters(self):
+        """Testa se o formulário GET codifica espaços, &, =, # e acentos na query string"""
+        driver = ProtocolDriver(make_search_app())
+        driver.get(f"{BASE_URL}/busca")
+        driver.find_element(By.ID, "q").send_keys("João Silva & Cia = #1")
+        driver.find_element(By.ID, "filtro").send_keys("ação")
+        driver.find_element(By.TAG_NAME, "button").click()
+
+        assert driver.find_element(By.CSS_SELECTOR, "li#q").text == "João Silva & Cia = #1"
+        assert driver.find_element(By.CSS_SELECTOR, "li#filtro").text == "ação"
+        assert "#" not in driver.current_url
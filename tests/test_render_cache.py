@@ -0,0 +1,60 @@
+import pytest
+from app import app, page_cache
+
+
+@pytest.fixture
+def client():
+    page_cache.clear()
+    return app.test_client()
+
+
+@pytest.mark.unit
+class TestRenderCache:
+    """Testes do cache de páginas renderizadas com ETag/304"""
+
+    def test_get_sends_strong_etag_and_cache_control(self, client):
+        """Testa se as páginas estáticas têm ETag forte e Cache-Control"""
+        response = client.get("/formulario")
+
+        assert response.status_code == 200
+        etag, weak = response.get_etag()
+        assert etag and not weak
+        assert response.headers["Cache-Control"] == "public, no-cache"
+
+    def test_conditional_request_returns_304(self, client):
+        """Testa se o If-None-Match com a ETag atual recebe 304 sem corpo"""
+        etag = client.get("/").headers["ETag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_page_is_rendered_once_per_context(self, client):
+        """Testa se cada combinação de template e contexto é renderizada uma única vez"""
+        misses = page_cache.misses
+        for _ in range(3):
+            client.get("/sucesso")
+            client.post("/formulario", data={"nome": "", "email": "a@b.com"})
+
+        assert page_cache.misses == misses + 2
+        assert "obrigatório" in client.post("/formulario", data={"nome": "", "email": ""}).get_data(as_text=True)
+
+    def test_post_is_never_answered_with_304(self, client):
+        """Testa se o envio do formulário com erro não vira 304"""
+        etag = client.post("/formulario", data={"nome": "", "email": ""}).headers["ETag"]
+        response = client.post("/formulario", data={"nome": "", "email": ""}, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+
+    def test_template_change_invalidates_cache_in_debug(self, client, monkeypatch):
+        """Testa se a alteração do arquivo do template invalida o cache com auto_reload"""
+        monkeypatch.setattr(app.jinja_env, "auto_reload", True)
+        mtimes = iter([1.0, 1.0, 2.0])
+        monkeypatch.setattr(page_cache, "_template_mtime", lambda template: next(mtimes))
+
+        client.get("/sucesso")
+        misses = page_cache.misses
+        client.get("/sucesso")
+        assert page_cache.misses == misses
+        client.get("/sucesso")
+        assert page_cache.misses == misses + 1
@@ -0,0 +1,71 @@
+import json
+import os
+import pytest
+from types import SimpleNamespace
+from utils.result_sink import ResultSink, fold_records, merge, read_records
+
+
+def make_report(nodeid, when, outcome="passed", duration=0.1, message=""):
+    """TestReport mínimo com os atributos usados pelo sink"""
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, outcome=outcome, duration=duration, stop=0.0,
+        failed=outcome == "failed", skipped=outcome == "skipped", longreprtext=message,
+    )
+
+
+def make_item(*markers):
+    return SimpleNamespace(iter_markers=lambda: [SimpleNamespace(name=name) for name in markers])
+
+
+@pytest.mark.unit
+class TestResultSink:
+    """Testes dos resultados em JSONL e do relatório mesclado"""
+
+    def test_each_phase_is_on_disk_immediately(self, tmp_path):
+        """Testa se cada fase é gravada (flush) antes do fim da sessão"""
+        sink = ResultSink(str(tmp_path / "gw0.jsonl"), run_id="run-1", worker_id="gw0")
+        sink.write_phase(make_item("smoke"), make_report("t::a", "setup"))
+
+        records = list(read_records(sink.path))
+        assert [record["type"] for record in records] == ["session", "phase"]
+        assert records[1]["markers"] == ["smoke"] and records[1]["worker"] == "gw0"
+        sink.close()
+
+    def test_fold_phases_and_artifacts(self):
+        """Testa a combinação das fases: falha no call, erro no teardown e artefatos linkados"""
+        records = [
+            {"type": "phase", "nodeid": "t::a", "when": "setup", "outcome": "passed", "duration": 0.1},
+            {"type": "phase", "nodeid": "t::a", "when": "call", "outcome": "failed", "duration": 1.0, "message": "boom"},
+            {"type": "phase", "nodeid": "t::a", "when": "teardown", "outcome": "passed", "duration": 0.1},
+            {"type": "artifacts", "nodeid": "t::a", "artifacts": {"screenshot": "/tmp/a.png"}},
+            {"type": "phase", "nodeid": "t::b", "when": "setup", "outcome": "passed", "duration": 0.1},
+            {"type": "phase", "nodeid": "t::b", "when": "call", "outcome": "passed", "duration": 0.1},
+            {"type": "phase", "nodeid": "t::b", "when": "teardown", "outcome": "failed", "duration": 0.1},
+        ]
+        tests = {test["nodeid"]: test for test in fold_records(records)}
+
+        assert tests["t::a"]["outcome"] == "failed" and tests["t::a"]["message"] == "boom"
+        assert tests["t::a"]["artifacts"] == {"screenshot": "/tmp/a.png"}
+        assert tests["t::a"]["duration"] == pytest.approx(1.2)
+        assert tests["t::b"]["outcome"] == "error"
+
+    def test_merge_survives_killed_shard(self, tmp_path):
+        """Testa o merge de dois shards, um deles interrompido no meio de um teste e de uma linha"""
+        first = ResultSink(str(tmp_path / "gw0.jsonl"), worker_id="gw0")
+        for when in ("setup", "call", "teardown"):
+            first.write_phase(make_item(), make_report("t::a", when))
+        first.close()
+        second = ResultSink(str(tmp_path / "gw1.jsonl"), worker_id="gw1")
+        second.write_phase(make_item(), make_report("t::b", "setup"))
+        second.close()
+        with open(second.path, "a", encoding="utf-8") as results_file:
+            results_file.write('{"type": "phase", "nodeid": "t::b", "wh')
+
+        output = tmp_path / "report" / "report.html"
+        tests = {test["nodeid"]: test for test in merge([str(tmp_path)], str(output))}
+
+        assert tests["t::a"]["outcome"] == "passed"
+        assert tests["t::b"]["outcome"] == "error" and "interrompida" in tests["t::b"]["message"]
+        assert "t::a" in output.read_text(encoding="utf-8")
+        with open(os.path.splitext(output)[0] + ".json", encoding="utf-8") as results_file:
+            assert json.load(results_file)["exit_code"] == 1
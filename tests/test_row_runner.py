@@ -0,0 +1,50 @@
+import os
+import pytest
+from utils.row_runner import MAX_REPORTED_FAILURES, RowRunner
+
+
+def rows(count, invalid=()):
+    """Gerador de linhas; as linhas em `invalid` têm nome vazio"""
+    for index in range(count):
+        yield {"name": "" if index in invalid else f"Usuário {index}", "email": f"u{index}@teste.com"}
+
+
+def flow(row):
+    assert row["name"], "nome vazio"
+
+
+@pytest.mark.unit
+class TestRowRunner:
+    """Testes do executor orientado a dados"""
+
+    def test_each_row_is_a_sub_result(self):
+        """Testa se cada linha gera um sub-resultado, inclusive depois de uma falha"""
+        results = []
+        summary = RowRunner(flow, on_result=results.append).run(rows(5, invalid={1}))
+
+        assert [result.outcome for result in results] == ["passed", "failed", "passed", "passed", "passed"]
+        assert (summary.passed, summary.failed) == (4, 1)
+        assert "linha 1: nome vazio" in summary.describe()
+
+    def test_resume_from_failed_row(self, tmp_path):
+        """Testa o checkpoint da primeira falha, a retomada e a remoção após sucesso"""
+        checkpoint = str(tmp_path / "checkpoint.json")
+        RowRunner(flow, checkpoint=checkpoint).run(rows(10, invalid={4, 7}))
+        assert os.path.exists(checkpoint)
+
+        seen = []
+        summary = RowRunner(lambda row: seen.append(row["email"]), checkpoint=checkpoint).run(rows(10), resume=True)
+        assert summary.start == 4 and seen[0] == "u4@teste.com"
+        assert not os.path.exists(checkpoint)
+
+    def test_memory_is_bounded_for_many_failures(self):
+        """Testa se só as primeiras falhas são guardadas, qualquer que seja o número de linhas"""
+        summary = RowRunner(flow).run(rows(5000, invalid=set(range(5000))))
+
+        assert summary.failed == 5000
+        assert len(summary.failures) == MAX_REPORTED_FAILURES
+
+    def test_unusable_browser_aborts_run(self):
+        """Testa se a execução é interrompida quando o navegador não pode ser limpo"""
+        with pytest.raises(RuntimeError):
+            RowRunner(flow, reset=lambda: False).run(rows(3, invalid={0}))
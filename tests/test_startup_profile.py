@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import pytest
+from utils.startup_profile import HEAVY_MODULES, import_chain, parse_importtime, summarize
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       300 |        300 |   _io
+import time:      3000 |       3000 |       selenium.webdriver.remote.webdriver
+import time:       500 |       3500 |     selenium.webdriver.support.expected_conditions
+import time:       200 |       3700 |   utils.helpers
+import time:       100 |       3800 | tests.conftest
+import time:      1000 |       1000 | pytest
+"""
+
+
+@pytest.mark.unit
+class TestStartupProfile:
+    """Testes do perfil de importação e da importação sob demanda do Selenium"""
+
+    def test_parse_and_import_chain(self):
+        """Testa a leitura do -X importtime e a cadeia de quem importou o módulo"""
+        records = parse_importtime(IMPORTTIME_SAMPLE.splitlines())
+
+        assert [record.module for record in records][-2:] == ["tests.conftest", "pytest"]
+        assert records[1].self_us == 3000 and records[1].cumulative_us == 3000
+        assert import_chain(records, "selenium.webdriver.remote.webdriver") == [
+            "selenium.webdriver.remote.webdriver",
+            "selenium.webdriver.support.expected_conditions",
+            "utils.helpers",
+            "tests.conftest",
+        ]
+        assert import_chain(records, "numpy") == []
+
+    def test_summary_ranks_modules_and_flags_heavy_imports(self):
+        """Testa os rankings, o total por pacote e os módulos pesados importados"""
+        summary = summarize(parse_importtime(IMPORTTIME_SAMPLE.splitlines()), top=2)
+
+        assert summary["modules"] == 6
+        assert summary["import_seconds"] == pytest.approx(0.0051)
+        assert [record["module"] for record in summary["top_cumulative"]] == ["tests.conftest", "utils.helpers"]
+        assert list(summary["packages"]) == ["selenium", "pytest"]
+        assert summary["packages"]["selenium"] == 3500
+        assert list(summary["heavy"]) == ["selenium.webdriver.remote.webdriver"]
+
+    def test_collection_modules_do_not_import_browser_stack(self):
+        """Testa se conftest, Page Objects e a fábrica de drivers não carregam Selenium/numpy na importação"""
+        script = (
+            "import sys\n"
+            "import tests.conftest, pages.form_page, pages.home_page, pages.success_page\n"
+            "from utils.data_factory import DataFactory\n"
+            "DataFactory.generate_valid_user_data()\n"
+            f"print(sorted(module for module in {HEAVY_MODULES!r} if module in sys.modules))\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+        assert completed.stdout.strip() == "[]"
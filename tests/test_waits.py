@@ -0,0 +1,59 @@
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from utils.waits import SCROLL_INTO_VIEW, WAIT_FOR_CHANGE, WaitEngine
+
+
+class EventDriver:
+    """Driver falso: cada execute_async_script simula uma mutação do DOM"""
+
+    def __init__(self, changes_until_ready, fail_async=False):
+        self.changes_until_ready = changes_until_ready
+        self.fail_async = fail_async
+        self.async_calls = []
+
+    def execute_async_script(self, script, *args):
+        self.async_calls.append((script, args))
+        self.changes_until_ready -= 1
+        if self.fail_async:
+            raise WebDriverException("document unloaded while waiting for result")
+
+    def execute_script(self, script, *args):
+        pass
+
+
+@pytest.mark.unit
+class TestWaitEngine:
+    """Testes do motor de esperas orientado a eventos"""
+
+    def test_condition_is_rechecked_after_each_dom_change(self):
+        """Testa se a condição é reavaliada logo após cada mudança, sem pausa fixa"""
+        driver = EventDriver(changes_until_ready=3)
+        engine = WaitEngine(driver, timeout=5, poll_interval=0.25)
+
+        start = time.monotonic()
+        assert engine.until(lambda d: d.changes_until_ready <= 0) is True
+        assert time.monotonic() - start < 0.2
+        assert len(driver.async_calls) == 3
+        assert all(call[0] == WAIT_FOR_CHANGE and call[1] == (250,) for call in driver.async_calls)
+
+    def test_navigation_errors_are_ignored(self):
+        """Testa se o script descartado pela navegação não interrompe a espera"""
+        driver = EventDriver(changes_until_ready=1, fail_async=True)
+        assert WaitEngine(driver, timeout=1).until(lambda d: d.changes_until_ready <= 0)
+
+    def test_timeout_and_ignored_exceptions(self):
+        """Testa o timeout e a supressão de NoSuchElementException durante a espera"""
+        def missing(driver):
+            raise NoSuchElementException("ainda não existe")
+
+        engine = WaitEngine(object(), timeout=0.05, poll_interval=0.01)
+        with pytest.raises(TimeoutException):
+            engine.until(missing)
+        assert engine.check(lambda d: False) is False
+
+    def test_scroll_waits_for_completion_in_browser(self):
+        """Testa se a rolagem usa o script que aguarda o fim do scroll"""
+        driver = EventDriver(changes_until_ready=0)
+        WaitEngine(driver).scroll_into_view("elemento", timeout=1)
+        assert driver.async_calls == [(SCROLL_INTO_VIEW, ("elemento", 1000))]
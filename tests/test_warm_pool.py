@@ -0,0 +1,182 @@
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from tests.conftest import _expected_launches
+from utils.warm_pool import WarmBrowserPool
+
+
+class FakeDriver:
+    """Driver falso que apenas registra se foi encerrado"""
+
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeClock:
+    """Relógio controlado pelo teste"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class GatedFactory:
+    """Fábrica cujas aberturas só terminam quando o teste libera (allow)"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.permits = threading.Semaphore(0)
+        self.calls = 0
+
+    def allow(self, count=1):
+        for _ in range(count):
+            self.permits.release()
+
+    def __call__(self):
+        self.calls += 1
+        if not self.permits.acquire(timeout=5):
+            raise TimeoutError("abertura não liberada pelo teste")
+        if self.fail:
+            raise RuntimeError("navegador indisponível")
+        return FakeDriver()
+
+
+def _wait_until(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline, "condição não atingida"
+        time.sleep(0.005)
+
+
+def _close(pool, factory):
+    # Libera as aberturas que ainda estejam esperando
+    factory.allow(10)
+    pool.close()
+
+
+@pytest.mark.unit
+class TestWarmBrowserPool:
+    """Testes dos navegadores abertos em segundo plano"""
+
+    def test_ready_browser_hides_launch_latency(self):
+        """Testa se o navegador aberto em fundo é entregue na hora e a abertura conta como escondida"""
+        clock = FakeClock()
+        factory = GatedFactory()
+        pool = WarmBrowserPool(factory, max_warm=2, clock=clock)
+        pool.start()
+        _wait_until(lambda: factory.calls == 1)
+        clock.now += 2.0
+        factory.allow()
+        _wait_until(lambda: pool._ready)
+
+        driver = pool.acquire()
+
+        assert isinstance(driver, FakeDriver)
+        assert pool.stats.ready == 1 and pool.stats.cold == 0
+        assert pool.stats.hidden_seconds == pytest.approx(2.0)
+        assert pool.stats.exposed_seconds == 0.0
+        _close(pool, factory)
+
+    def test_target_follows_launch_time_and_request_rate(self):
+        """Testa se K acompanha abertura média / intervalo entre pedidos, limitado por max_warm e remaining"""
+        clock = FakeClock()
+        factory = GatedFactory()
+        pool = WarmBrowserPool(factory, max_warm=4, remaining=10, clock=clock)
+        assert pool.target == 1
+
+        def finish_launch(seconds):
+            clock.now += seconds
+            factory.allow()
+
+        pool.start()
+        _wait_until(lambda: factory.calls == 1)
+        finish_launch(3.0)
+        _wait_until(lambda: pool._ready)
+        pool.acquire()
+        _wait_until(lambda: factory.calls == 2)
+        clock.now += 1.0
+        # O segundo pedido chega 1 s depois e espera a abertura iniciada no primeiro
+        threading.Timer(0.05, finish_launch, args=(2.0,)).start()
+        pool.acquire()
+
+        # Abertura de 3 s e um pedido por segundo: 3 navegadores abrindo/prontos
+        assert pool.target == 3
+        assert pool.stats.max_target == 3 and pool.stats.waited == 1
+        pool.remaining = 2
+        assert pool.target == 2
+        pool.max_warm = 0
+        assert pool.target == 0
+        _close(pool, factory)
+
+    def test_waits_for_launch_in_progress(self):
+        """Testa se o pedido espera a abertura em andamento em vez de abrir outro navegador"""
+        factory = GatedFactory()
+        pool = WarmBrowserPool(factory, max_warm=1, remaining=1)
+        pool.start()
+        threading.Timer(0.05, factory.allow).start()
+
+        pool.acquire()
+
+        assert factory.calls == 1
+        assert pool.stats.waited == 1 and pool.stats.cold == 0
+        assert pool.stats.exposed_seconds > 0
+        _close(pool, factory)
+
+    def test_background_failure_falls_back_to_cold_launch(self):
+        """Testa se a falha em fundo suspende o pré-aquecimento e o erro real aparece no pedido"""
+        factory = GatedFactory(fail=True)
+        factory.allow(2)
+        pool = WarmBrowserPool(factory, max_warm=2)
+        pool.start()
+
+        with pytest.raises(RuntimeError, match="navegador indisponível"):
+            pool.acquire()
+
+        assert pool.stats.failed == 1
+        assert factory.calls == 2
+        _close(pool, factory)
+
+    def test_close_quits_unused_browsers(self):
+        """Testa se o encerramento fecha os navegadores que terminam de abrir depois do fechamento"""
+        factory = GatedFactory()
+        pool = WarmBrowserPool(factory, max_warm=1)
+        pool.start()
+        threading.Timer(0.05, factory.allow).start()
+
+        pool.close()
+
+        assert pool.stats.unused == 1
+        assert pool._ready == []
+
+
+def make_session(driver_scope, *fresh_flags, recycle_after=50):
+    """Sessão falsa com um item de navegador por flag (True = @pytest.mark.fresh_browser)"""
+    options = {"--driver-scope": driver_scope, "--recycle-after": recycle_after, "--backend": "selenium"}
+    config = SimpleNamespace(getoption=options.get)
+
+    def make_item(fresh):
+        markers = {"fresh_browser": object()} if fresh else {}
+        return SimpleNamespace(fixturenames=("driver",), config=config, get_closest_marker=markers.get)
+
+    return SimpleNamespace(config=config, items=[make_item(fresh) for fresh in fresh_flags])
+
+
+@pytest.mark.unit
+class TestExpectedLaunches:
+    """Testes da demanda de navegadores usada como remaining do pool"""
+
+    def test_function_scope_opens_one_browser_per_test(self):
+        """Testa se, com navegador por teste, a demanda é o número de testes de navegador"""
+        assert _expected_launches(make_session("function", False, False, True)) == 3
+
+    def test_session_scope_counts_pool_browsers_and_fresh_tests(self):
+        """Testa se, com o pool da sessão, contam um navegador por --recycle-after testes e os fresh_browser"""
+        assert _expected_launches(make_session("session", False, False, False, True)) == 2
+        assert _expected_launches(make_session("session", *[False] * 5, recycle_after=2)) == 3
+        assert _expected_launches(make_session("session", True)) == 1
@@ -0,0 +1,128 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """Obtém uma porta livre escolhida pelo sistema operacional"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url: str, timeout: float = 15.0, interval: float = 0.05) -> bool:
+    """Consulta a URL até a aplicação responder (ou o timeout expirar)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            time.sleep(interval)
+    return False
+
+
+class AppServerProcess:
+    """
+    Instância isolada do app.py em um processo próprio, escutando em uma porta efêmera.
+    Cada worker de testes paralelos sobe a sua, evitando colisões na porta 5001.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: Optional[int] = None):
+        self.host = host
+        self.port = port or find_free_port(host)
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout: float = 15.0) -> str:
+        """Inicia o servidor e aguarda ele responder; retorna a URL base"""
+        env = dict(os.environ, PORT=str(self.port), APP_MODE="production")
+        self.process = subprocess.Popen(
+            [sys.executable, "app.py"],
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if not wait_until_ready(self.url + "/", timeout):
+            self.stop()
+            raise RuntimeError(f"Aplicação não respondeu em {self.url} após {timeout}s")
+        return self.url
+
+    def stop(self) -> None:
+        """Encerra o processo do servidor"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+class EmbeddedAppServer:
+    """
+    Servidor WSGI com o objeto `app` do app.py rodando em uma thread do próprio
+    processo de testes, em uma porta livre. Não há processo externo para subir nem
+    esperas fixas: o socket já está escutando quando start() consulta a aplicação.
+    """
+
+    def __init__(self, app=None, host: str = "127.0.0.1", port: int = 0):
+        if app is None:
+            from app import app
+        self.app = app
+        self.host = host
+        self.port = port
+        self.startup_seconds: Optional[float] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout: float = 5.0) -> str:
+        """Inicia o servidor em background e aguarda a primeira resposta; retorna a URL base"""
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietRequestHandler(WSGIRequestHandler):
+            # O log de cada requisição poluiria a saída do pytest
+            def log_request(self, *args, **kwargs):
+                pass
+
+        start = time.perf_counter()
+        # Porta 0: o sistema operacional escolhe uma porta livre no próprio bind (sem corrida)
+        self._server = make_server(self.host, self.port, self.app, threaded=True, request_handler=QuietRequestHandler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="embedded-app-server",
+            daemon=True,
+        )
+        self._thread.start()
+        if not wait_until_ready(self.url + "/", timeout, interval=0.005):
+            self.stop()
+            raise RuntimeError(f"Aplicação não respondeu em {self.url} após {timeout}s")
+        self.startup_seconds = time.perf_counter() - start
+        return self.url
+
+    def stop(self) -> None:
+        """Encerra o servidor e aguarda a thread terminar"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,222 @@
+"""
+Armazenamento de artefatos endereçado por conteúdo.
+
+Cada arquivo (screenshot, HTML, metadados) é gravado uma única vez em
+`<raiz>/blobs/<hh>/<sha256>.<ext>`; um índice SQLite registra qual teste, em qual
+execução, referenciou cada blob. Falhas repetidas do mesmo teste normalmente geram
+screenshots idênticos e passam a ocupar o espaço de um só.
+
+A retenção é limitada por idade e por tamanho total: blobs não referenciados há
+mais de `max_age_days` são removidos e, se o total ainda passar de `max_bytes`,
+os menos recentemente referenciados (LRU) saem primeiro.
+
+Uso:
+    python -m utils.artifact_store query --test test_form_submission
+    python -m utils.artifact_store runs
+    python -m utils.artifact_store gc --max-mb 200 --max-age-days 7
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    ext TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_referenced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    test TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES blobs(hash),
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_test ON artifacts(test);
+CREATE INDEX IF NOT EXISTS artifacts_run ON artifacts(run_id);
+CREATE INDEX IF NOT EXISTS blobs_lru ON blobs(last_referenced_at);
+"""
+
+
+def new_run_id() -> str:
+    """Identificador da execução (compartilhado pelos workers via TEST_RUN_ID)"""
+    return os.getenv("TEST_RUN_ID") or f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+
+
+class ArtifactStore:
+    """Blobs endereçados por SHA-256 com índice por teste/execução e retenção LRU"""
+
+    def __init__(self, root: str = "artifacts", max_bytes: Optional[int] = None,
+                 max_age_days: Optional[float] = None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Conexão com o índice em uma transação (commit ou rollback) e sempre fechada ao sair"""
+        # Workers paralelos compartilham o índice: WAL e espera em vez de erro de lock
+        connection = sqlite3.connect(os.path.join(self.root, "index.sqlite3"), timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.row_factory = sqlite3.Row
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def blob_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], f"{digest}.{ext}")
+
+    def put(self, data: bytes, ext: str) -> str:
+        """Grava o conteúdo (se ainda não existir) e retorna o hash"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest, ext)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as blob_file:
+                blob_file.write(data)
+            os.replace(tmp_path, path)
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO blobs (hash, ext, size, created_at, last_referenced_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET last_referenced_at = excluded.last_referenced_at",
+                (digest, ext, len(data), now, now),
+            )
+        return digest
+
+    def add(self, run_id: str, test: str, kind: str, data: bytes, ext: str) -> str:
+        """Grava um artefato do teste e retorna o caminho do blob"""
+        digest = self.put(data, ext)
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO artifacts (run_id, test, kind, hash, created_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, test, kind, digest, time.time()),
+            )
+        return self.blob_path(digest, ext)
+
+    def query(self, test: str = None, run_id: str = None, kind: str = None) -> List[Dict[str, object]]:
+        """Artefatos filtrados por teste (substring), execução e tipo, mais recentes primeiro"""
+        clauses, params = [], []
+        if test:
+            clauses.append("a.test LIKE ?")
+            params.append(f"%{test}%")
+        if run_id:
+            clauses.append("a.run_id = ?")
+            params.append(run_id)
+        if kind:
+            clauses.append("a.kind = ?")
+            params.append(kind)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT a.run_id, a.test, a.kind, a.hash, a.created_at, b.ext, b.size "
+                f"FROM artifacts a JOIN blobs b ON b.hash = a.hash {where} "
+                "ORDER BY a.created_at DESC, a.id DESC",
+                params,
+            ).fetchall()
+        return [dict(row, path=self.blob_path(row["hash"], row["ext"])) for row in rows]
+
+    def runs(self) -> List[Dict[str, object]]:
+        """Execuções registradas com a quantidade de artefatos"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT run_id, COUNT(*) AS artifacts, COUNT(DISTINCT test) AS tests, MIN(created_at) AS started_at "
+                "FROM artifacts GROUP BY run_id ORDER BY started_at DESC"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as connection:
+            blobs, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            references = connection.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        return {"blobs": blobs, "bytes": size, "references": references}
+
+    def evict(self, max_bytes: int = None, max_age_days: float = None, now: float = None) -> int:
+        """
+        Remove blobs antigos (sem referência há mais de max_age_days) e, se o total
+        passar de max_bytes, os menos recentemente referenciados. Retorna quantos saíram
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+        now = time.time() if now is None else now
+        evicted = []
+        with self._connect() as connection:
+            blobs = connection.execute(
+                "SELECT hash, ext, size, last_referenced_at FROM blobs ORDER BY last_referenced_at ASC"
+            ).fetchall()
+            total = sum(blob["size"] for blob in blobs)
+            for blob in blobs:
+                too_old = max_age_days is not None and now - blob["last_referenced_at"] > max_age_days * 86400
+                too_big = max_bytes is not None and total > max_bytes
+                if not (too_old or too_big):
+                    continue
+                evicted.append((blob["hash"], blob["ext"]))
+                total -= blob["size"]
+            for digest, _ in evicted:
+                connection.execute("DELETE FROM artifacts WHERE hash = ?", (digest,))
+                connection.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        for digest, ext in evicted:
+            try:
+                os.remove(self.blob_path(digest, ext))
+            except OSError:
+                pass
+        return len(evicted)
+
+
+def open_default_store() -> ArtifactStore:
+    """Store configurado por ARTIFACT_STORE_DIR, ARTIFACT_MAX_MB e ARTIFACT_MAX_AGE_DAYS"""
+    from config.settings import config
+
+    return ArtifactStore(
+        config.ARTIFACT_STORE_DIR,
+        max_bytes=int(config.ARTIFACT_MAX_MB * 1024 * 1024),
+        max_age_days=config.ARTIFACT_MAX_AGE_DAYS,
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Consulta e limpeza do armazenamento de artefatos")
+    parser.add_argument("--root", help="Diretório do armazenamento (padrão: ARTIFACT_STORE_DIR)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    query_parser = subparsers.add_parser("query", help="Lista artefatos por teste e execução")
+    query_parser.add_argument("--test", help="Parte do nome/nodeid do teste")
+    query_parser.add_argument("--run", help="Identificador da execução")
+    query_parser.add_argument("--kind", help="screenshot, page_source ou metadata")
+    subparsers.add_parser("runs", help="Lista as execuções registradas")
+    gc_parser = subparsers.add_parser("gc", help="Aplica a retenção por idade e tamanho")
+    gc_parser.add_argument("--max-mb", type=float)
+    gc_parser.add_argument("--max-age-days", type=float)
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.root) if args.root else open_default_store()
+    if args.command == "query":
+        for row in store.query(args.test, args.run, args.kind):
+            print(f"{row['run_id']}  {row['kind']:<11} {row['size']:>9} B  {row['test']}\n    {row['path']}")
+    elif args.command == "runs":
+        for row in store.runs():
+            print(f"{row['run_id']}: {row['tests']} testes, {row['artifacts']} artefatos")
+    else:
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+        evicted = store.evict(max_bytes, args.max_age_days)
+        stats = store.stats()
+        print(f"{evicted} blobs removidos; restam {stats['blobs']} blobs ({stats['bytes'] / 1024 / 1024:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Pipeline assíncrono de artefatos de falha.
+
+A captura (`capture`) só busca os dados brutos no navegador: screenshot em base64,
+código-fonte da página, URL e logs do console. Decodificação, compressão e escrita
+em disco ficam com uma thread de fundo (`ArtifactWriter`) alimentada por uma fila
+limitada, para que o teardown do teste que falhou e o próximo teste não esperem
+pelo disco. Com a fila cheia, quem envia aguarda (backpressure) em vez de acumular
+capturas na memória.
+
+Com um `ArtifactStore` os arquivos vão para o armazenamento endereçado por conteúdo
+(deduplicado) em vez de `screenshots/`.
+"""
+import atexit
+import base64
+import gzip
+import json
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_OUTPUT_DIR = "screenshots"
+
+
+@dataclass
+class Capture:
+    """Dados brutos de um artefato, obtidos do navegador sem processamento"""
+    name: str
+    screenshot_base64: Optional[str] = None
+    page_source: Optional[str] = None
+    url: Optional[str] = None
+    console_logs: List[Dict[str, Any]] = field(default_factory=list)
+    captured_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    errors: Dict[str, str] = field(default_factory=dict)
+    # Teste e execução de origem (índice do ArtifactStore)
+    test: str = ""
+    run_id: str = ""
+
+
+def capture(driver, name: str, screenshot: bool = True, page_source: bool = True,
+            console_logs: bool = True) -> Capture:
+    """Obtém screenshot, HTML, URL e logs do console em uma única etapa rápida"""
+    from utils.helpers import BrowserHelpers
+
+    result = Capture(name=name)
+    steps = [
+        ("url", lambda: driver.current_url),
+        ("screenshot_base64", (lambda: driver.get_screenshot_as_base64()) if screenshot else None),
+        ("page_source", (lambda: driver.page_source) if page_source else None),
+    ]
+    for attribute, step in steps:
+        if step is None:
+            continue
+        try:
+            setattr(result, attribute, step())
+        except Exception as e:
+            result.errors[attribute] = str(e)
+    if console_logs:
+        result.console_logs = BrowserHelpers.get_browser_console_logs(driver)
+    return result
+
+
+class ArtifactWriter:
+    """Grava as capturas em disco em uma thread de fundo com fila limitada"""
+
+    FILE_TYPES = {"screenshot": "png", "page_source": "html.gz", "metadata": "json"}
+
+    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR, max_pending: int = 8, store=None):
+        self.output_dir = output_dir
+        self.store = store
+        self._queue: "queue.Queue[Optional[Tuple[Capture, Dict[str, str], Optional[Callable]]]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written: List[str] = []
+        self.errors: List[str] = []
+
+    def kinds(self, item: Capture) -> List[str]:
+        """Tipos de arquivo que serão gravados para a captura"""
+        kinds = []
+        if item.screenshot_base64:
+            kinds.append("screenshot")
+        if item.page_source is not None:
+            kinds.append("page_source")
+        if item.page_source is not None or item.console_logs or item.errors:
+            kinds.append("metadata")
+        return kinds
+
+    def paths(self, item: Capture) -> Dict[str, str]:
+        """Arquivos gravados para a captura em output_dir (sem ArtifactStore)"""
+        base = os.path.join(self.output_dir, os.path.splitext(item.name)[0])
+        return {kind: f"{base}.{self.FILE_TYPES[kind]}" for kind in self.kinds(item)}
+
+    def submit(self, item: Capture, on_written: Callable[[Dict[str, str]], None] = None) -> Dict[str, str]:
+        """
+        Enfileira a captura e retorna o dicionário tipo -> caminho dos arquivos.
+        Com ArtifactStore o caminho depende do hash do conteúdo: o dicionário é
+        preenchido pela thread de fundo e está completo depois de flush().
+        on_written é chamado (na thread de fundo) com os caminhos já gravados
+        """
+        paths = {} if self.store is not None else self.paths(item)
+        self._ensure_worker()
+        self._queue.put((item, paths, on_written))
+        return paths
+
+    def flush(self) -> None:
+        """Aguarda todas as capturas enfileiradas serem gravadas"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Grava o que estiver pendente e encerra a thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                item, paths, on_written = job
+                self._write(item, paths)
+                if on_written is not None:
+                    on_written(paths)
+            except Exception as e:
+                self.errors.append(f"{job[0].name}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _encode(self, item: Capture) -> Dict[str, bytes]:
+        """Decodifica o PNG, comprime o HTML e monta os metadados"""
+        kinds = self.kinds(item)
+        encoded = {}
+        if "screenshot" in kinds:
+            encoded["screenshot"] = base64.b64decode(item.screenshot_base64)
+        if "page_source" in kinds:
+            # mtime fixo: o mesmo HTML gera sempre os mesmos bytes (deduplicação)
+            encoded["page_source"] = gzip.compress(item.page_source.encode("utf-8"), compresslevel=6, mtime=0)
+        if "metadata" in kinds:
+            encoded["metadata"] = json.dumps({
+                "name": item.name,
+                "test": item.test,
+                "run_id": item.run_id,
+                "url": item.url,
+                "captured_at": item.captured_at,
+                "console_logs": item.console_logs,
+                "capture_errors": item.errors,
+            }, indent=2, default=str).encode("utf-8")
+        return encoded
+
+    def _write(self, item: Capture, paths: Dict[str, str]) -> None:
+        encoded = self._encode(item)
+        if self.store is not None:
+            stored = {
+                kind: self.store.add(item.run_id, item.test or item.name, kind, data, self.FILE_TYPES[kind])
+                for kind, data in encoded.items()
+            }
+            paths.update(stored)
+        else:
+            os.makedirs(self.output_dir, exist_ok=True)
+            for kind, data in encoded.items():
+                with open(paths[kind], "wb") as artifact_file:
+                    artifact_file.write(data)
+        self.written.extend(paths.values())
+
+
+_default_writer: Optional[ArtifactWriter] = None
+_default_lock = threading.Lock()
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Writer compartilhado pelo processo (as pendências são gravadas na saída do Python)"""
+    global _default_writer
+    with _default_lock:
+        if _default_writer is None:
+            _default_writer = ArtifactWriter()
+            atexit.register(_default_writer.close)
+        return _default_writer
+
+
+def save_screenshot_async(driver, filename: str) -> Optional[str]:
+    """
+    Captura apenas o screenshot e o grava em screenshots/<filename> em background.
+    Retorna o caminho do arquivo, ou None se o driver não gerou screenshot
+    """
+    item = capture(driver, filename, page_source=False, console_logs=False)
+    if not item.screenshot_base64:
+        return None
+    return get_artifact_writer().submit(item)["screenshot"]
@@ -0,0 +1,72 @@
+import threading
+from typing import Any, Callable, List, Optional
+
+from utils.helpers import BrowserHelpers
+
+
+class BrowserPool:
+    """
+    Pool de navegadores reutilizáveis entre testes (um pool por processo/worker).
+
+    Em vez de abrir e fechar o navegador a cada teste, o pool entrega uma instância
+    já aberta com o estado limpo (cookies, storage, janelas extras) e só a recria
+    depois de N usos ou quando o teste anterior falhou.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_uses: int = 50,
+                 reset: Optional[Callable[[Any], bool]] = None):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.reset = reset or BrowserHelpers.reset_browser_state
+        self._idle: List[Any] = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """Retorna um navegador limpo, reutilizando um ocioso quando possível"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def release(self, driver, discard: bool = False) -> None:
+        """
+        Devolve o navegador ao pool. Ele é descartado se o teste falhou,
+        se atingiu o limite de usos ou se não foi possível limpar o estado
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if discard or uses >= self.max_uses or not self.reset(driver):
+            self._discard(driver)
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+
+    def close(self) -> None:
+        """Encerra todos os navegadores ociosos"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+    def _discard(self, driver) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self.recycled += 1
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Erro ao encerrar navegador do pool: {e}")
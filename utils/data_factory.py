@@ -1,8 +1,135 @@
+import os
 import random
+import re
 import string
-from typing import Dict, Any
+from array import array
+from typing import Dict, Any, Iterator, List, Optional, Union
 from datetime import datetime
 
+# numpy é opcional (sem ele a geração em lote usa array e Python puro) e só é importado
+# na primeira geração em lote: a importação custa dezenas de ms em toda execução
+_NOT_LOADED = object()
+np = _NOT_LOADED
+
+
+def _numpy():
+    """Módulo numpy (importado na primeira chamada) ou None se não estiver instalado"""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+
+FIRST_NAMES = ("João", "Maria", "Pedro", "Ana", "Carlos", "Lucia", "Paulo", "Fernanda")
+LAST_NAMES = ("Silva", "Santos", "Oliveira", "Souza", "Costa", "Pereira", "Almeida")
+
+# Cada worker tem a sua faixa de 2**40 números de série; o índice do worker vai nos bits altos
+SERIAL_BITS = 40
+MASK_64 = (1 << 64) - 1
+# Constantes do embaralhamento (bijetivo em 64 bits: xor, xorshift e multiplicação por ímpar)
+MIX_MULTIPLIER_1 = 0xBF58476D1CE4E5B9
+MIX_MULTIPLIER_2 = 0x94D049BB133111EB
+EMAIL_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+# 36**13 > 2**64: toda chave cabe em 13 caracteres
+EMAIL_LOCAL_LENGTH = 13
+
+
+def worker_index(worker_id: Union[str, int, None] = None) -> int:
+    """
+    Índice numérico do worker ("gw3" -> 3). Sem argumento usa TEST_WORKER_ID ou
+    PYTEST_XDIST_WORKER; fora de uma execução paralela é 0
+    """
+    if worker_id is None:
+        worker_id = os.getenv("TEST_WORKER_ID") or os.getenv("PYTEST_XDIST_WORKER") or 0
+    if isinstance(worker_id, int):
+        return worker_id
+    digits = re.findall(r"\d+", worker_id)
+    return int(digits[-1]) if digits else 0
+
+
+def _seed_key(seed: int) -> int:
+    return (seed * MIX_MULTIPLIER_2 + 0x9E3779B97F4A7C15) & MASK_64
+
+
+def _mix(value: int, seed_key: int) -> int:
+    """Permutação de 64 bits: valores distintos geram chaves distintas"""
+    value ^= seed_key
+    value = (value ^ (value >> 30)) * MIX_MULTIPLIER_1 & MASK_64
+    value = (value ^ (value >> 27)) * MIX_MULTIPLIER_2 & MASK_64
+    return value ^ (value >> 31)
+
+
+def _mix_array(values, seed_key: int):
+    """Mesma permutação de _mix, vetorizada (a multiplicação em uint64 é módulo 2**64)"""
+    values = values ^ np.uint64(seed_key)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(MIX_MULTIPLIER_1)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(MIX_MULTIPLIER_2)
+    return values ^ (values >> np.uint64(31))
+
+
+def _email_local(key: int) -> str:
+    characters = []
+    for _ in range(EMAIL_LOCAL_LENGTH):
+        key, digit = divmod(key, 36)
+        characters.append(EMAIL_ALPHABET[digit])
+    return "".join(reversed(characters))
+
+
+class UserBatch:
+    """
+    Lote de usuários em colunas: chave de 64 bits (origem do email) e códigos do
+    primeiro e do último nome. As strings só são montadas quando acessadas
+    """
+
+    def __init__(self, keys, first, last, domain: str, seed: int, worker: int, start: int):
+        self.keys = keys
+        self.first = first
+        self.last = last
+        self.domain = domain
+        self.seed = seed
+        self.worker = worker
+        self.start = start
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index: int) -> Dict[str, str]:
+        return {"name": self.name(index), "email": self.email(index)}
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return (self[index] for index in range(len(self)))
+
+    def name(self, index: int) -> str:
+        return f"{FIRST_NAMES[self.first[index]]} {LAST_NAMES[self.last[index]]}"
+
+    def email(self, index: int) -> str:
+        return f"{_email_local(int(self.keys[index]))}@{self.domain}"
+
+    def names(self) -> List[str]:
+        full_names = [[f"{first} {last}" for last in LAST_NAMES] for first in FIRST_NAMES]
+        return [full_names[first][last] for first, last in zip(self.first, self.last)]
+
+    def emails(self) -> List[str]:
+        if _numpy() is None or not isinstance(self.keys, np.ndarray):
+            return [f"{_email_local(key)}@{self.domain}" for key in self.keys]
+        keys = self.keys.copy()
+        digits = np.empty((len(keys), EMAIL_LOCAL_LENGTH), dtype=np.uint8)
+        for position in range(EMAIL_LOCAL_LENGTH - 1, -1, -1):
+            digits[:, position] = keys % np.uint64(36)
+            keys //= np.uint64(36)
+        alphabet = np.frombuffer(EMAIL_ALPHABET.encode("ascii"), dtype=np.uint8)
+        locals_ = alphabet[digits].view(f"S{EMAIL_LOCAL_LENGTH}").ravel()
+        suffix = f"@{self.domain}"
+        return [local.decode("ascii") + suffix for local in locals_.tolist()]
+
+    def records(self) -> List[Dict[str, str]]:
+        return [{"name": name, "email": email} for name, email in zip(self.names(), self.emails())]
+
+
 class DataFactory:
     """Factory para gerar dados de teste dinâmicos"""
     
@@ -20,11 +147,8 @@ class DataFactory:
     @staticmethod
     def generate_random_name() -> str:
         """Gera um nome aleatório"""
-        first_names = ["João", "Maria", "Pedro", "Ana", "Carlos", "Lucia", "Paulo", "Fernanda"]
-        last_names = ["Silva", "Santos", "Oliveira", "Souza", "Costa", "Pereira", "Almeida"]
-        
-        first = random.choice(first_names)
-        last = random.choice(last_names)
+        first = random.choice(FIRST_NAMES)
+        last = random.choice(LAST_NAMES)
         return f"{first} {last}"
     
     @staticmethod
@@ -36,6 +160,36 @@ class DataFactory:
             "timestamp": datetime.now().isoformat()
         }
     
+    @staticmethod
+    def generate_users(n: int, seed: Optional[int] = None, worker_id: Union[str, int, None] = None,
+                       start: int = 0, domain: str = "teste.com") -> UserBatch:
+        """
+        Gera n usuários válidos em lote, reproduzíveis pela semente.
+        O email vem de uma permutação de 64 bits de (worker, número de série): com a
+        mesma semente, emails nunca se repetem entre workers nem entre lotes com
+        faixas [start, start + n) diferentes. Usa numpy quando disponível
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "big")
+        worker = worker_index(worker_id)
+        if n < 0 or start < 0 or start + n > 1 << SERIAL_BITS:
+            raise ValueError(f"Faixa de números de série inválida: {start} + {n}")
+        if not 0 <= worker < 1 << (64 - SERIAL_BITS):
+            raise ValueError(f"Índice de worker inválido: {worker}")
+        base = worker << SERIAL_BITS
+        seed_key = _seed_key(seed)
+        
+        if _numpy() is not None:
+            keys = _mix_array(np.arange(base + start, base + start + n, dtype=np.uint64), seed_key)
+            first = (keys >> np.uint64(40)) % np.uint64(len(FIRST_NAMES))
+            last = (keys >> np.uint64(48)) % np.uint64(len(LAST_NAMES))
+            return UserBatch(keys, first.astype(np.uint8), last.astype(np.uint8), domain, seed, worker, start)
+        
+        keys = array("Q", (_mix(serial, seed_key) for serial in range(base + start, base + start + n)))
+        first = array("B", ((key >> 40) % len(FIRST_NAMES) for key in keys))
+        last = array("B", ((key >> 48) % len(LAST_NAMES) for key in keys))
+        return UserBatch(keys, first, last, domain, seed, worker, start)
+    
     @staticmethod
     def generate_invalid_user_data() -> Dict[str, Dict[str, Any]]:
         """Gera diversos tipos de dados inválidos"""
@@ -0,0 +1,258 @@
+"""
+Datasets de teste persistidos em um arquivo compacto e lidos via mmap.
+
+Formato (`.tds`), em colunas:
+
+    b"TDS1" | tamanho do cabeçalho (u32) | cabeçalho JSON (alinhado a 8 bytes)
+    para cada campo: offsets (n + 1 inteiros u64) | bytes UTF-8 dos valores
+
+O cabeçalho guarda campos, quantidade de registros, posição de cada coluna,
+metadados e o SHA-256 das colunas. Abrir o arquivo lê apenas o cabeçalho; cada
+registro é decodificado quando acessado e os offsets são lidos direto do mmap, de
+modo que cada worker pode ler só a sua fatia (`shard`).
+
+Uso:
+    python -m utils.datasets build users --count 100000 --seed 42 -o datasets/users.tds
+    python -m utils.datasets build config -o datasets/config.tds
+    python -m utils.datasets info datasets/users.tds --verify
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+MAGIC = b"TDS1"
+PRELUDE = struct.Struct("<4sI")
+ALIGNMENT = 8
+
+# Datasets abertos nesta execução (caminho -> hash), para rastrear os resultados
+loaded_datasets: Dict[str, str] = {}
+
+
+class DatasetError(ValueError):
+    """Arquivo que não está no formato de dataset ou está corrompido"""
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % ALIGNMENT)
+
+
+def write_columns(path: str, columns: Dict[str, Sequence[str]], metadata: Dict[str, Any] = None) -> str:
+    """Grava as colunas (mesmo tamanho) no formato de dataset e retorna o hash do conteúdo"""
+    fields = list(columns)
+    counts = {len(values) for values in columns.values()}
+    if len(counts) > 1:
+        raise DatasetError(f"Colunas com tamanhos diferentes: {sorted(counts)}")
+    count = counts.pop() if counts else 0
+
+    digest = hashlib.sha256(json.dumps(fields).encode("utf-8"))
+    sections, layout, position = [], {}, 0
+    for field in fields:
+        encoded = ["" if value is None else str(value) for value in columns[field]]
+        data = "".join(encoded).encode("utf-8")
+        offsets, offset = [0], 0
+        for value in encoded:
+            offset += len(value.encode("utf-8"))
+            offsets.append(offset)
+        offsets_bytes = struct.pack(f"<{count + 1}Q", *offsets)
+        digest.update(offsets_bytes)
+        digest.update(data)
+        layout[field] = {"offsets": position, "data": position + len(offsets_bytes), "size": len(data)}
+        sections += [offsets_bytes, data, _padding(len(data))]
+        position += len(offsets_bytes) + len(data) + len(_padding(len(data)))
+
+    content_hash = digest.hexdigest()
+    header = json.dumps({
+        "version": 1,
+        "count": count,
+        "fields": fields,
+        "layout": layout,
+        "sha256": content_hash,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "metadata": metadata or {},
+    }, ensure_ascii=False).encode("utf-8")
+    # Espaços são válidos no fim do JSON: o início das colunas fica alinhado
+    header += b" " * (-(PRELUDE.size + len(header)) % ALIGNMENT)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as dataset_file:
+        dataset_file.write(PRELUDE.pack(MAGIC, len(header)))
+        dataset_file.write(header)
+        for section in sections:
+            dataset_file.write(section)
+    # Workers que já abriram o arquivo anterior continuam lendo a versão antiga
+    os.replace(tmp_path, path)
+    return content_hash
+
+
+def write_dataset(path: str, records: Iterable[Dict[str, Any]], fields: Sequence[str] = None,
+                  metadata: Dict[str, Any] = None) -> str:
+    """Grava registros (dicionários) no formato de dataset e retorna o hash do conteúdo"""
+    records = list(records)
+    if fields is None:
+        fields = list(records[0]) if records else []
+    return write_columns(path, {field: [record.get(field) for record in records] for field in fields}, metadata)
+
+
+class Dataset:
+    """Dataset aberto via mmap; os registros são decodificados sob demanda"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as dataset_file:
+            if os.fstat(dataset_file.fileno()).st_size < PRELUDE.size:
+                # mmap recusa arquivos vazios com um ValueError genérico
+                raise DatasetError(f"{path} não é um dataset (arquivo menor que o cabeçalho)")
+            self._mmap = mmap.mmap(dataset_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, header_size = PRELUDE.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise DatasetError(f"{path} não é um dataset (assinatura {magic!r})")
+            header = json.loads(bytes(self._mmap[PRELUDE.size:PRELUDE.size + header_size]))
+            body = PRELUDE.size + header_size
+            end = max((body + layout["data"] + layout["size"] for layout in header["layout"].values()), default=body)
+            if len(self._mmap) < end:
+                raise DatasetError(f"{path} está truncado ({len(self._mmap)} de {end} bytes)")
+        except DatasetError:
+            self._mmap.close()
+            raise
+        except (struct.error, ValueError, KeyError, TypeError) as e:
+            self._mmap.close()
+            raise DatasetError(f"Cabeçalho inválido em {path}: {e}") from e
+        self.header = header
+        self.fields: List[str] = self.header["fields"]
+        self.count: int = self.header["count"]
+        self.sha256: str = self.header["sha256"]
+        self.metadata: Dict[str, Any] = self.header["metadata"]
+
+        view = memoryview(self._mmap)
+        self._columns = {}
+        for field, layout in self.header["layout"].items():
+            start = body + layout["offsets"]
+            # Offsets gravados em little-endian, lidos sem cópia (plataformas little-endian)
+            offsets = view[start:start + (self.count + 1) * 8].cast("Q")
+            data_start = body + layout["data"]
+            self._columns[field] = (offsets, view[data_start:data_start + layout["size"]])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Dict[str, str]:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return {field: self.value(field, index) for field in self.fields}
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return self.rows()
+
+    def value(self, field: str, index: int) -> str:
+        offsets, data = self._columns[field]
+        return str(data[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """Registros de [start, stop) lidos sob demanda"""
+        stop = self.count if stop is None else min(stop, self.count)
+        for index in range(max(start, 0), stop):
+            yield self[index]
+
+    def shard(self, index: int, count: int) -> range:
+        """Faixa contígua de registros do worker `index` entre `count` workers"""
+        if not 0 <= index < count:
+            raise ValueError(f"Índice de shard {index} fora de 0..{count - 1}")
+        return range(self.count * index // count, self.count * (index + 1) // count)
+
+    def verify(self) -> bool:
+        """Recalcula o hash das colunas (lê o arquivo inteiro) e compara com o cabeçalho"""
+        digest = hashlib.sha256(json.dumps(self.fields).encode("utf-8"))
+        for field in self.fields:
+            offsets, data = self._columns[field]
+            digest.update(offsets)
+            digest.update(data)
+        return digest.hexdigest() == self.sha256
+
+    def close(self) -> None:
+        # As views precisam ser liberadas antes do mmap
+        for offsets, data in self._columns.values():
+            offsets.release()
+            data.release()
+        self._columns = {}
+        self._mmap.close()
+
+    def __enter__(self) -> "Dataset":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_dataset(path: str) -> Dataset:
+    """Abre o dataset e registra o seu hash em loaded_datasets"""
+    dataset = Dataset(path)
+    loaded_datasets[os.path.abspath(path)] = dataset.sha256
+    return dataset
+
+
+def build_users(path: str, count: int, seed: int = None) -> str:
+    """Dataset de usuários válidos gerado em lote pela DataFactory"""
+    from utils.data_factory import DataFactory
+
+    users = DataFactory.generate_users(count, seed=seed, worker_id=0)
+    return write_columns(path, {"name": users.names(), "email": users.emails()},
+                         {"source": "DataFactory.generate_users", "seed": users.seed})
+
+
+def build_config(path: str) -> str:
+    """Dataset com os dados curados de config.settings (VALID_USER_DATA e INVALID_USER_DATA)"""
+    from config.settings import config
+
+    records = [dict(config.VALID_USER_DATA, case="valid")]
+    records += [dict(data, case=case) for case, data in config.INVALID_USER_DATA.items()]
+    return write_dataset(path, records, fields=["case", "name", "email"],
+                         metadata={"source": "config.settings"})
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Criação e inspeção de datasets de teste")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Grava um dataset")
+    build_parser.add_argument("source", choices=("users", "config"))
+    build_parser.add_argument("-o", "--output", required=True)
+    build_parser.add_argument("--count", type=int, default=10000)
+    build_parser.add_argument("--seed", type=int)
+    info_parser = subparsers.add_parser("info", help="Mostra campos, registros e hash de um dataset")
+    info_parser.add_argument("path")
+    info_parser.add_argument("--verify", action="store_true", help="Confere o hash do conteúdo")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if args.source == "users":
+            content_hash = build_users(args.output, args.count, args.seed)
+        else:
+            content_hash = build_config(args.output)
+        print(f"{args.output}: sha256 {content_hash}")
+        return 0
+
+    with Dataset(args.path) as dataset:
+        print(f"{args.path}: {len(dataset)} registros, campos {', '.join(dataset.fields)}")
+        print(f"sha256 {dataset.sha256} (criado em {dataset.header['created_at']})")
+        if dataset.metadata:
+            print(f"metadados: {json.dumps(dataset.metadata, ensure_ascii=False)}")
+        if args.verify:
+            valid = dataset.verify()
+            print("conteúdo confere com o hash" if valid else "CONTEÚDO NÃO CONFERE COM O HASH")
+            return 0 if valid else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+FIND_COMMANDS = frozenset({
+    "findElement",
+    "findElements",
+    "findChildElement",
+    "findChildElements",
+})
+SET_TIMEOUTS = "setTimeouts"
+
+
+class CommandListener:
+    """Interface dos ouvintes de comandos WebDriver (todos os métodos são opcionais)"""
+
+    def after_command(self, command: str, params: Optional[Dict[str, Any]], elapsed: float,
+                      error: Optional[BaseException]) -> None:
+        pass
+
+
+class CommandHooks:
+    """
+    Intercepta todos os comandos enviados pelo WebDriver (inclusive os de WebElement,
+    que passam por `driver.execute`) e avisa os ouvintes registrados com o tempo gasto.
+    """
+
+    def __init__(self, driver):
+        self.listeners: List[CommandListener] = []
+        self._execute = driver.execute
+        driver.execute = self.execute
+
+    def add(self, listener: CommandListener) -> CommandListener:
+        self.listeners.append(listener)
+        return listener
+
+    def execute(self, command, params=None):
+        start = time.perf_counter()
+        try:
+            response = self._execute(command, params)
+        except Exception as error:
+            self._notify(command, params, time.perf_counter() - start, error)
+            raise
+        self._notify(command, params, time.perf_counter() - start, None)
+        return response
+
+    def _notify(self, command, params, elapsed, error) -> None:
+        for listener in self.listeners:
+            listener.after_command(command, params, elapsed, error)
+
+
+def install_command_hooks(driver) -> Optional[CommandHooks]:
+    """
+    Instala (uma única vez) os ganchos de comando no driver.
+    Retorna None para drivers que não falam o protocolo WebDriver
+    """
+    hooks = getattr(driver, "command_hooks", None)
+    if hooks is None and callable(getattr(driver, "execute", None)):
+        hooks = CommandHooks(driver)
+        driver.command_hooks = hooks
+    return hooks
+
+
+def get_listener(driver, listener_type):
+    """Retorna o ouvinte do tipo informado instalado no driver, se houver"""
+    hooks = getattr(driver, "command_hooks", None)
+    for listener in (hooks.listeners if hooks else []):
+        if isinstance(listener, listener_type):
+            return listener
+    return None
+
+
+class ImplicitWaitMonitor(CommandListener):
+    """
+    Mede quanto tempo o teste ficou bloqueado em esperas implícitas: buscas de
+    elementos que falharam com a espera implícita ativa (bloquearam o timeout
+    inteiro) ou que só tiveram sucesso depois de esperar.
+    """
+
+    SLOW_FIND_THRESHOLD = 0.25
+
+    def __init__(self, implicit_wait: float = 0.0):
+        self.implicit_wait = implicit_wait
+        self.blocked_seconds = 0.0
+        self.blocked_finds = 0
+
+    def reset(self) -> None:
+        self.blocked_seconds = 0.0
+        self.blocked_finds = 0
+
+    def after_command(self, command, params, elapsed, error) -> None:
+        if command == SET_TIMEOUTS and error is None and params and "implicit" in params:
+            self.implicit_wait = params["implicit"] / 1000
+            return
+        if command not in FIND_COMMANDS or self.implicit_wait <= 0:
+            return
+        if error is not None or elapsed >= self.SLOW_FIND_THRESHOLD:
+            self.blocked_seconds += elapsed
+            self.blocked_finds += 1
+
+
+class CommandCounter(CommandListener):
+    """
+    Conta os comandos WebDriver (idas e voltas ao navegador) por tipo.
+
+    Os comandos de um bloco `group` (ex.: as verificações de uma espera) contam como
+    um único comando lógico: quantas vezes a espera verificou depende da velocidade
+    da página, não do teste.
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self._grouped = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def reset(self) -> None:
+        self.counts = {}
+
+    def after_command(self, command, params, elapsed, error) -> None:
+        if not self._grouped:
+            self.counts[command] = self.counts.get(command, 0) + 1
+
+    @contextmanager
+    def group(self, name: str) -> Iterator[None]:
+        """Conta os comandos do bloco como um só comando `name` (blocos aninhados contam no de fora)"""
+        self._grouped += 1
+        try:
+            yield
+        finally:
+            self._grouped -= 1
+            if not self._grouped:
+                self.counts[name] = self.counts.get(name, 0) + 1
+
+    def breakdown(self) -> str:
+        """Uma linha por tipo de comando, do mais frequente para o menos frequente"""
+        return "\n".join(
+            f"  {command}: {count}"
+            for command, count in sorted(self.counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        )
+
+
+def logical_command(driver, name: str) -> ContextManager[None]:
+    """Agrupa os comandos do bloco em um só no CommandCounter do driver, se houver"""
+    counter = get_listener(driver, CommandCounter)
+    return counter.group(name) if counter else nullcontext()
@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class DriverResolver:
+    """
+    Resolve o caminho do binário do WebDriver (chromedriver/geckodriver) uma única
+    vez por execução.
+
+    Mantém um manifest local indexado pela versão do navegador instalado: se já
+    existe um binário compatível em cache, nenhum acesso à rede é feito. Em modo
+    offline o resolver nunca baixa nada e cai para o driver disponível no PATH.
+    """
+
+    DRIVER_BINARIES = {
+        "chrome": "chromedriver",
+        "firefox": "geckodriver",
+    }
+
+    def __init__(self, cache_dir: str, offline: bool = False):
+        # "~" não é expandido por os.getenv nem pelo sistema de arquivos
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.manifest_path = os.path.join(self.cache_dir, "drivers.json")
+        self.offline = offline
+        self._resolved: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        # browser -> (segundos, origem do caminho, versão do navegador)
+        self.timings: Dict[str, Tuple[float, str, Optional[str]]] = {}
+
+    def resolve(self, browser: str) -> Optional[str]:
+        """
+        Retorna o caminho do driver para o navegador, ou None quando nenhum
+        binário está disponível (o Selenium usa então a própria resolução)
+        """
+        browser = browser.lower()
+        with self._lock:
+            if browser in self._resolved:
+                return self._resolved[browser]
+
+            start = time.perf_counter()
+            version = self.detect_browser_version(browser)
+            path, source = self._resolve_path(browser, version)
+            self._resolved[browser] = path
+            self.timings[browser] = (time.perf_counter() - start, source, version)
+            return path
+
+    def _resolve_path(self, browser: str, version: Optional[str]) -> Tuple[Optional[str], str]:
+        key = f"{browser}:{version}" if version else None
+
+        if key:
+            entry = self._load_manifest().get(key)
+            if entry and _is_executable(entry.get("path")):
+                return entry["path"], "manifest"
+
+        if self.offline:
+            path = shutil.which(self.DRIVER_BINARIES[browser])
+            return (path, "PATH") if path else (None, "indisponível (offline)")
+
+        try:
+            path = self._download(browser)
+        except Exception as e:
+            # A falha também é memorizada: os próximos navegadores não tentam a rede de novo
+            print(f"Erro ao baixar driver para {browser}: {e}")
+            return None, "falha no download"
+        if key:
+            self._save_manifest_entry(key, path)
+        return path, "download"
+
+    @staticmethod
+    def detect_browser_version(browser: str) -> Optional[str]:
+        """Obtém a versão do navegador instalado sem acessar a rede"""
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        browser_type = ChromeType.GOOGLE if browser == "chrome" else browser
+        try:
+            return OperationSystemManager().get_browser_version_from_os(browser_type)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _download(browser: str) -> str:
+        if browser == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest_entry(self, key: str, path: str) -> None:
+        manifest = self._load_manifest()
+        manifest[key] = {"path": path, "resolved_at": datetime.now().isoformat()}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Escrita atômica: workers paralelos podem ler o manifest ao mesmo tempo
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def summary_lines(self) -> List[str]:
+        """Linhas de resumo com o tempo gasto na resolução de cada driver"""
+        return [
+            f"{browser} {version or '(versão desconhecida)'}: {source} em {seconds * 1000:.0f} ms"
+            for browser, (seconds, source, version) in self.timings.items()
+        ]
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
@@ -1,10 +1,8 @@
-import os
 import time
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+from utils.waits import WaitEngine, page_loaded
 
 class TestHelpers:
     """Classe com métodos auxiliares para testes"""
@@ -12,14 +10,15 @@ class TestHelpers:
     @staticmethod
     def wait_for_page_load(driver, timeout: int = 10):
         """Aguarda o carregamento completo da página"""
-        wait = WebDriverWait(driver, timeout)
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        WaitEngine(driver, timeout).until(page_loaded)
     
     @staticmethod
     def safe_click(driver, locator, timeout: int = 10):
         """Clica em um elemento de forma segura, aguardando ele estar clicável"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WaitEngine(driver, timeout)
             element = wait.until(EC.element_to_be_clickable(locator))
             element.click()
             return True
@@ -29,8 +28,10 @@ class TestHelpers:
     @staticmethod
     def safe_send_keys(driver, locator, text: str, timeout: int = 10):
         """Envia texto para um elemento de forma segura"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WaitEngine(driver, timeout)
             element = wait.until(EC.presence_of_element_located(locator))
             element.clear()
             element.send_keys(text)
@@ -41,8 +42,10 @@ class TestHelpers:
     @staticmethod
     def is_element_visible(driver, locator, timeout: int = 5):
         """Verifica se um elemento está visível"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WaitEngine(driver, timeout)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
@@ -50,26 +53,25 @@ class TestHelpers:
     
     @staticmethod
     def take_screenshot(driver, filename: str = None):
-        """Tira screenshot com nome automático se não especificado"""
+        """
+        Tira screenshot com nome automático se não especificado.
+        O arquivo é gravado em background; retorna o caminho em screenshots/
+        """
+        from utils.artifacts import save_screenshot_async
+        
         if not filename:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"screenshot_{timestamp}.png"
         
-        screenshot_dir = "screenshots"
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
-        
-        filepath = os.path.join(screenshot_dir, filename)
-        driver.save_screenshot(filepath)
-        return filepath
+        return save_screenshot_async(driver, filename)
     
     @staticmethod
     def scroll_to_element(driver, locator):
         """Rola a página até um elemento específico"""
         try:
             element = driver.find_element(*locator)
-            driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Pequena pausa para garantir que o scroll terminou
+            # Retorna assim que a rolagem termina (sem pausa fixa)
+            WaitEngine(driver).scroll_into_view(element)
             return True
         except NoSuchElementException:
             return False
@@ -77,8 +79,10 @@ class TestHelpers:
     @staticmethod
     def get_element_text_safe(driver, locator, timeout: int = 10):
         """Obtém texto de um elemento de forma segura"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WaitEngine(driver, timeout)
             element = wait.until(EC.presence_of_element_located(locator))
             return element.text
         except TimeoutException:
@@ -87,8 +91,10 @@ class TestHelpers:
     @staticmethod
     def wait_for_url_change(driver, expected_url: str, timeout: int = 10):
         """Aguarda mudança para uma URL específica"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WaitEngine(driver, timeout)
             return wait.until(EC.url_to_be(expected_url))
         except TimeoutException:
             return False
@@ -130,6 +136,38 @@ class BrowserHelpers:
         except Exception:
             return False
     
+    @staticmethod
+    def close_extra_windows(driver):
+        """Fecha todas as janelas/abas extras, mantendo apenas a primeira"""
+        try:
+            handles = driver.window_handles
+            main_handle = handles[0]
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(main_handle)
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def reset_browser_state(driver, blank_url: str = "about:blank"):
+        """
+        Deixa o navegador limpo para o próximo teste sem reiniciá-lo:
+        fecha janelas extras, limpa storage e cookies e navega para uma página em branco.
+        Retorna False se algum passo falhar (o navegador deve ser descartado)
+        """
+        if not BrowserHelpers.close_extra_windows(driver):
+            return False
+        # O storage só pode ser limpo enquanto a página da aplicação está aberta
+        BrowserHelpers.clear_browser_cache(driver)
+        try:
+            driver.delete_all_cookies()
+            driver.get(blank_url)
+            return True
+        except Exception:
+            return False
+    
     @staticmethod
     def set_window_size(driver, width: int = 1920, height: int = 1080):
         """Define o tamanho da janela do navegador"""
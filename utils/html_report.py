@@ -0,0 +1,69 @@
+import html
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+OUTCOME_COLORS = {
+    "passed": "#2e7d32",
+    "failed": "#c62828",
+    "error": "#ef6c00",
+    "skipped": "#757575",
+}
+
+
+def summarize(tests: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Conta os testes por resultado"""
+    counts = {outcome: 0 for outcome in OUTCOME_COLORS}
+    for test in tests:
+        counts[test["outcome"]] = counts.get(test["outcome"], 0) + 1
+    return counts
+
+
+def render_report(title: str, tests: List[Dict[str, Any]]) -> str:
+    """
+    Gera um relatório HTML compacto a partir dos registros de teste
+    (nodeid, outcome, duration, message e, opcionalmente, artifacts com links)
+    """
+    counts = summarize(tests)
+    total_duration = sum(test.get("duration", 0.0) for test in tests)
+    summary = " | ".join(f"{outcome}: {count}" for outcome, count in counts.items())
+
+    rows = []
+    for test in tests:
+        color = OUTCOME_COLORS.get(test["outcome"], "#000")
+        links = " ".join(
+            f'<a href="{html.escape(href)}">{html.escape(name)}</a>'
+            for name, href in test.get("artifacts", {}).items()
+        )
+        message = html.escape(test.get("message") or "")
+        rows.append(
+            "<tr>"
+            f"<td>{html.escape(test['nodeid'])}</td>"
+            f'<td style="color:{color};font-weight:bold">{test["outcome"]}</td>'
+            f"<td>{test.get('duration', 0.0):.2f}s</td>"
+            f"<td><pre>{message}</pre>{links}</td>"
+            "</tr>"
+        )
+
+    return f"""<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+pre {{ margin: 0; white-space: pre-wrap; font-size: 0.85em; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<p>Gerado em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} - {len(tests)} testes em {total_duration:.1f}s</p>
+<p>{summary}</p>
+<table>
+<tr><th>Teste</th><th>Resultado</th><th>Duração</th><th>Detalhes</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
@@ -0,0 +1,139 @@
+"""
+Relatórios por marcador gerados a partir de uma única execução do pytest.
+
+Em vez de rodar `-m smoke`, `-m critical` e a suíte completa separadamente, a suíte
+roda uma vez e este plugin grava, para cada grupo, `reports/<grupo>-results.json` e
+`reports/<grupo>-report.html`. O código de saída de cada grupo segue a mesma regra do
+pytest e pode ser verificado depois:
+
+    pytest --marker-reports=smoke,critical,regression
+    python -m utils.marker_reports check smoke
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Sequence
+
+from utils.html_report import render_report
+
+FULL_GROUP = "full"
+
+# Mesmos códigos de saída do pytest
+EXIT_OK = 0
+EXIT_TESTS_FAILED = 1
+EXIT_INTERRUPTED = 2
+EXIT_NO_TESTS_COLLECTED = 5
+
+
+def group_exit_code(tests: Sequence[Dict[str, Any]], interrupted: bool = False) -> int:
+    """Código de saída que o pytest teria retornado executando apenas este grupo"""
+    if interrupted:
+        return EXIT_INTERRUPTED
+    if not tests:
+        return EXIT_NO_TESTS_COLLECTED
+    if any(test["outcome"] in ("failed", "error") for test in tests):
+        return EXIT_TESTS_FAILED
+    return EXIT_OK
+
+
+class MarkerReportPlugin:
+    """Plugin do pytest que separa os resultados de uma execução por marcador"""
+
+    def __init__(self, groups: Sequence[str], output_dir: str = "reports"):
+        self.groups = [group for group in groups if group != FULL_GROUP]
+        self.output_dir = output_dir
+        self.markers: Dict[str, List[str]] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            self.markers[item.nodeid] = [marker.name for marker in item.iter_markers()]
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "duration": 0.0,
+            "message": "",
+        })
+        result["duration"] += report.duration
+        for name, value in report.user_properties:
+            if name == "artifacts":
+                result["artifacts"] = value
+        if report.failed and result["outcome"] != "failed":
+            result["outcome"] = "failed" if report.when == "call" else "error"
+            result["message"] = report.longreprtext
+        elif report.skipped and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+
+    def record_artifacts(self, nodeid: str, artifacts: Dict[str, str]) -> None:
+        """Caminhos dos artefatos gravados em background (chamado pela thread de gravação)"""
+        result = self.results.get(nodeid)
+        if result is not None:
+            result["artifacts"] = dict(artifacts)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        interrupted = exitstatus == EXIT_INTERRUPTED
+        os.makedirs(self.output_dir, exist_ok=True)
+        for group in self.groups + [FULL_GROUP]:
+            nodeids = [
+                nodeid for nodeid, markers in self.markers.items()
+                if group == FULL_GROUP or group in markers
+            ]
+            tests = [
+                dict(self.results[nodeid], markers=self.markers[nodeid])
+                for nodeid in nodeids if nodeid in self.results
+            ]
+            # Testes do grupo que não chegaram a rodar (ex.: --maxfail) invalidam o grupo
+            incomplete = len(tests) < len(nodeids)
+            self.write_group(group, tests, group_exit_code(tests, interrupted or incomplete))
+
+    def write_group(self, group: str, tests: List[Dict[str, Any]], exit_code: int) -> None:
+        """Grava o resultado em JSON e o relatório HTML de um grupo"""
+        # Links relativos ao diretório do relatório, apontando para os blobs (sem cópias)
+        tests = [
+            dict(test, artifacts={
+                kind: os.path.relpath(path, self.output_dir).replace(os.sep, "/")
+                for kind, path in test["artifacts"].items()
+            }) if test.get("artifacts") else test
+            for test in tests
+        ]
+        with open(results_path(self.output_dir, group), "w", encoding="utf-8") as results_file:
+            json.dump({"group": group, "exit_code": exit_code, "tests": tests}, results_file, indent=2)
+        with open(os.path.join(self.output_dir, f"{group}-report.html"), "w", encoding="utf-8") as report_file:
+            report_file.write(render_report(f"Relatório de testes - {group}", tests))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", "relatórios por marcador")
+        for group in self.groups + [FULL_GROUP]:
+            terminalreporter.write_line(f"{group}: {results_path(self.output_dir, group)}")
+
+
+def results_path(output_dir: str, group: str) -> str:
+    return os.path.join(output_dir, f"{group}-results.json")
+
+
+def check(group: str, output_dir: str = "reports") -> int:
+    """Lê o resultado de um grupo e retorna o seu código de saída"""
+    with open(results_path(output_dir, group), encoding="utf-8") as results_file:
+        results = json.load(results_file)
+    failed = [test["nodeid"] for test in results["tests"] if test["outcome"] in ("failed", "error")]
+    print(f"{group}: {len(results['tests'])} testes, {len(failed)} com falha, código {results['exit_code']}")
+    for nodeid in failed:
+        print(f"  FALHOU {nodeid}")
+    return results["exit_code"]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Consulta os relatórios por marcador")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser("check", help="Retorna o código de saída de um grupo")
+    check_parser.add_argument("group", help="Grupo (smoke, critical, regression ou full)")
+    check_parser.add_argument("--output-dir", default="reports")
+    args = parser.parse_args(argv)
+    return check(args.group, args.output_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Medição de tempo dos métodos dos Page Objects.
+
+Todo método público de `BasePage` e das suas subclasses é envolvido por `timed`.
+Com a medição desligada o custo é uma verificação de atributo por chamada; ligada,
+cada chamada entra em um histograma por operação (`FormPage.fill_form`,
+`BasePage.wait_for_element`, ...) e por teste. O tempo é inclusivo: uma operação
+que chama outras (ex.: `click_element` -> `wait_for_element_clickable`) inclui o
+tempo delas.
+
+Ligar sem alterar código: `pytest --page-timing` ou `PAGE_TIMING=true`. Em tempo de
+execução: `page_timer.enabled = True`.
+"""
+import bisect
+import functools
+import inspect
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Limites superiores dos baldes do histograma (s): 0,5 ms a ~33 s em escala log2
+BUCKET_BOUNDS = tuple(0.0005 * 2 ** exponent for exponent in range(17))
+
+
+class Histogram:
+    """Histograma em escala logarítmica com contagem, soma, mínimo e máximo"""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Limite superior do balde que contém o percentil (limitado ao máximo observado)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS[index], self.max) if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "buckets": {
+                f"<={bound * 1000:g}ms" if index < len(BUCKET_BOUNDS) else f">{BUCKET_BOUNDS[-1] * 1000:g}ms": count
+                for index, (bound, count) in enumerate(zip(BUCKET_BOUNDS + (None,), self.buckets))
+                if count
+            },
+        }
+
+
+class PageTimer:
+    """Agrega as medições por operação e por teste"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.current_test: Optional[str] = None
+        self.operations: Dict[str, Histogram] = {}
+        self.tests: Dict[str, Dict[str, Histogram]] = {}
+
+    def record(self, operation: str, seconds: float) -> None:
+        histogram = self.operations.get(operation)
+        if histogram is None:
+            histogram = self.operations[operation] = Histogram()
+        histogram.add(seconds)
+        if self.current_test is not None:
+            by_operation = self.tests.setdefault(self.current_test, {})
+            if operation not in by_operation:
+                by_operation[operation] = Histogram()
+            by_operation[operation].add(seconds)
+
+    def reset(self) -> None:
+        self.operations.clear()
+        self.tests.clear()
+
+    def top(self, count: int = 10) -> List[Tuple[str, Histogram]]:
+        """Operações com maior tempo total"""
+        return sorted(self.operations.items(), key=lambda entry: -entry[1].total)[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operations": {name: histogram.to_dict() for name, histogram in self.operations.items()},
+            "tests": {
+                test: {name: histogram.to_dict() for name, histogram in operations.items()}
+                for test, operations in self.tests.items()
+            },
+        }
+
+    def export(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as timing_file:
+            json.dump(self.to_dict(), timing_file, indent=2)
+
+
+# Instância usada pelos Page Objects (ligada pelo conftest com --page-timing/PAGE_TIMING)
+page_timer = PageTimer(enabled=os.getenv("PAGE_TIMING", "false").lower() == "true")
+
+
+def timed(operation: str, function: Callable) -> Callable:
+    """Envolve a função para registrar o seu tempo em page_timer quando ligado"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not page_timer.enabled:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            page_timer.record(operation, time.perf_counter() - start)
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def instrument_class(cls: type) -> type:
+    """Aplica `timed` aos métodos públicos definidos na própria classe"""
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(value) or getattr(value, "__timed__", False):
+            continue
+        setattr(cls, name, timed(f"{cls.__name__}.{name}", value))
+    return cls
@@ -0,0 +1,156 @@
+"""
+Execução paralela da suíte: divide os testes em N workers (processos pytest),
+cada um com o seu próprio app.py em uma porta efêmera e o seu próprio navegador.
+
+Uso:
+    python -m utils.parallel_runner -n 4 -- -m critical --browser=chrome --headless
+    python -m utils.parallel_runner -n auto
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+from utils.app_server import PROJECT_ROOT
+from utils.artifact_store import new_run_id
+from utils.result_sink import DEFAULT_RESULTS_DIR, merge, results_path
+from utils.test_durations import DurationHistory
+
+# Códigos de saída do pytest que não indicam falha de um worker
+EXIT_OK = 0
+EXIT_NO_TESTS = 5
+
+
+def worker_command(pytest_args: List[str], index: int, count: int, log_dir: str) -> List[str]:
+    """Monta a linha de comando do pytest para o worker de índice `index`"""
+    return [
+        sys.executable, "-m", "pytest", *pytest_args,
+        f"--shard-index={index}",
+        f"--shard-count={count}",
+        f"--shard-report={shard_report_path(log_dir, index)}",
+        "--app-server=embedded",
+    ]
+
+
+def shard_report_path(log_dir: str, index: int) -> str:
+    return os.path.abspath(os.path.join(log_dir, f"shard-{index}.json"))
+
+
+def option_value(pytest_args: List[str], option: str, default: str) -> str:
+    """Valor de uma opção repassada ao pytest (--opcao=valor ou --opcao valor)"""
+    for i, arg in enumerate(pytest_args):
+        if arg.startswith(f"{option}="):
+            return arg.split("=", 1)[1]
+        if arg == option and i + 1 < len(pytest_args):
+            return pytest_args[i + 1]
+    return default
+
+
+def durations_file(pytest_args: List[str]) -> str:
+    """Arquivo de histórico de durações usado pelos workers"""
+    return option_value(pytest_args, "--durations-file", ".test_durations.json")
+
+
+def merge_results(pytest_args: List[str], workers: int, output: str) -> None:
+    """Monta um único relatório HTML a partir dos resultados JSONL dos workers"""
+    results_dir = option_value(pytest_args, "--results-dir", DEFAULT_RESULTS_DIR)
+    if not results_dir:
+        return
+    paths = [
+        path for path in (
+            os.path.join(PROJECT_ROOT, results_path(results_dir, f"gw{index}")) for index in range(workers)
+        )
+        if os.path.exists(path)
+    ]
+    if paths:
+        tests = merge(paths, output)
+        print(f"relatório com {len(tests)} testes de {len(paths)} workers em {output}")
+
+
+def print_makespan(log_dir: str, workers: int) -> None:
+    """Mostra o makespan previsto e real de cada shard"""
+    predicted_all, actual_all = [], []
+    for index in range(workers):
+        try:
+            with open(shard_report_path(log_dir, index), encoding="utf-8") as report_file:
+                report = json.load(report_file)
+        except (OSError, ValueError):
+            print(f"shard {index}: sem relatório")
+            continue
+        predicted_all.append(report["predicted"])
+        actual_all.append(report["actual"])
+        print(f"shard {index}: previsto {report['predicted']:.1f}s, real {report['actual']:.1f}s")
+    if predicted_all:
+        print(f"makespan: previsto {max(predicted_all):.1f}s, real {max(actual_all):.1f}s")
+
+
+def combine_exit_codes(codes: List[int]) -> int:
+    """Combina os códigos de saída dos workers em um único código"""
+    failures = [code for code in codes if code not in (EXIT_OK, EXIT_NO_TESTS)]
+    if failures:
+        return max(failures)
+    return EXIT_OK if EXIT_OK in codes else EXIT_NO_TESTS
+
+
+def run_parallel(pytest_args: List[str], workers: int, log_dir: str) -> int:
+    """Inicia os workers, aguarda todos terminarem e imprime um resumo"""
+    os.makedirs(log_dir, exist_ok=True)
+    processes = []
+    start = time.perf_counter()
+    # Todos os workers registram os artefatos de falha na mesma execução
+    run_id = new_run_id()
+
+    for index in range(workers):
+        log_path = os.path.join(log_dir, f"worker-{index}.log")
+        log_file = open(log_path, "w", encoding="utf-8")
+        env = dict(os.environ, TEST_WORKER_ID=f"gw{index}", TEST_RUN_ID=run_id)
+        process = subprocess.Popen(
+            worker_command(pytest_args, index, workers, log_dir),
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+        processes.append((index, process, log_file, log_path))
+
+    codes = []
+    for index, process, log_file, log_path in processes:
+        code = process.wait()
+        log_file.close()
+        codes.append(code)
+        print(f"worker gw{index}: código {code} ({time.perf_counter() - start:.1f}s) - log em {log_path}")
+
+    print_makespan(log_dir, workers)
+    merge_results(pytest_args, workers, os.path.join(PROJECT_ROOT, "reports", "report.html"))
+    DurationHistory(os.path.join(PROJECT_ROOT, durations_file(pytest_args))).consolidate()
+
+    exit_code = combine_exit_codes(codes)
+    print(f"{workers} workers finalizados em {time.perf_counter() - start:.1f}s, código de saída {exit_code}")
+    return exit_code
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Executa a suíte de testes em paralelo")
+    parser.add_argument(
+        "-n", "--workers", default="auto",
+        help="Número de workers ou 'auto' para usar um por núcleo de CPU",
+    )
+    parser.add_argument(
+        "--log-dir", default=os.path.join("reports", "workers"),
+        help="Diretório onde a saída de cada worker é gravada",
+    )
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Argumentos repassados ao pytest")
+    args = parser.parse_args(argv)
+
+    workers = (os.cpu_count() or 1) if args.workers == "auto" else int(args.workers)
+    pytest_args = args.pytest_args
+    if pytest_args[:1] == ["--"]:
+        pytest_args = pytest_args[1:]
+    return run_parallel(pytest_args, max(1, workers), args.log_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""
+Driver "sem navegador" para os Page Objects.
+
+Executa o app.py no mesmo processo pelo test client do Flask e interpreta o HTML
+renderizado. Implementa o subconjunto da API do WebDriver usado por BasePage,
+FormPage, HomePage e SuccessPage (get, find_element(s), send_keys, clear, click
+em links e botões de envio, current_url, title), sem JavaScript nem renderização.
+Serve para os testes que só verificam a validação no servidor e os redirecionamentos.
+"""
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+})
+REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+SUBMIT_KEYS = ("\ue006", "\ue007")  # Keys.RETURN e Keys.ENTER
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+$")
+
+
+class _Node:
+    """Elemento do DOM simplificado"""
+
+    def __init__(self, tag: str, attrs: Dict[str, Optional[str]], parent: Optional["_Node"] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List = []
+        self.value = attrs.get("value") or ""
+
+    def iter(self):
+        """Percorre os descendentes em ordem de documento"""
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield child
+                yield from child.iter()
+
+    def text_content(self) -> str:
+        parts = []
+        for child in self.children:
+            parts.append(child.text_content() if isinstance(child, _Node) else child)
+        return "".join(parts)
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+
+class _DocumentParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document", {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, dict(attrs), self.current)
+        self.current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(_Node(tag, dict(attrs), self.current))
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+def _parse(html: str) -> _Node:
+    parser = _DocumentParser()
+    parser.feed(html)
+    parser.close()
+    for node in parser.root.iter():
+        if node.tag == "textarea":
+            node.value = node.text_content()
+    return parser.root
+
+
+# Seletor composto simples: tag, #id, .classe e [atributo] / [atributo="valor"]
+_COMPOUND = re.compile(r"^([a-zA-Z][\w-]*|\*)?((?:#[\w-]+|\.[\w-]+|\[[\w-]+(?:=\"?[^\]\"]*\"?)?\])*)$")
+_PART = re.compile(r"#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:=\"?([^\]\"]*)\"?)?\]")
+
+
+def _compound_matcher(selector: str):
+    match = _COMPOUND.match(selector)
+    if not match or not selector:
+        raise InvalidSelectorException(f"Seletor CSS não suportado sem navegador: {selector}")
+    tag, parts = match.group(1), match.group(2)
+    checks = []
+    for element_id, class_name, attr, value in _PART.findall(parts):
+        if element_id:
+            checks.append(lambda node, v=element_id: node.attrs.get("id") == v)
+        elif class_name:
+            checks.append(lambda node, v=class_name: v in (node.attrs.get("class") or "").split())
+        elif value:
+            checks.append(lambda node, a=attr, v=value: node.attrs.get(a) == v)
+        else:
+            checks.append(lambda node, a=attr: a in node.attrs)
+    return lambda node: (not tag or tag == "*" or node.tag == tag) and all(check(node) for check in checks)
+
+
+def _css_matcher(selector: str):
+    """Suporta listas de seletores (a, b) e o combinador de descendente (a b)"""
+    alternatives = []
+    for group in selector.split(","):
+        compounds = [_compound_matcher(part) for part in group.split()]
+        alternatives.append(compounds)
+
+    def matches(node) -> bool:
+        for compounds in alternatives:
+            if not compounds[-1](node):
+                continue
+            remaining = compounds[:-1]
+            for ancestor in node.ancestors():
+                if remaining and remaining[-1](ancestor):
+                    remaining = remaining[:-1]
+            if not remaining:
+                return True
+        return False
+    return matches
+
+
+def _normalize_space(text: str) -> str:
+    return " ".join(text.split())
+
+
+class ProtocolElement:
+    """Equivalente mínimo de WebElement sobre o DOM interpretado"""
+
+    def __init__(self, driver: "ProtocolDriver", node: _Node):
+        self._driver = driver
+        self._node = node
+
+    @property
+    def tag_name(self) -> str:
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        return _normalize_space(self._node.text_content()) if self.is_displayed() else ""
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name == "value" and self._node.tag in ("input", "textarea", "select"):
+            return self._node.value
+        return self._node.attrs.get(name)
+
+    get_dom_attribute = get_attribute
+
+    def is_displayed(self) -> bool:
+        for node in [self._node, *self._node.ancestors()]:
+            style = (node.attrs.get("style") or "").replace(" ", "")
+            if node.tag == "head" or "hidden" in node.attrs or "display:none" in style:
+                return False
+        return not (self._node.tag == "input" and self._node.attrs.get("type") == "hidden")
+
+    def is_enabled(self) -> bool:
+        return "disabled" not in self._node.attrs
+
+    def clear(self) -> None:
+        self._node.value = ""
+
+    def send_keys(self, *values) -> None:
+        text = "".join(str(value) for value in values)
+        submit = any(key in text for key in SUBMIT_KEYS)
+        for key in SUBMIT_KEYS:
+            text = text.replace(key, "")
+        self._node.value += text
+        if submit:
+            self.submit()
+
+    def click(self) -> None:
+        node = self._node
+        if node.tag == "a" and node.attrs.get("href") is not None:
+            self._driver.get(urljoin(self._driver.current_url, node.attrs["href"]))
+        elif self._is_submit_button():
+            self.submit()
+
+    def submit(self) -> None:
+        form = self._node if self._node.tag == "form" else next(
+            (ancestor for ancestor in self._node.ancestors() if ancestor.tag == "form"), None
+        )
+        if form is not None:
+            self._driver._submit_form(form, submitter=self._node if self._is_submit_button() else None)
+
+    def find_element(self, by: str = "id", value: str = None) -> "ProtocolElement":
+        return self._driver._find_one(self._node, by, value)
+
+    def find_elements(self, by: str = "id", value: str = None) -> List["ProtocolElement"]:
+        return self._driver._find_all(self._node, by, value)
+
+    def _is_submit_button(self) -> bool:
+        node = self._node
+        if node.tag == "button":
+            return node.attrs.get("type", "submit") == "submit"
+        return node.tag == "input" and node.attrs.get("type") in ("submit", "image")
+
+
+class _SwitchTo:
+    def window(self, handle) -> None:
+        pass
+
+
+class ProtocolDriver:
+    """
+    Driver que fala diretamente com a aplicação Flask (sem navegador).
+    Aceita qualquer URL: o esquema e o host são mantidos em current_url e o
+    caminho é enviado ao test client
+    """
+
+    window_handles = ["main"]
+
+    def __init__(self, app=None):
+        if app is None:
+            from app import app
+        self.app = app
+        self.client = app.test_client()
+        self.switch_to = _SwitchTo()
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self.status_code: Optional[int] = None
+        self._document = _parse("")
+        self._history: List[str] = []
+
+    # Navegação
+
+    def get(self, url: str) -> None:
+        self._request("GET", urljoin(self.current_url, url))
+
+    def refresh(self) -> None:
+        if self._history:
+            self._request("GET", self._history.pop(), record=True)
+
+    def back(self) -> None:
+        if len(self._history) > 1:
+            self._history.pop()
+            self._request("GET", self._history.pop())
+
+    @property
+    def title(self) -> str:
+        title = next((node for node in self._document.iter() if node.tag == "title"), None)
+        return _normalize_space(title.text_content()) if title else ""
+
+    # Busca de elementos
+
+    def find_element(self, by: str = "id", value: str = None) -> ProtocolElement:
+        return self._find_one(self._document, by, value)
+
+    def find_elements(self, by: str = "id", value: str = None) -> List[ProtocolElement]:
+        return self._find_all(self._document, by, value)
+
+    # Métodos de configuração do navegador sem efeito aqui
+
+    def implicitly_wait(self, seconds: float) -> None:
+        pass
+
+    def maximize_window(self) -> None:
+        pass
+
+    def set_window_size(self, width: int, height: int) -> None:
+        pass
+
+    def delete_all_cookies(self) -> None:
+        self.client = self.app.test_client()
+
+    def save_screenshot(self, filename: str) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        self._history.clear()
+
+    # Implementação
+
+    def _request(self, method: str, url: str, data: Dict[str, str] = None, record: bool = True) -> None:
+        for _ in range(10):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            response = self.client.open(
+                path,
+                method=method,
+                data=data,
+                base_url=f"{parts.scheme}://{parts.netloc}" if parts.netloc else "http://localhost",
+            )
+            location = response.headers.get("Location")
+            if response.status_code in REDIRECT_CODES and location:
+                url = urljoin(url, location)
+                if response.status_code in (301, 302, 303):
+                    method, data = "GET", None
+                continue
+            break
+
+        self.current_url = url
+        self.status_code = response.status_code
+        self.page_source = response.get_data(as_text=True)
+        self._document = _parse(self.page_source)
+        if record and method == "GET":
+            self._history.append(url)
+
+    def _submit_form(self, form: _Node, submitter: Optional[_Node] = None) -> None:
+        controls = [node for node in form.iter() if node.tag in ("input", "textarea", "select", "button")]
+        # Validação nativa do HTML5 que o navegador faria antes de enviar
+        for node in controls:
+            if not self._is_valid(node):
+                return
+
+        data = {}
+        for node in controls:
+            name = node.attrs.get("name")
+            if not name or "disabled" in node.attrs:
+                continue
+            input_type = node.attrs.get("type", "text")
+            if node.tag == "button" or input_type in ("submit", "image", "button", "reset"):
+                if node is submitter:
+                    data[name] = node.attrs.get("value", "")
+                continue
+            if input_type in ("checkbox", "radio") and "checked" not in node.attrs:
+                continue
+            if node.tag == "select":
+                options = [option for option in node.iter() if option.tag == "option"]
+                selected = next((option for option in options if "selected" in option.attrs), options[0] if options else None)
+                data[name] = selected.attrs.get("value", selected.text_content()) if selected else ""
+                continue
+            data[name] = node.value
+
+        method = (form.attrs.get("method") or "get").upper()
+        action = urljoin(self.current_url, form.attrs.get("action") or self.current_url)
+        if method == "GET":
+            query = urlencode(data)
+            self._request("GET", action.split("?")[0] + ("?" + query if query else ""))
+        else:
+            self._request(method, action, data=data)
+
+    @staticmethod
+    def _is_valid(node: _Node) -> bool:
+        if node.tag not in ("input", "textarea") or "disabled" in node.attrs:
+            return True
+        if "required" in node.attrs and not node.value:
+            return False
+        if node.attrs.get("type") == "email" and node.value:
+            return bool(EMAIL_PATTERN.match(node.value))
+        return True
+
+    def _find_all(self, root: _Node, by: str, value: str) -> List[ProtocolElement]:
+        matcher = self._matcher(by, value)
+        return [ProtocolElement(self, node) for node in root.iter() if matcher(node)]
+
+    def _find_one(self, root: _Node, by: str, value: str) -> ProtocolElement:
+        found = self._find_all(root, by, value)
+        if not found:
+            raise NoSuchElementException(f"Elemento não encontrado: {by}={value}")
+        return found[0]
+
+    @staticmethod
+    def _matcher(by: str, value: str):
+        if by == "id":
+            return lambda node: node.attrs.get("id") == value
+        if by == "name":
+            return lambda node: node.attrs.get("name") == value
+        if by == "tag name":
+            return lambda node: node.tag == value.lower()
+        if by == "class name":
+            return lambda node: value in (node.attrs.get("class") or "").split()
+        if by == "link text":
+            return lambda node: node.tag == "a" and _normalize_space(node.text_content()) == value
+        if by == "partial link text":
+            return lambda node: node.tag == "a" and value in _normalize_space(node.text_content())
+        if by == "css selector":
+            return _css_matcher(value)
+        raise InvalidSelectorException(f"Estratégia de locator não suportada sem navegador: {by}")
+
@@ -0,0 +1,246 @@
+"""
+Resultados em streaming (JSONL) e relatório HTML mesclado de vários shards.
+
+Durante a execução cada fase de cada teste (setup, call, teardown) vira uma linha
+JSON compacta, gravada e descarregada (flush) assim que a fase termina. Se o
+processo for interrompido, tudo o que já rodou continua no arquivo; uma última
+linha truncada é ignorada na leitura. Os artefatos de falha entram como caminhos
+(sem screenshots embutidos no relatório).
+
+Cada worker grava o seu próprio arquivo e o relatório é montado depois:
+
+    pytest --results-dir=reports/results
+    python -m utils.result_sink merge reports/results -o reports/report.html
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from utils.html_report import render_report
+from utils.marker_reports import EXIT_NO_TESTS_COLLECTED, group_exit_code
+
+DEFAULT_RESULTS_DIR = os.path.join("reports", "results")
+
+# Mensagens de falha longas são cortadas: o registro deve continuar compacto
+MAX_MESSAGE_CHARS = 8000
+
+PHASES = ("setup", "call", "teardown")
+
+
+def results_path(results_dir: str, worker_id: Optional[str] = None) -> str:
+    """Arquivo JSONL do worker (main quando a execução não é paralela)"""
+    return os.path.join(results_dir, f"{worker_id or 'main'}.jsonl")
+
+
+class ResultSink:
+    """Grava um registro JSON por linha, descarregando cada um imediatamente"""
+
+    def __init__(self, path: str, run_id: str = "", worker_id: Optional[str] = None):
+        self.path = path
+        self.run_id = run_id
+        self.worker_id = worker_id or "main"
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Um arquivo por execução do worker: o conteúdo anterior é descartado
+        self._file = open(path, "w", encoding="utf-8")
+        self.write({"type": "session", "started_at": time.time(), "pid": os.getpid()})
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Acrescenta o registro (com execução e worker) ao arquivo"""
+        record = dict(record, run_id=self.run_id, worker=self.worker_id)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        # A gravação de artefatos chama a partir da thread de fundo
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def write_phase(self, item, report) -> None:
+        """Registro de uma fase do teste a partir do TestReport do pytest"""
+        record = {
+            "type": "phase",
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": report.outcome,
+            "duration": round(report.duration, 6),
+            "stop": getattr(report, "stop", time.time()),
+        }
+        if report.when == "setup":
+            record["markers"] = sorted({marker.name for marker in item.iter_markers()})
+        if report.failed or report.skipped:
+            record["message"] = report.longreprtext[-MAX_MESSAGE_CHARS:]
+        self.write(record)
+
+    def write_row(self, nodeid: str, result) -> None:
+        """Sub-resultado de uma linha de um teste orientado a dados (RowResult)"""
+        record = {
+            "type": "row",
+            "nodeid": f"{nodeid}[linha {result.index}]",
+            "outcome": result.outcome,
+            "duration": round(result.duration, 6),
+        }
+        if result.message:
+            record["message"] = result.message[-MAX_MESSAGE_CHARS:]
+        self.write(record)
+
+    def write_datasets(self, datasets: Dict[str, str]) -> None:
+        """Hash de cada dataset usado, para rastrear os resultados até os dados"""
+        for path, content_hash in datasets.items():
+            self.write({"type": "dataset", "path": path, "sha256": content_hash})
+
+    def write_artifacts(self, nodeid: str, artifacts: Dict[str, str]) -> None:
+        """Caminhos dos artefatos de falha, gravados quando já estão em disco"""
+        if artifacts:
+            paths = {kind: os.path.abspath(path) for kind, path in artifacts.items()}
+            self.write({"type": "artifacts", "nodeid": nodeid, "artifacts": paths})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def expand_paths(paths: Iterable[str]) -> List[str]:
+    """Arquivos JSONL a partir de arquivos, diretórios e padrões glob"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.jsonl"))))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path)))
+        else:
+            files.append(path)
+    return files
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Registros do arquivo; linhas incompletas (processo interrompido) são ignoradas"""
+    with open(path, encoding="utf-8", errors="replace") as results_file:
+        for line in results_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def fold_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Combina as fases de cada teste em um resultado (nodeid, outcome, duration,
+    message, markers, artifacts), com as mesmas regras dos relatórios por marcador.
+    Um teste sem o registro de teardown foi interrompido e é contado como erro
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        nodeid = record.get("nodeid")
+        if record.get("type") == "artifacts" and nodeid in results:
+            results[nodeid].setdefault("artifacts", {}).update(record["artifacts"])
+            continue
+        if record.get("type") == "row":
+            # Linha de um teste orientado a dados: já é um resultado completo
+            results[nodeid] = {
+                "nodeid": nodeid,
+                "outcome": record["outcome"],
+                "duration": record.get("duration", 0.0),
+                "message": record.get("message", ""),
+                "markers": [],
+                "worker": record.get("worker"),
+                "run_id": record.get("run_id"),
+                "phases": list(PHASES),
+            }
+            continue
+        if record.get("type") != "phase" or record.get("when") not in PHASES:
+            continue
+        if record["when"] == "setup" or nodeid not in results:
+            # Um novo setup do mesmo teste (nova execução) substitui o resultado anterior
+            results[nodeid] = {
+                "nodeid": nodeid,
+                "outcome": "passed",
+                "duration": 0.0,
+                "message": "",
+                "markers": record.get("markers", []),
+                "worker": record.get("worker"),
+                "run_id": record.get("run_id"),
+                "phases": [],
+            }
+        result = results[nodeid]
+        result["phases"].append(record["when"])
+        result["duration"] += record.get("duration", 0.0)
+        if record["outcome"] == "failed" and result["outcome"] != "failed":
+            result["outcome"] = "failed" if record["when"] == "call" else "error"
+            result["message"] = record.get("message", "")
+        elif record["outcome"] == "skipped" and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+            result["message"] = record.get("message", "")
+
+    tests = []
+    for result in results.values():
+        phases = result.pop("phases")
+        if "teardown" not in phases and result["outcome"] in ("passed", "skipped"):
+            result["outcome"] = "error"
+            result["message"] = f"Execução interrompida após a fase {phases[-1]}"
+        tests.append(result)
+    return tests
+
+
+def merge(paths: Sequence[str], output: str, title: str = "Relatório de testes") -> List[Dict[str, Any]]:
+    """Gera um único relatório HTML (e o JSON ao lado) a partir dos arquivos JSONL"""
+    datasets: Dict[str, str] = {}
+
+    def records():
+        for path in expand_paths(paths):
+            for record in read_records(path):
+                if record.get("type") == "dataset":
+                    datasets[record["path"]] = record["sha256"]
+                yield record
+
+    tests = sorted(fold_records(records()), key=lambda test: test["nodeid"])
+    output_dir = os.path.dirname(os.path.abspath(output))
+    os.makedirs(output_dir, exist_ok=True)
+    # Links relativos ao relatório, apontando para os arquivos já gravados (sem cópias)
+    linked = [
+        dict(test, artifacts={
+            kind: os.path.relpath(path, output_dir).replace(os.sep, "/")
+            for kind, path in test["artifacts"].items()
+        }) if test.get("artifacts") else test
+        for test in tests
+    ]
+    with open(output, "w", encoding="utf-8") as report_file:
+        report_file.write(render_report(title, linked))
+    with open(f"{os.path.splitext(output)[0]}.json", "w", encoding="utf-8") as results_file:
+        json.dump({"exit_code": group_exit_code(tests), "datasets": datasets, "tests": linked},
+                  results_file, indent=2)
+    return tests
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Relatório a partir dos resultados em JSONL")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge_parser = subparsers.add_parser("merge", help="Mescla os arquivos JSONL dos shards em um relatório HTML")
+    merge_parser.add_argument("paths", nargs="+", help="Arquivos JSONL, diretórios ou padrões glob")
+    merge_parser.add_argument("-o", "--output", default=os.path.join("reports", "report.html"))
+    merge_parser.add_argument("--title", default="Relatório de testes")
+    args = parser.parse_args(argv)
+
+    files = expand_paths(args.paths)
+    if not files:
+        print("Nenhum arquivo de resultados encontrado")
+        return EXIT_NO_TESTS_COLLECTED
+    tests = merge(files, args.output, args.title)
+    failed = sum(1 for test in tests if test["outcome"] in ("failed", "error"))
+    print(f"{len(tests)} testes de {len(files)} arquivos, {failed} com falha - relatório em {args.output}")
+    return group_exit_code(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Execução orientada a dados em um único navegador.
+
+As linhas (dicionários) vêm de qualquer iterável: gerador, `UserBatch` ou `Dataset`.
+Cada linha passa pelo fluxo informado (por padrão formulário -> sucesso) no mesmo
+navegador já aberto e gera o seu próprio sub-resultado. Nada é acumulado por linha:
+o consumo de memória é o mesmo para 10 ou 100 mil linhas (ficam só os contadores e
+as primeiras falhas).
+
+O checkpoint guarda a primeira linha que falhou; com `resume=True` a próxima execução
+recomeça dela. Depois de uma execução sem falhas o checkpoint é removido.
+"""
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_CHECKPOINT_DIR = os.path.join("reports", "checkpoints")
+
+# Falhas mantidas (com mensagem) para o resumo do teste
+MAX_REPORTED_FAILURES = 10
+
+
+@dataclass
+class RowResult:
+    """Sub-resultado de uma linha"""
+    index: int
+    outcome: str
+    duration: float
+    message: str = ""
+
+
+@dataclass
+class RowSummary:
+    """Contadores da execução e as primeiras falhas"""
+    start: int = 0
+    passed: int = 0
+    failed: int = 0
+    failures: List[RowResult] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed
+
+    def describe(self) -> str:
+        lines = [f"{self.failed} de {self.total} linhas falharam (a partir da linha {self.start})"]
+        lines += [f"  linha {result.index}: {result.message}" for result in self.failures]
+        if self.failed > len(self.failures):
+            lines.append(f"  ... e mais {self.failed - len(self.failures)}")
+        return "\n".join(lines)
+
+
+def checkpoint_path(checkpoint_dir: str, test_id: str) -> str:
+    """Arquivo de checkpoint do teste (nodeid com caracteres seguros para nome de arquivo)"""
+    return os.path.join(checkpoint_dir, re.sub(r"[^\w.-]+", "_", test_id).strip("_") + ".json")
+
+
+class FormFlow:
+    """Fluxo padrão de uma linha: abre o formulário, envia nome/email e confere a página de sucesso"""
+
+    def __init__(self, driver, base_url: str = None):
+        from pages.form_page import FormPage
+        from pages.success_page import SuccessPage
+
+        self.form_page = FormPage(driver, base_url)
+        self.success_page = SuccessPage(driver, base_url)
+
+    def __call__(self, row: Dict[str, str]) -> None:
+        self.form_page.navigate()
+        self.form_page.fill_form_and_submit(row["name"], row["email"])
+        if not self.success_page.is_on_success_page():
+            raise AssertionError(
+                f"Não chegou à página de sucesso (URL {self.success_page.get_current_url()}) "
+                f"com nome={row['name']!r} email={row['email']!r}"
+            )
+
+
+class RowRunner:
+    """Executa um fluxo para cada linha no mesmo navegador, com checkpoint da primeira falha"""
+
+    def __init__(self, flow: Callable[[Dict[str, str]], None], checkpoint: str = None,
+                 reset: Callable[[], bool] = None, on_result: Callable[[RowResult], None] = None,
+                 resume: bool = False):
+        self.flow = flow
+        self.checkpoint = checkpoint
+        self.resume = resume
+        # Chamado depois de uma linha que falhou; False aborta a execução (navegador inutilizável)
+        self.reset = reset
+        self.on_result = on_result
+
+    def resume_index(self) -> int:
+        """Linha de onde retomar (primeira falha da execução anterior) ou 0"""
+        if not self.checkpoint:
+            return 0
+        try:
+            with open(self.checkpoint, encoding="utf-8") as checkpoint_file:
+                return int(json.load(checkpoint_file)["failed_row"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+    def run(self, rows: Iterable[Dict[str, str]], resume: Optional[bool] = None) -> RowSummary:
+        """Executa o fluxo para cada linha (a partir do checkpoint com resume=True)"""
+        resume = self.resume if resume is None else resume
+        summary = RowSummary(start=self.resume_index() if resume else 0)
+        for index, row in enumerate(self._rows_from(rows, summary.start), start=summary.start):
+            result = self._run_row(index, row)
+            if self.on_result is not None:
+                self.on_result(result)
+            if result.outcome == "passed":
+                summary.passed += 1
+                continue
+            summary.failed += 1
+            if len(summary.failures) < MAX_REPORTED_FAILURES:
+                summary.failures.append(result)
+            if summary.failed == 1:
+                self._save_checkpoint(index)
+            if self.reset is not None and not self.reset():
+                raise RuntimeError(f"Navegador inutilizável após a falha da linha {index}; "
+                                   f"retome a partir do checkpoint {self.checkpoint}")
+        if summary.failed == 0:
+            self._clear_checkpoint()
+        return summary
+
+    @staticmethod
+    def _rows_from(rows: Iterable[Dict[str, str]], start: int) -> Iterator[Dict[str, str]]:
+        """Linhas a partir de `start`; datasets e lotes pulam direto, sem decodificar as anteriores"""
+        if start and hasattr(rows, "__len__") and hasattr(rows, "__getitem__"):
+            return (rows[index] for index in range(start, len(rows)))
+        return islice(rows, start, None)
+
+    def _run_row(self, index: int, row: Dict[str, str]) -> RowResult:
+        start = time.perf_counter()
+        try:
+            self.flow(row)
+        except AssertionError as e:
+            return RowResult(index, "failed", time.perf_counter() - start, str(e) or "AssertionError")
+        except Exception as e:
+            return RowResult(index, "error", time.perf_counter() - start, f"{e.__class__.__name__}: {e}")
+        return RowResult(index, "passed", time.perf_counter() - start)
+
+    def _save_checkpoint(self, index: int) -> None:
+        if not self.checkpoint:
+            return
+        directory = os.path.dirname(self.checkpoint)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.checkpoint, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({"failed_row": index, "saved_at": time.time()}, checkpoint_file)
+
+    def _clear_checkpoint(self) -> None:
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
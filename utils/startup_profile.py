@@ -0,0 +1,171 @@
+"""
+Perfil de inicialização da suíte: tempo de coleta e custo de importação por módulo.
+
+Executa `pytest --collect-only` duas vezes em um subprocesso: uma normal, para o tempo
+de parede (o `-X importtime` adiciona overhead), e outra com `-X importtime`, cuja saída
+é resumida em módulos com maior tempo acumulado e próprio e pacotes mais caros. Os
+módulos pesados (pilha do WebDriver, numpy, webdriver_manager) devem ser importados só
+quando um navegador é criado ou um lote é gerado; se algum aparecer na coleta, o
+relatório mostra quem o importou.
+
+Uso:
+    python -m utils.startup_profile
+    python -m utils.startup_profile --top 20 --budget 1.0 -- -m unit
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Sequence
+
+DEFAULT_OUTPUT = os.path.join("reports", "startup-profile.json")
+
+# Módulos que a coleta não deve importar (carregados sob demanda pelo framework)
+HEAVY_MODULES = (
+    "selenium.webdriver.remote.webdriver",
+    "selenium.webdriver.chrome.webdriver",
+    "selenium.webdriver.firefox.webdriver",
+    "webdriver_manager",
+    "numpy",
+)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+COLLECTED_IN = re.compile(r"collected.* in ([\d.]+)s")
+
+
+@dataclass
+class ImportRecord:
+    """Uma linha do `-X importtime` (tempos em microssegundos)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportRecord]:
+    """Registros na ordem da saída (cada módulo aparece depois dos que ele importou)"""
+    records = []
+    for line in lines:
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            # Um espaço separa as colunas; cada nível de aninhamento acrescenta dois
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def import_chain(records: Sequence[ImportRecord], module: str) -> List[str]:
+    """Cadeia de quem importou o módulo, do próprio módulo até o nível mais externo"""
+    for index, record in enumerate(records):
+        if record.module == module:
+            break
+    else:
+        return []
+    chain, depth = [module], record.depth
+    for parent in records[index + 1:]:
+        if parent.depth < depth:
+            chain.append(parent.module)
+            depth = parent.depth
+            if depth == 0:
+                break
+    return chain
+
+
+def summarize(records: Sequence[ImportRecord], top: int = 15,
+              heavy_modules: Sequence[str] = HEAVY_MODULES) -> Dict[str, object]:
+    """Totais, módulos mais caros, custo por pacote de topo e módulos pesados importados"""
+    packages: Dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".")[0]
+        packages[package] = packages.get(package, 0) + record.self_us
+    loaded = {record.module: record for record in records}
+    return {
+        "modules": len(records),
+        "import_seconds": sum(record.self_us for record in records) / 1e6,
+        "top_cumulative": [asdict(record) for record in
+                           sorted(records, key=lambda record: -record.cumulative_us)[:top]],
+        "top_self": [asdict(record) for record in sorted(records, key=lambda record: -record.self_us)[:top]],
+        "packages": dict(sorted(packages.items(), key=lambda entry: -entry[1])[:top]),
+        "heavy": {
+            module: {"cumulative_us": loaded[module].cumulative_us, "chain": import_chain(records, module)}
+            for module in heavy_modules if module in loaded
+        },
+    }
+
+
+def run_collection(pytest_args: Sequence[str], importtime: bool = False):
+    """Executa `pytest --collect-only -q` e retorna (tempo de parede, processo concluído)"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *pytest_args]
+    start = time.perf_counter()
+    completed = subprocess.run(command, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    return time.perf_counter() - start, completed
+
+
+def profile(pytest_args: Sequence[str] = (), top: int = 15) -> Dict[str, object]:
+    """Tempo de parede, tempo de coleta informado pelo pytest e o resumo das importações"""
+    wall_seconds, completed = run_collection(pytest_args)
+    if completed.returncode != 0:
+        raise RuntimeError(f"pytest --collect-only falhou ({completed.returncode}):\n"
+                           f"{completed.stdout[-2000:]}{completed.stderr[-2000:]}")
+    collected = COLLECTED_IN.search(completed.stdout)
+    _, traced = run_collection(pytest_args, importtime=True)
+    summary = summarize(parse_importtime(traced.stderr.splitlines()), top)
+    summary.update({
+        "pytest_args": list(pytest_args),
+        "wall_seconds": wall_seconds,
+        "collection_seconds": float(collected.group(1)) if collected else None,
+    })
+    return summary
+
+
+def print_profile(summary: Dict[str, object]) -> None:
+    collection = summary["collection_seconds"]
+    print(f"inicialização + coleta: {summary['wall_seconds']:.2f} s (parede)"
+          + (f", coleta {collection:.2f} s" if collection is not None else ""))
+    print(f"importações: {summary['modules']} módulos, {summary['import_seconds']:.2f} s (com -X importtime)")
+    print("\nmaior tempo acumulado:")
+    for record in summary["top_cumulative"]:
+        print(f"  {record['cumulative_us'] / 1000:8.1f} ms  {record['module']}")
+    print("\nmaior tempo próprio:")
+    for record in summary["top_self"]:
+        print(f"  {record['self_us'] / 1000:8.1f} ms  {record['module']}")
+    print("\npor pacote:")
+    for package, self_us in summary["packages"].items():
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+    for module, details in summary["heavy"].items():
+        print(f"\nMÓDULO PESADO na coleta: {module} ({details['cumulative_us'] / 1000:.1f} ms)\n  "
+              + " <- ".join(details["chain"]))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Perfil de importação e coleta da suíte de testes")
+    parser.add_argument("--top", type=int, default=15, help="Módulos listados em cada ranking")
+    parser.add_argument("--budget", type=float, help="Falha se inicialização + coleta passar deste tempo (s)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("pytest_args", nargs="*", help="Argumentos repassados ao pytest (após --)")
+    args = parser.parse_args(argv)
+
+    summary = profile(args.pytest_args, args.top)
+    print_profile(summary)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(summary, output_file, indent=2)
+    print(f"\nperfil em {args.output}")
+
+    over_budget = args.budget is not None and summary["wall_seconds"] > args.budget
+    if over_budget:
+        print(f"ACIMA DO LIMITE: {summary['wall_seconds']:.2f} s > {args.budget:.2f} s")
+    return 1 if over_budget or summary["heavy"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import glob
+import heapq
+import json
+import os
+import statistics
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Duração assumida para testes sem histórico quando nenhum teste tem histórico
+DEFAULT_DURATION = 1.0
+
+
+class DurationHistory:
+    """
+    Histórico local da duração de cada teste (setup + call + teardown), em segundos.
+
+    As durações são suavizadas com média móvel exponencial para que uma execução
+    isolada mais lenta não desbalanceie os shards. Workers paralelos gravam em
+    arquivos parciais (`<arquivo>.<worker>.json`), que são incorporados ao arquivo
+    principal na próxima leitura.
+    """
+
+    def __init__(self, path: str, alpha: float = 0.5, worker_id: Optional[str] = None):
+        self.path = path
+        self.alpha = alpha
+        self.worker_id = worker_id
+        self.durations: Dict[str, float] = {}
+        self._updated: Dict[str, float] = {}
+
+    def load(self) -> "DurationHistory":
+        """Lê o arquivo principal e os arquivos parciais dos workers"""
+        self.durations = _read_json(self.path)
+        for part_path in sorted(glob.glob(self._part_pattern())):
+            self.durations.update(_read_json(part_path))
+        return self
+
+    def get(self, nodeid: str) -> Optional[float]:
+        return self.durations.get(nodeid)
+
+    def default_duration(self) -> float:
+        """Estimativa para testes novos: a mediana dos testes conhecidos"""
+        if not self.durations:
+            return DEFAULT_DURATION
+        return statistics.median(self.durations.values())
+
+    def estimate(self, nodeid: str) -> float:
+        known = self.get(nodeid)
+        return known if known is not None else self.default_duration()
+
+    def record(self, nodeid: str, seconds: float) -> None:
+        """Registra a duração medida nesta execução"""
+        previous = self.durations.get(nodeid)
+        value = seconds if previous is None else self.alpha * seconds + (1 - self.alpha) * previous
+        self.durations[nodeid] = value
+        self._updated[nodeid] = value
+
+    def save(self) -> None:
+        """
+        Grava as durações atualizadas. Um worker grava apenas o seu arquivo parcial;
+        fora de um worker o histórico é consolidado no arquivo principal
+        """
+        if not self._updated:
+            return
+        if self.worker_id:
+            _write_json(self._part_path(self.worker_id), self._updated)
+            return
+        merged = _read_json(self.path)
+        for part_path in glob.glob(self._part_pattern()):
+            merged.update(_read_json(part_path))
+            os.remove(part_path)
+        merged.update(self._updated)
+        _write_json(self.path, merged)
+
+    def consolidate(self) -> None:
+        """Incorpora os arquivos parciais dos workers ao arquivo principal"""
+        self.load()
+        self._updated = dict(self.durations)
+        self.worker_id = None
+        self.save()
+
+    def _part_path(self, worker_id: str) -> str:
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{worker_id}{ext or '.json'}"
+
+    def _part_pattern(self) -> str:
+        root, ext = os.path.splitext(self.path)
+        return f"{glob.escape(root)}.*{ext or '.json'}"
+
+
+def split_into_shards(estimates: Sequence[Tuple[str, float]], shard_count: int) -> List[List[str]]:
+    """
+    Divide os testes em shards balanceados pela estratégia "maior primeiro" (LPT):
+    cada teste, do mais lento para o mais rápido, vai para o shard menos carregado.
+    O resultado é determinístico para que todos os workers calculem a mesma divisão
+    """
+    ordered = sorted(enumerate(estimates), key=lambda entry: (-entry[1][1], entry[0]))
+    heap = [(0.0, shard) for shard in range(shard_count)]
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    for _, (nodeid, seconds) in ordered:
+        load, shard = heapq.heappop(heap)
+        shards[shard].append(nodeid)
+        heapq.heappush(heap, (load + seconds, shard))
+    return shards
+
+
+def _read_json(path: str) -> Dict[str, float]:
+    try:
+        with open(path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: str, data: Dict[str, float]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -0,0 +1,190 @@
+"""
+Motor de esperas orientado a eventos.
+
+Em vez de dormir um intervalo fixo entre as verificações (o WebDriverWait usa 0,5 s),
+cada espera executa um script assíncrono no navegador que só retorna quando algo
+muda: uma mutação no DOM (MutationObserver), um evento de navegação/carregamento
+ou, no máximo, o intervalo de polling configurado (POLL_INTERVAL) para mudanças
+que não geram eventos (layout, CSS). A condição é verificada de novo logo em seguida.
+
+Drivers sem JavaScript (ex.: ProtocolDriver) usam apenas o intervalo de polling.
+"""
+import time
+from typing import Any, Callable, Tuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from utils.driver_hooks import logical_command
+
+DEFAULT_POLL_INTERVAL = 0.1
+# Nome da espera no CommandCounter: cada until conta como um comando lógico
+WAIT_COMMAND = "waitUntil"
+IGNORED_EXCEPTIONS: Tuple[type, ...] = (NoSuchElementException, StaleElementReferenceException)
+
+# Resolve na primeira mutação do DOM, em eventos de navegação/carregamento ou após
+# arguments[0] ms (arguments[1] é o callback do execute_async_script)
+WAIT_FOR_CHANGE = """
+var done = arguments[arguments.length - 1];
+var finished = false;
+var observer = null;
+var events = ["load", "readystatechange", "hashchange", "popstate", "pagehide", "transitionend", "animationend"];
+function finish() {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    events.forEach(function (name) {
+        window.removeEventListener(name, finish, true);
+        document.removeEventListener(name, finish, true);
+    });
+    clearTimeout(timer);
+    done(true);
+}
+var timer = setTimeout(finish, arguments[0]);
+if (window.MutationObserver && document.documentElement) {
+    observer = new MutationObserver(finish);
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+events.forEach(function (name) {
+    window.addEventListener(name, finish, true);
+    document.addEventListener(name, finish, true);
+});
+"""
+
+# Rola até o elemento (arguments[0]) e resolve quando a rolagem termina: evento
+# "scrollend" ou posição estável por dois quadros seguidos; no máximo arguments[1] ms
+SCROLL_INTO_VIEW = """
+var element = arguments[0];
+var done = arguments[arguments.length - 1];
+var deadline = Date.now() + arguments[1];
+var finished = false;
+function finish() {
+    if (!finished) {
+        finished = true;
+        window.removeEventListener("scrollend", finish, true);
+        done(true);
+    }
+}
+function position() {
+    return [window.scrollX, window.scrollY, element.getBoundingClientRect().top].join(",");
+}
+window.addEventListener("scrollend", finish, true);
+element.scrollIntoView(true);
+var last = null;
+var stableFrames = 0;
+function check() {
+    if (finished) {
+        return;
+    }
+    var current = position();
+    stableFrames = current === last ? stableFrames + 1 : 0;
+    last = current;
+    if (stableFrames >= 2 || Date.now() >= deadline) {
+        finish();
+    } else {
+        requestAnimationFrame(check);
+    }
+}
+requestAnimationFrame(check);
+"""
+
+
+def get_poll_interval() -> float:
+    """Intervalo máximo entre verificações quando nenhum evento acontece"""
+    try:
+        from config.settings import config
+        return config.POLL_INTERVAL
+    except (ImportError, AttributeError):
+        return DEFAULT_POLL_INTERVAL
+
+
+class WaitEngine:
+    """Espera condições do Selenium (ex.: expected_conditions) reagindo a eventos do navegador"""
+
+    def __init__(self, driver, timeout: float = 10, poll_interval: float = None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval if poll_interval is not None else get_poll_interval()
+        self._event_driven = callable(getattr(driver, "execute_async_script", None))
+
+    def until(self, condition: Callable[[Any], Any], timeout: float = None, message: str = "") -> Any:
+        """
+        Retorna o primeiro valor verdadeiro de condition(driver).
+        Levanta TimeoutException se o timeout expirar (mesma semântica do WebDriverWait).
+        No CommandCounter a espera inteira conta como um comando (waitUntil)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with logical_command(self.driver, WAIT_COMMAND):
+            while True:
+                try:
+                    value = condition(self.driver)
+                    if value:
+                        return value
+                except IGNORED_EXCEPTIONS:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(message or f"Condição não satisfeita em {timeout}s")
+                self.wait_for_change(min(remaining, self.poll_interval))
+
+    def until_not(self, condition: Callable[[Any], Any], timeout: float = None, message: str = "") -> bool:
+        """Aguarda a condição deixar de ser verdadeira"""
+        def negated(driver):
+            try:
+                return not condition(driver)
+            except IGNORED_EXCEPTIONS:
+                return True
+        return self.until(negated, timeout, message)
+
+    def check(self, condition: Callable[[Any], Any], timeout: float = None) -> bool:
+        """Como until, mas retorna False em vez de levantar TimeoutException"""
+        try:
+            self.until(condition, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_change(self, max_seconds: float) -> None:
+        """Bloqueia até a próxima mudança no navegador ou por no máximo `max_seconds`"""
+        if max_seconds <= 0:
+            return
+        if not self._event_driven:
+            time.sleep(max_seconds)
+            return
+        try:
+            self.driver.execute_async_script(WAIT_FOR_CHANGE, int(max_seconds * 1000))
+        except WebDriverException:
+            # A navegação descarta o script em execução: a condição é verificada de novo
+            pass
+
+    def scroll_into_view(self, element, timeout: float = 2) -> None:
+        """Rola até o elemento e retorna assim que a rolagem termina"""
+        if not self._event_driven:
+            return
+        try:
+            self.driver.execute_async_script(SCROLL_INTO_VIEW, element, int(timeout * 1000))
+        except WebDriverException:
+            # Sem suporte a scripts assíncronos: rolagem instantânea
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+
+
+def wait_until(driver, condition: Callable[[Any], Any], timeout: float = 10, message: str = "") -> Any:
+    """Atalho para WaitEngine(driver).until(condition, timeout)"""
+    return WaitEngine(driver, timeout).until(condition, message=message)
+
+
+def page_loaded(driver) -> bool:
+    """Condição: document.readyState == "complete" (sempre verdadeira sem JavaScript)"""
+    if not hasattr(driver, "execute_script"):
+        return True
+    return driver.execute_script("return document.readyState") == "complete"
+
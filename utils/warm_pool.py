@@ -0,0 +1,189 @@
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+
+@dataclass
+class WarmPoolStats:
+    """Entregas e quanto da abertura dos navegadores ficou fora do caminho crítico"""
+    launches: int = 0
+    launch_seconds: float = 0.0
+    failed: int = 0
+    ready: int = 0
+    waited: int = 0
+    cold: int = 0
+    hidden_seconds: float = 0.0
+    exposed_seconds: float = 0.0
+    unused: int = 0
+    max_target: int = 0
+
+    @property
+    def handed_out(self) -> int:
+        return self.ready + self.waited + self.cold
+
+    def describe(self) -> List[str]:
+        mean_launch = self.launch_seconds / self.launches if self.launches else 0.0
+        return [
+            f"{self.handed_out} entregues: {self.ready} prontos, {self.waited} aguardando abertura "
+            f"em andamento, {self.cold} abertos na hora",
+            f"abertura escondida do caminho crítico: {self.hidden_seconds:.1f}s; "
+            f"exposta: {self.exposed_seconds:.1f}s (abertura média {mean_launch:.1f}s)",
+            f"até {self.max_target} abrindo/prontos; {self.unused} abertos sem uso; {self.failed} falhas",
+        ]
+
+
+class WarmBrowserPool:
+    """
+    Navegadores abertos em threads de fundo antes de serem pedidos (um por processo/worker).
+
+    `acquire` entrega um navegador já aberto quando há um pronto; se não houver, espera o
+    que está abrindo (sempre menos que uma abertura nova) e só abre no caminho crítico
+    quando nada está em andamento. A quantidade mantida abrindo/pronta (K) segue a lei de
+    Little: tempo médio de abertura x taxa observada de pedidos, entre 1 e `max_warm`, e
+    nunca passa do número de pedidos que ainda podem acontecer (`remaining`).
+
+    Se uma abertura em fundo falha, o pré-aquecimento é suspenso até uma abertura no
+    caminho crítico dar certo: o erro real aparece no teste, como sem o pool.
+    """
+
+    # Peso da medição mais recente nas médias móveis de abertura e de intervalo entre pedidos
+    SMOOTHING = 0.3
+
+    def __init__(self, factory: Callable[[], Any], max_warm: int = 2, remaining: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.factory = factory
+        self.max_warm = max_warm
+        self.remaining = remaining
+        self.clock = clock
+        self.stats = WarmPoolStats()
+        self._ready: List[Tuple[Any, float]] = []
+        self._launching = 0
+        self._threads: List[threading.Thread] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._suspended = False
+        self._launch_estimate: Optional[float] = None
+        self._interval_estimate: Optional[float] = None
+        self._last_request: Optional[float] = None
+
+    @property
+    def target(self) -> int:
+        """K atual: navegadores que devem estar abrindo ou prontos"""
+        if self.max_warm <= 0:
+            return 0
+        target = 1
+        if self._launch_estimate is not None and self._interval_estimate:
+            target = math.ceil(self._launch_estimate / self._interval_estimate)
+        target = max(1, min(target, self.max_warm))
+        return target if self.remaining is None else min(target, self.remaining)
+
+    def start(self) -> None:
+        """Começa a abrir os primeiros navegadores (ex.: ao fim da coleta)"""
+        with self._condition:
+            self._replenish()
+
+    def acquire(self):
+        """Retorna um navegador aberto: pronto, o próximo a terminar de abrir ou um aberto agora"""
+        start = self.clock()
+        with self._condition:
+            self._observe_request(start)
+            was_ready = bool(self._ready)
+            while not self._ready and self._launching and not self._closed:
+                self._condition.wait()
+            if self._ready:
+                driver, launch_seconds = self._ready.pop(0)
+                waited = self.clock() - start
+                if was_ready:
+                    self.stats.ready += 1
+                else:
+                    self.stats.waited += 1
+                self.stats.exposed_seconds += waited
+                self.stats.hidden_seconds += max(launch_seconds - waited, 0.0)
+                self._replenish()
+                return driver
+
+        driver, launch_seconds = self._launch()
+        with self._condition:
+            self.stats.cold += 1
+            self.stats.exposed_seconds += launch_seconds
+            self._suspended = False
+            self._replenish()
+        return driver
+
+    def close(self, timeout: float = 60) -> None:
+        """Encerra os navegadores não usados, aguardando as aberturas em andamento"""
+        with self._condition:
+            self._closed = True
+            threads = list(self._threads)
+        deadline = self.clock() + timeout
+        for thread in threads:
+            thread.join(max(deadline - self.clock(), 0))
+        with self._condition:
+            ready, self._ready = self._ready, []
+            self.stats.unused += len(ready)
+        for driver, _ in ready:
+            self._quit(driver)
+
+    def _observe_request(self, now: float) -> None:
+        if self.remaining is not None:
+            self.remaining = max(self.remaining - 1, 0)
+        if self._last_request is not None:
+            self._interval_estimate = self._smooth(self._interval_estimate, now - self._last_request)
+        self._last_request = now
+
+    def _replenish(self) -> None:
+        """Inicia aberturas em fundo até K (chamado com o lock)"""
+        if self._closed or self._suspended:
+            return
+        target = self.target
+        self.stats.max_target = max(self.stats.max_target, target)
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._ready) + self._launching < target:
+            self._launching += 1
+            thread = threading.Thread(target=self._launch_in_background, name="warm-browser", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _launch(self) -> Tuple[Any, float]:
+        start = self.clock()
+        driver = self.factory()
+        seconds = self.clock() - start
+        with self._condition:
+            self.stats.launches += 1
+            self.stats.launch_seconds += seconds
+            self._launch_estimate = self._smooth(self._launch_estimate, seconds)
+        return driver, seconds
+
+    def _launch_in_background(self) -> None:
+        try:
+            driver, seconds = self._launch()
+        except Exception as e:
+            print(f"Erro ao abrir navegador em segundo plano: {e}")
+            with self._condition:
+                self._launching -= 1
+                self._suspended = True
+                self.stats.failed += 1
+                self._condition.notify_all()
+            return
+        with self._condition:
+            self._launching -= 1
+            closed = self._closed
+            if closed:
+                self.stats.unused += 1
+            else:
+                self._ready.append((driver, seconds))
+            self._condition.notify_all()
+        if closed:
+            self._quit(driver)
+
+    def _smooth(self, current: Optional[float], sample: float) -> float:
+        return sample if current is None else current + self.SMOOTHING * (sample - current)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Erro ao encerrar navegador pré-aquecido: {e}")
@@ -0,0 +1,94 @@
+"""
+Servidor WSGI do modo production do app.py (APP_MODE=production).
+
+Um pool fixo de threads atende as conexões de cada processo. Com mais de um worker
+o socket é aberto uma vez e compartilhado por processos filhos (pre-fork), que
+aceitam conexões em paralelo.
+"""
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Handler sem o log de cada requisição (o log por requisição limita a vazão)"""
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Servidor WSGI do Werkzeug com pool fixo de threads e fila de conexões configurável"""
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, app, threads: int = 8, backlog: int = 1024):
+        # Precisa ser definido antes do listen() feito pelo construtor da base
+        self.request_queue_size = backlog
+        self.threads = threads
+        self._pool = None
+        super().__init__(host, port, app, handler=QuietRequestHandler)
+
+    def process_request(self, request, client_address):
+        if self._pool is None:
+            # Criado no processo que atende (depois do fork dos workers)
+            self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="wsgi")
+        self._pool.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+
+def precompile_templates(app) -> int:
+    """
+    Compila todos os templates Jinja na inicialização (e desativa a verificação de
+    alteração dos arquivos), tirando a compilação da primeira requisição.
+    Retorna o número de templates compilados
+    """
+    app.jinja_env.auto_reload = False
+    names = app.jinja_env.list_templates()
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
+
+
+def serve_forever(server: PooledWSGIServer, workers: int = 1) -> None:
+    """Atende requisições no processo atual e em `workers - 1` processos filhos"""
+    children = []
+    if workers > 1 and hasattr(os, "fork"):
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+        # Garante o encerramento dos filhos quando o processo principal recebe SIGTERM
+        signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        server.serve_forever()
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        server.server_close()
+
+
+def _exit_on_sigterm(signum, frame):
+    raise SystemExit(0)